@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import multiprocessing
 from pathlib import Path
 
 from app.build_info import load_build_info
@@ -72,4 +73,6 @@ def _configure_startup_logging() -> Path:
 
 
 if __name__ == "__main__":
+    # Batch import parses files in worker processes; frozen builds need this.
+    multiprocessing.freeze_support()
     raise SystemExit(main())
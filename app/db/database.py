@@ -2,34 +2,219 @@
 
 from __future__ import annotations
 
+import atexit
 import sqlite3
 from pathlib import Path
-from typing import Iterable
+from typing import Any, Iterable
 
 from app.runtime_paths import get_runtime_paths
 
 from .schema import initialize_schema
 
+JOURNAL_MODES = {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}
+SYNCHRONOUS_MODES = {"OFF", "NORMAL", "FULL", "EXTRA"}
+TEMP_STORE_MODES = {"DEFAULT", "FILE", "MEMORY"}
+
+DEFAULT_PRAGMA_PROFILE: dict[str, Any] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "mmap_size": 256 * 1024 * 1024,
+    "cache_size": -64 * 1024,
+    "temp_store": "MEMORY",
+    "busy_timeout": 5000,
+}
+
 
 def get_default_database_path() -> Path:
     """Return the default database path."""
     return get_runtime_paths().db_path
 
 
-def _configure_connection(connection: sqlite3.Connection) -> None:
+def _resolve_db_path(db_path: str | Path | None) -> Path:
+    if db_path is None:
+        db_path = get_default_database_path()
+    return Path(db_path)
+
+
+def _choice(value: object, allowed: set[str], default: str) -> str:
+    normalized = str(value or "").strip().upper()
+    return normalized if normalized in allowed else default
+
+
+def _integer(value: object, default: int) -> int:
+    try:
+        return int(value)  # type: ignore[call-overload]
+    except (TypeError, ValueError):
+        return default
+
+
+def normalize_pragma_profile(overrides: dict[str, object] | None = None) -> dict[str, Any]:
+    """Merge user overrides into the default PRAGMA profile, dropping invalid values."""
+    raw = {**DEFAULT_PRAGMA_PROFILE, **(overrides or {})}
+    return {
+        "journal_mode": _choice(raw.get("journal_mode"), JOURNAL_MODES, DEFAULT_PRAGMA_PROFILE["journal_mode"]),
+        "synchronous": _choice(raw.get("synchronous"), SYNCHRONOUS_MODES, DEFAULT_PRAGMA_PROFILE["synchronous"]),
+        "mmap_size": max(0, _integer(raw.get("mmap_size"), DEFAULT_PRAGMA_PROFILE["mmap_size"])),
+        "cache_size": _integer(raw.get("cache_size"), DEFAULT_PRAGMA_PROFILE["cache_size"]),
+        "temp_store": _choice(raw.get("temp_store"), TEMP_STORE_MODES, DEFAULT_PRAGMA_PROFILE["temp_store"]),
+        "busy_timeout": max(0, _integer(raw.get("busy_timeout"), DEFAULT_PRAGMA_PROFILE["busy_timeout"])),
+    }
+
+
+def load_pragma_profile(db_path: Path) -> dict[str, Any]:
+    """Return the PRAGMA profile configured in the settings file next to ``db_path``."""
+    from app.settings import get_database_settings
+
+    return normalize_pragma_profile(get_database_settings(db_path.parent / "settings.json"))
+
+
+def _configure_connection(
+    connection: sqlite3.Connection,
+    pragma_profile: dict[str, Any] | None = None,
+    *,
+    read_only: bool = False,
+) -> None:
     connection.row_factory = sqlite3.Row
     connection.execute("PRAGMA foreign_keys = ON")
+    if pragma_profile is None:
+        return
+    connection.execute(f"PRAGMA busy_timeout = {int(pragma_profile['busy_timeout'])}")
+    if not read_only:
+        connection.execute(f"PRAGMA journal_mode = {pragma_profile['journal_mode']}")
+        connection.execute(f"PRAGMA synchronous = {pragma_profile['synchronous']}")
+    connection.execute(f"PRAGMA mmap_size = {int(pragma_profile['mmap_size'])}")
+    connection.execute(f"PRAGMA cache_size = {int(pragma_profile['cache_size'])}")
+    connection.execute(f"PRAGMA temp_store = {pragma_profile['temp_store']}")
+
+
+def _is_open(connection: sqlite3.Connection) -> bool:
+    try:
+        connection.total_changes
+    except sqlite3.ProgrammingError:
+        return False
+    return True
+
+
+class ConnectionManager:
+    """Process-wide registry of shared SQLite connections, one set per profile database.
+
+    Each database gets one shared writer connection and, on demand, one
+    read-only reader. Both are configured once with the PRAGMA profile from
+    the profile settings, so callers skip repeated connect/schema/PRAGMA setup.
+    """
+
+    def __init__(self) -> None:
+        self._writers: dict[Path, sqlite3.Connection] = {}
+        self._readers: dict[Path, sqlite3.Connection] = {}
+        self._profiles: dict[Path, dict[str, Any]] = {}
 
+    def _key(self, db_path: str | Path | None) -> Path:
+        return _resolve_db_path(db_path).resolve()
 
-def get_connection(db_path: str | Path | None = None) -> sqlite3.Connection:
+    def pragma_profile(self, db_path: str | Path | None = None) -> dict[str, Any]:
+        key = self._key(db_path)
+        profile = self._profiles.get(key)
+        if profile is None:
+            profile = load_pragma_profile(key)
+            self._profiles[key] = profile
+        return profile
+
+    def writer(self, db_path: str | Path | None = None) -> sqlite3.Connection:
+        """Return the shared read-write connection for the database."""
+        key = self._key(db_path)
+        connection = self._writers.get(key)
+        if connection is not None and _is_open(connection):
+            return connection
+        connection = get_connection(key, pragma_profile=self.pragma_profile(key))
+        self._writers[key] = connection
+        return connection
+
+    def reader(self, db_path: str | Path | None = None) -> sqlite3.Connection:
+        """Return the shared read-only connection for the database."""
+        key = self._key(db_path)
+        connection = self._readers.get(key)
+        if connection is not None and _is_open(connection):
+            return connection
+        self.writer(key)
+        connection = sqlite3.connect(f"{key.as_uri()}?mode=ro", uri=True)
+        _configure_connection(connection, self.pragma_profile(key), read_only=True)
+        self._readers[key] = connection
+        return connection
+
+    def release(self, db_path: str | Path | None = None) -> None:
+        """Close shared connections for one database, e.g. before its file is replaced."""
+        key = self._key(db_path)
+        for registry in (self._readers, self._writers):
+            connection = registry.pop(key, None)
+            if connection is not None and _is_open(connection):
+                connection.close()
+        self._profiles.pop(key, None)
+
+    def close_all(self) -> None:
+        for key in {*self._writers, *self._readers}:
+            self.release(key)
+        self._profiles.clear()
+
+
+_CONNECTION_MANAGER: ConnectionManager | None = None
+
+
+def get_connection_manager() -> ConnectionManager:
+    """Return the process-wide connection manager."""
+    global _CONNECTION_MANAGER
+    if _CONNECTION_MANAGER is None:
+        _CONNECTION_MANAGER = ConnectionManager()
+        atexit.register(_CONNECTION_MANAGER.close_all)
+    return _CONNECTION_MANAGER
+
+
+def get_shared_connection(db_path: str | Path | None = None) -> sqlite3.Connection:
+    """Return the shared writer connection for a profile database.
+
+    The connection belongs to the registry; callers must not close it.
+    """
+    return get_connection_manager().writer(db_path)
+
+
+def get_read_connection(db_path: str | Path | None = None) -> sqlite3.Connection:
+    """Return the shared read-only connection for a profile database."""
+    return get_connection_manager().reader(db_path)
+
+
+def release_database(db_path: str | Path | None = None, *, discard_wal: bool = False) -> None:
+    """Close shared connections and fold the WAL back into the database file.
+
+    Transactions committed by a crashed session may exist only in the WAL,
+    so it is checkpointed before anyone copies the file. ``discard_wal``
+    additionally removes the side files; use it only when the database
+    file is about to be replaced, or an old WAL would be replayed onto it.
+    """
+    get_connection_manager().release(db_path)
+    path = _resolve_db_path(db_path)
+    if path.exists():
+        connection = sqlite3.connect(str(path))
+        try:
+            connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        finally:
+            connection.close()
+    if discard_wal:
+        for suffix in ("-wal", "-shm"):
+            Path(f"{path}{suffix}").unlink(missing_ok=True)
+
+
+def get_connection(
+    db_path: str | Path | None = None,
+    *,
+    pragma_profile: dict[str, Any] | None = None,
+) -> sqlite3.Connection:
     """Create a SQLite connection and ensure schema exists."""
-    if db_path is None:
-        db_path = get_default_database_path()
-    db_path = Path(db_path)
+    db_path = _resolve_db_path(db_path)
     db_path.parent.mkdir(parents=True, exist_ok=True)
 
     connection = sqlite3.connect(str(db_path))
-    _configure_connection(connection)
+    if pragma_profile is None:
+        pragma_profile = get_connection_manager().pragma_profile(db_path)
+    _configure_connection(connection, pragma_profile)
     initialize_schema(connection)
     return connection
 
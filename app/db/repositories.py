@@ -4,8 +4,18 @@ from __future__ import annotations
 
 import sqlite3
 from collections.abc import Callable
-from typing import Any, Iterable, List
-
+from typing import Any, Iterable, List, Mapping, Sequence
+
+from app.db.snapshot_frames import (
+    FRAME_KIND_DELTA,
+    FRAME_KIND_KEYFRAME,
+    pack_ranking,
+    plan_frame,
+    rebuild_player_rating_latest,
+    unpack_ranking,
+)
+from app.db.unit_of_work import commit, repo_session
+from app.domain.identity import normalize_fio_key, player_fio_key, player_identity_columns
 from app.domain.rating import normalize_adult_gender_scope
 from app.domain.tournament_lifecycle import (
     TournamentStatus,
@@ -70,6 +80,61 @@ def _normalize_tournament_row(row: sqlite3.Row) -> RowDict:
     return data
 
 
+PLAYER_WRITE_COLUMNS = (
+    "last_name",
+    "first_name",
+    "middle_name",
+    "birth_date",
+    "gender",
+    "coach",
+    "club",
+    "notes",
+)
+
+RESULT_WRITE_COLUMNS = (
+    "tournament_id",
+    "player_id",
+    "place",
+    "score_set",
+    "score_sector20",
+    "score_big_round",
+    "rank_set",
+    "rank_sector20",
+    "rank_big_round",
+    "points_classification",
+    "points_place",
+    "points_total",
+    "calc_version",
+)
+
+
+def _values(data: dict[str, Any], columns: tuple[str, ...]) -> tuple[Any, ...]:
+    return tuple(data.get(column) for column in columns)
+
+
+def _require_id(data: dict[str, Any]) -> int:
+    value = data.get("id")
+    if value is None:
+        raise ValueError("Bulk update entry has no id")
+    return int(value)
+
+
+def _insert_many(
+    connection: sqlite3.Connection,
+    sql: str,
+    params: list[tuple[Any, ...]],
+) -> list[int]:
+    """Run an INSERT through executemany and return the new ids in input order.
+
+    Must run inside a unit of work: the rows then get consecutive AUTOINCREMENT
+    ids ending at last_insert_rowid().
+    """
+    connection.executemany(sql, params)
+    last_id = int(connection.execute("SELECT last_insert_rowid()").fetchone()[0])
+    first_id = last_id - len(params) + 1
+    return list(range(first_id, last_id + 1))
+
+
 class PlayerRepository:
     """Repository for player data access."""
 
@@ -87,9 +152,11 @@ class PlayerRepository:
                 gender,
                 coach,
                 club,
-                notes
+                notes,
+                fio_key,
+                birth_year
             )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
             (
                 data.get("last_name"),
@@ -100,11 +167,89 @@ class PlayerRepository:
                 data.get("coach"),
                 data.get("club"),
                 data.get("notes"),
+                *player_identity_columns(data),
             ),
         )
-        self._connection.commit()
+        commit(self._connection)
         return _lastrowid_as_int(cursor)
 
+    def create_many(self, entries: list[dict[str, Any]]) -> list[int]:
+        """Insert players in one statement batch; return their ids in input order."""
+        if not entries:
+            return []
+        with repo_session(self._connection):
+            return _insert_many(
+                self._connection,
+                """
+                INSERT INTO players (
+                    last_name,
+                    first_name,
+                    middle_name,
+                    birth_date,
+                    gender,
+                    coach,
+                    club,
+                    notes,
+                    fio_key,
+                    birth_year
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (*_values(entry, PLAYER_WRITE_COLUMNS), *player_identity_columns(entry))
+                    for entry in entries
+                ],
+            )
+
+    def update_many(self, entries: list[dict[str, Any]]) -> int:
+        """Rewrite players by ``id`` like update(); return the number of entries."""
+        if not entries:
+            return 0
+        with repo_session(self._connection):
+            self._connection.executemany(
+                """
+                UPDATE players
+                SET last_name = ?,
+                    first_name = ?,
+                    middle_name = ?,
+                    birth_date = ?,
+                    gender = ?,
+                    coach = ?,
+                    club = ?,
+                    notes = ?,
+                    fio_key = ?,
+                    birth_year = ?,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+                """,
+                [
+                    (
+                        *_values(entry, PLAYER_WRITE_COLUMNS),
+                        *player_identity_columns(entry),
+                        _require_id(entry),
+                    )
+                    for entry in entries
+                ],
+            )
+        return len(entries)
+
+    def upsert_many(self, entries: list[dict[str, Any]]) -> list[int]:
+        """Update entries that carry an ``id`` and insert the rest.
+
+        Returns player ids in input order.
+        """
+        if not entries:
+            return []
+        with repo_session(self._connection):
+            existing = [entry for entry in entries if entry.get("id") is not None]
+            new_entries = [entry for entry in entries if entry.get("id") is None]
+            self.update_many(existing)
+            new_ids = iter(self.create_many(new_entries))
+            return [
+                _require_id(entry) if entry.get("id") is not None else next(new_ids)
+                for entry in entries
+            ]
+
     def get(self, player_id: int) -> dict[str, Any] | None:
         row = self._connection.execute(
             "SELECT * FROM players WHERE id = ?", (player_id,)
@@ -123,6 +268,8 @@ class PlayerRepository:
                 coach = ?,
                 club = ?,
                 notes = ?,
+                fio_key = ?,
+                birth_year = ?,
                 updated_at = CURRENT_TIMESTAMP
             WHERE id = ?
             """,
@@ -135,14 +282,15 @@ class PlayerRepository:
                 data.get("coach"),
                 data.get("club"),
                 data.get("notes"),
+                *player_identity_columns(data),
                 player_id,
             ),
         )
-        self._connection.commit()
+        commit(self._connection)
 
     def delete(self, player_id: int) -> None:
         self._connection.execute("DELETE FROM players WHERE id = ?", (player_id,))
-        self._connection.commit()
+        commit(self._connection)
 
     def list(self) -> list[dict[str, Any]]:
         rows = self._connection.execute(
@@ -175,8 +323,14 @@ class PlayerRepository:
         birth_date: str | None,
         birth_year: str | None,
     ) -> dict[str, Any] | None:
-        params: list[Any] = [last_name, first_name, middle_name or ""]
+        params: list[Any] = [
+            player_fio_key(last_name, first_name, middle_name),
+            last_name,
+            first_name,
+            middle_name or "",
+        ]
         clauses = [
+            "fio_key = ?",
             "last_name = ?",
             "first_name = ?",
             "COALESCE(middle_name, '') = ?",
@@ -185,8 +339,8 @@ class PlayerRepository:
             clauses.append("birth_date = ?")
             params.append(birth_date)
         elif birth_year:
-            clauses.append("(birth_date LIKE ? OR birth_date = ?)")
-            params.extend([f"{birth_year}%", birth_year])
+            clauses.append("birth_year = ?")
+            params.append(birth_year)
         where_sql = " AND ".join(clauses)
         row = self._connection.execute(
             f"SELECT * FROM players WHERE {where_sql} LIMIT 1",
@@ -194,6 +348,34 @@ class PlayerRepository:
         ).fetchone()
         return _row_to_dict(row)
 
+    def list_by_fio_key(self, fio_key: str) -> List[RowDict]:
+        rows = self._connection.execute(
+            """
+            SELECT * FROM players
+            WHERE fio_key = ?
+            ORDER BY last_name, first_name, id
+            """,
+            (fio_key,),
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def list_identity_duplicates(self) -> List[RowDict]:
+        """Return players sharing a non-empty fio_key, ordered by fio_key."""
+        rows = self._connection.execute(
+            """
+            SELECT * FROM players
+            WHERE fio_key IN (
+                SELECT fio_key
+                FROM players
+                WHERE fio_key IS NOT NULL AND fio_key != ''
+                GROUP BY fio_key
+                HAVING COUNT(*) > 1
+            )
+            ORDER BY fio_key, last_name, first_name, id
+            """
+        ).fetchall()
+        return [dict(row) for row in rows]
+
 
 class TournamentRepository:
     """Repository for tournament data access."""
@@ -248,7 +430,7 @@ class TournamentRepository:
                 payload.get("error_state"),
             ),
         )
-        self._connection.commit()
+        commit(self._connection)
         return _lastrowid_as_int(cursor)
 
     def get(self, tournament_id: int) -> dict[str, Any] | None:
@@ -303,13 +485,16 @@ class TournamentRepository:
                 tournament_id,
             ),
         )
-        self._connection.commit()
+        commit(self._connection)
 
     def delete(self, tournament_id: int) -> None:
-        self._connection.execute(
-            "DELETE FROM tournaments WHERE id = ?", (tournament_id,)
-        )
-        self._connection.commit()
+        snapshot_repo = RatingSnapshotRepository(self._connection)
+        with repo_session(self._connection):
+            scopes = snapshot_repo.detach_tournament(tournament_id)
+            self._connection.execute(
+                "DELETE FROM tournaments WHERE id = ?", (tournament_id,)
+            )
+            snapshot_repo.rebuild_player_latest(scopes)
 
     def list(self) -> list[dict[str, Any]]:
         rows = self._connection.execute(
@@ -379,7 +564,7 @@ class TournamentRepository:
             """,
             (status, published_by, confirmed_by, tournament_id),
         )
-        self._connection.commit()
+        commit(self._connection)
 
     def publish(self, tournament_id: int, *, actor: str | None = None) -> None:
         self.set_status(tournament_id, TOURNAMENT_STATUS_PUBLISHED, actor=actor)
@@ -393,6 +578,18 @@ class TournamentRepository:
     def cancel(self, tournament_id: int, *, actor: str | None = None) -> None:
         self.set_status(tournament_id, TOURNAMENT_STATUS_CANCELED, actor=actor)
 
+    def list_published_scope_sources(self) -> List[RowDict]:
+        """Return the distinct rating scope columns of published tournaments."""
+        rows = self._connection.execute(
+            """
+            SELECT DISTINCT category_code, league_code, COALESCE(is_adult_mode, 0) AS is_adult_mode
+            FROM tournaments
+            WHERE status = ?
+            """,
+            (TOURNAMENT_STATUS_PUBLISHED,),
+        ).fetchall()
+        return [dict(row) for row in rows]
+
     def list_category_codes(self) -> List[str]:
         rows = self._connection.execute(
             """
@@ -460,9 +657,124 @@ class ResultRepository:
                 data.get("calc_version"),
             ),
         )
-        self._connection.commit()
+        commit(self._connection)
         return _lastrowid_as_int(cursor)
 
+    def create_many(self, entries: list[dict[str, Any]]) -> list[int]:
+        """Insert results in one statement batch; return their ids in input order."""
+        if not entries:
+            return []
+        with repo_session(self._connection):
+            return _insert_many(
+                self._connection,
+                """
+                INSERT INTO results (
+                    tournament_id,
+                    player_id,
+                    place,
+                    score_set,
+                    score_sector20,
+                    score_big_round,
+                    rank_set,
+                    rank_sector20,
+                    rank_big_round,
+                    points_classification,
+                    points_place,
+                    points_total,
+                    calc_version
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [_values(entry, RESULT_WRITE_COLUMNS) for entry in entries],
+            )
+
+    def update_many(self, entries: list[dict[str, Any]]) -> int:
+        """Rewrite results by ``id`` like update(); return the number of entries."""
+        if not entries:
+            return 0
+        with repo_session(self._connection):
+            self._connection.executemany(
+                """
+                UPDATE results
+                SET tournament_id = ?,
+                    player_id = ?,
+                    place = ?,
+                    score_set = ?,
+                    score_sector20 = ?,
+                    score_big_round = ?,
+                    rank_set = ?,
+                    rank_sector20 = ?,
+                    rank_big_round = ?,
+                    points_classification = ?,
+                    points_place = ?,
+                    points_total = ?,
+                    calc_version = ?
+                WHERE id = ?
+                """,
+                [
+                    (*_values(entry, RESULT_WRITE_COLUMNS), _require_id(entry))
+                    for entry in entries
+                ],
+            )
+        return len(entries)
+
+    def upsert_many(self, entries: list[dict[str, Any]]) -> list[int]:
+        """Insert or overwrite results keyed by (tournament_id, player_id).
+
+        Returns result ids in input order.
+        """
+        if not entries:
+            return []
+        with repo_session(self._connection):
+            self._connection.executemany(
+                """
+                INSERT INTO results (
+                    tournament_id,
+                    player_id,
+                    place,
+                    score_set,
+                    score_sector20,
+                    score_big_round,
+                    rank_set,
+                    rank_sector20,
+                    rank_big_round,
+                    points_classification,
+                    points_place,
+                    points_total,
+                    calc_version
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(tournament_id, player_id) DO UPDATE SET
+                    place = excluded.place,
+                    score_set = excluded.score_set,
+                    score_sector20 = excluded.score_sector20,
+                    score_big_round = excluded.score_big_round,
+                    rank_set = excluded.rank_set,
+                    rank_sector20 = excluded.rank_sector20,
+                    rank_big_round = excluded.rank_big_round,
+                    points_classification = excluded.points_classification,
+                    points_place = excluded.points_place,
+                    points_total = excluded.points_total,
+                    calc_version = excluded.calc_version
+                """,
+                [_values(entry, RESULT_WRITE_COLUMNS) for entry in entries],
+            )
+            tournament_ids = sorted({int(entry["tournament_id"]) for entry in entries})
+            placeholders = ", ".join("?" for _ in tournament_ids)
+            rows = self._connection.execute(
+                f"""
+                SELECT id, tournament_id, player_id
+                FROM results
+                WHERE tournament_id IN ({placeholders})
+                """,
+                tournament_ids,
+            ).fetchall()
+        ids_by_key = {(int(row[1]), int(row[2])): int(row[0]) for row in rows}
+        return [
+            ids_by_key[(int(entry["tournament_id"]), int(entry["player_id"]))]
+            for entry in entries
+        ]
+
     def get(self, result_id: int) -> dict[str, Any] | None:
         row = self._connection.execute(
             "SELECT * FROM results WHERE id = ?", (result_id,)
@@ -505,11 +817,131 @@ class ResultRepository:
                 result_id,
             ),
         )
-        self._connection.commit()
+        commit(self._connection)
+
+    def recalculate_points(
+        self,
+        tournament_versions: Mapping[int, str],
+        point_tables: Mapping[str, Sequence[int]],
+        *,
+        manual_calc_version: str,
+    ) -> dict[int, int]:
+        """Re-score the given tournaments set-wise and return changed rows per tournament.
+
+        ``tournament_versions`` maps tournament id to the ``calc_version`` to
+        apply; ``point_tables`` maps each version to points indexed by place.
+        Tournaments mapped to ``manual_calc_version`` keep their entered
+        ``points_total``. Results are joined against the lookup in temp
+        tables and only rows whose stored values differ are updated.
+        """
+        with repo_session(self._connection):
+            self._connection.execute(
+                """
+                CREATE TEMP TABLE IF NOT EXISTS recalc_tournaments (
+                    tournament_id INTEGER PRIMARY KEY,
+                    calc_version TEXT NOT NULL
+                )
+                """
+            )
+            self._connection.execute(
+                """
+                CREATE TEMP TABLE IF NOT EXISTS recalc_points (
+                    calc_version TEXT NOT NULL,
+                    place INTEGER NOT NULL,
+                    points INTEGER NOT NULL,
+                    PRIMARY KEY (calc_version, place)
+                ) WITHOUT ROWID
+                """
+            )
+            self._connection.execute(
+                """
+                CREATE TEMP TABLE IF NOT EXISTS recalc_changes (
+                    result_id INTEGER PRIMARY KEY,
+                    tournament_id INTEGER NOT NULL,
+                    points INTEGER NOT NULL,
+                    calc_version TEXT NOT NULL
+                )
+                """
+            )
+            try:
+                self._connection.executemany(
+                    "INSERT INTO temp.recalc_tournaments (tournament_id, calc_version) VALUES (?, ?)",
+                    list(tournament_versions.items()),
+                )
+                self._connection.executemany(
+                    "INSERT INTO temp.recalc_points (calc_version, place, points) VALUES (?, ?, ?)",
+                    [
+                        (calc_version, place, points)
+                        for calc_version, table in point_tables.items()
+                        for place, points in enumerate(table)
+                        if place > 0 and points
+                    ],
+                )
+                self._connection.execute(
+                    """
+                    INSERT INTO temp.recalc_changes (result_id, tournament_id, points, calc_version)
+                    SELECT id, tournament_id, points, calc_version
+                    FROM (
+                        SELECT results.id,
+                               results.tournament_id,
+                               results.points_classification,
+                               results.points_place,
+                               results.points_total,
+                               results.calc_version AS old_calc_version,
+                               results.rank_set,
+                               results.rank_sector20,
+                               results.rank_big_round,
+                               recalc_tournaments.calc_version,
+                               CASE
+                                   WHEN recalc_tournaments.calc_version = ?
+                                       THEN COALESCE(results.points_total, 0)
+                                   ELSE COALESCE(recalc_points.points, 0)
+                               END AS points
+                        FROM results
+                        JOIN temp.recalc_tournaments
+                          ON recalc_tournaments.tournament_id = results.tournament_id
+                        LEFT JOIN temp.recalc_points
+                          ON recalc_points.calc_version = recalc_tournaments.calc_version
+                         AND recalc_points.place = results.place
+                    )
+                    WHERE points_classification IS NOT 0
+                       OR points_place IS NOT points
+                       OR points_total IS NOT points
+                       OR old_calc_version IS NOT calc_version
+                       OR rank_set IS NOT NULL
+                       OR rank_sector20 IS NOT NULL
+                       OR rank_big_round IS NOT NULL
+                    """,
+                    (manual_calc_version,),
+                )
+                self._connection.execute(
+                    """
+                    UPDATE results
+                    SET rank_set = NULL,
+                        rank_sector20 = NULL,
+                        rank_big_round = NULL,
+                        points_classification = 0,
+                        points_place = recalc_changes.points,
+                        points_total = recalc_changes.points,
+                        calc_version = recalc_changes.calc_version
+                    FROM temp.recalc_changes
+                    WHERE results.id = recalc_changes.result_id
+                    """
+                )
+                counts = {int(tournament_id): 0 for tournament_id in tournament_versions}
+                for tournament_id, changed in self._connection.execute(
+                    "SELECT tournament_id, COUNT(*) FROM temp.recalc_changes GROUP BY tournament_id"
+                ).fetchall():
+                    counts[int(tournament_id)] = int(changed)
+            finally:
+                self._connection.execute("DELETE FROM temp.recalc_tournaments")
+                self._connection.execute("DELETE FROM temp.recalc_points")
+                self._connection.execute("DELETE FROM temp.recalc_changes")
+        return counts
 
     def delete(self, result_id: int) -> None:
         self._connection.execute("DELETE FROM results WHERE id = ?", (result_id,))
-        self._connection.commit()
+        commit(self._connection)
 
     def list(self) -> list[dict[str, Any]]:
         rows = self._connection.execute(
@@ -577,7 +1009,7 @@ class ResultRepository:
         ).fetchall()
         return [dict(row) for row in rows]
 
-    def list_results_for_rating(
+    def _rating_scope_filters(
         self,
         *,
         category_code: str | None = None,
@@ -586,16 +1018,56 @@ class ResultRepository:
         adult_gender_scope: str | None = None,
         search_term: str | None = None,
         statuses: Iterable[str] | None = None,
-    ) -> List[RowDict]:
-        clauses: list[str] = []
-        params: list[Any] = []
+        player_ids: Iterable[int] | None = None,
+    ) -> tuple[str, list[Any], str | None] | None:
+        """Return ``(where_sql, params, gender_scope)``, or None if nothing can match."""
         status_values = list(statuses) if statuses is not None else [TOURNAMENT_STATUS_PUBLISHED]
         if not status_values:
-            return []
+            return None
+        normalized_scope = str(adult_gender_scope or "").strip().lower() or None
+        if normalized_scope not in {None, "overall", "men", "women"}:
+            return None
 
         status_placeholders = ", ".join("?" for _ in status_values)
-        clauses.append(f"tournaments.status IN ({status_placeholders})")
-        params.extend(status_values)
+        clauses = [f"tournaments.status IN ({status_placeholders})"]
+        params: list[Any] = list(status_values)
+        scope_clauses, scope_params = self._rating_scope_clauses(
+            category_code=category_code,
+            league_code=league_code,
+            is_adult_mode=is_adult_mode,
+            adult_gender_scope=adult_gender_scope,
+        )
+        clauses.extend(scope_clauses)
+        params.extend(scope_params)
+
+        search_key = normalize_fio_key(search_term)
+        if search_key:
+            # Same rule as fio_matches_search: a substring of the normalized FIO.
+            escaped_key = search_key.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            clauses.append("players.fio_key LIKE ? ESCAPE '\\'")
+            params.append(f"%{escaped_key}%")
+
+        if player_ids is not None:
+            id_values = sorted({int(player_id) for player_id in player_ids})
+            if not id_values:
+                return None
+            clauses.append(f"results.player_id IN ({', '.join('?' for _ in id_values)})")
+            params.extend(id_values)
+
+        where_sql = "WHERE " + " AND ".join(clauses)
+        gender_scope = normalized_scope if normalized_scope in {"men", "women"} else None
+        return where_sql, params, gender_scope
+
+    @staticmethod
+    def _rating_scope_clauses(
+        *,
+        category_code: str | None = None,
+        league_code: str | None = None,
+        is_adult_mode: bool | None = None,
+        adult_gender_scope: str | None = None,
+    ) -> tuple[list[str], list[Any]]:
+        clauses: list[str] = []
+        params: list[Any] = []
         if category_code:
             clauses.append("tournaments.category_code = ?")
             params.append(category_code)
@@ -609,22 +1081,47 @@ class ResultRepository:
         if is_adult_mode is not None:
             clauses.append("COALESCE(tournaments.is_adult_mode, 0) = ?")
             params.append(1 if is_adult_mode else 0)
+        return clauses, params
+
+    @staticmethod
+    def _filter_gender_scope(rows: List[RowDict], gender_scope: str | None) -> List[RowDict]:
+        if gender_scope is None:
+            return rows
+        return [
+            row
+            for row in rows
+            if normalize_adult_gender_scope(row.get("gender")) == gender_scope
+        ]
 
-        if search_term:
-            like_term = f"%{search_term}%"
-            clauses.append(
-                "(players.last_name LIKE ? OR players.first_name LIKE ? OR players.middle_name LIKE ?)"
-            )
-            params.extend([like_term, like_term, like_term])
-
-        where_sql = ""
-        if clauses:
-            where_sql = "WHERE " + " AND ".join(clauses)
+    def list_results_for_rating(
+        self,
+        *,
+        category_code: str | None = None,
+        league_code: str | None = None,
+        is_adult_mode: bool | None = None,
+        adult_gender_scope: str | None = None,
+        search_term: str | None = None,
+        statuses: Iterable[str] | None = None,
+        player_ids: Iterable[int] | None = None,
+    ) -> List[RowDict]:
+        scope_filters = self._rating_scope_filters(
+            category_code=category_code,
+            league_code=league_code,
+            is_adult_mode=is_adult_mode,
+            adult_gender_scope=adult_gender_scope,
+            search_term=search_term,
+            statuses=statuses,
+            player_ids=player_ids,
+        )
+        if scope_filters is None:
+            return []
+        where_sql, params, gender_scope = scope_filters
 
         rows = self._connection.execute(
             f"""
             SELECT results.player_id,
                    results.tournament_id,
+                   results.place,
                    results.points_total,
                    tournaments.date AS tournament_date,
                    tournaments.status AS tournament_status,
@@ -640,98 +1137,420 @@ class ResultRepository:
             """,
             params,
         ).fetchall()
-        result_rows = [dict(row) for row in rows]
-        normalized_scope = str(adult_gender_scope or "").strip().lower() or None
-        if normalized_scope not in {None, "overall", "men", "women"}:
+        return self._filter_gender_scope([dict(row) for row in rows], gender_scope)
+
+    def list_player_ids_for_tournaments(self, tournament_ids: Iterable[int]) -> set[int]:
+        id_values = sorted({int(tournament_id) for tournament_id in tournament_ids})
+        if not id_values:
+            return set()
+        rows = self._connection.execute(
+            f"""
+            SELECT DISTINCT player_id FROM results
+            WHERE tournament_id IN ({', '.join('?' for _ in id_values)})
+            """,
+            id_values,
+        ).fetchall()
+        return {int(row[0]) for row in rows}
+
+    def list_results_for_rating_scopes(
+        self,
+        scopes: Iterable[Mapping[str, Any]],
+        *,
+        statuses: Iterable[str] | None = None,
+    ) -> List[RowDict]:
+        """Return the union of rating rows for several scope filters in one scan.
+
+        Each scope is a mapping of ``list_results_for_rating`` filters. Rows
+        carry the tournament scope columns and player gender so callers can
+        partition them by scope in memory.
+        """
+        status_values = list(statuses) if statuses is not None else [TOURNAMENT_STATUS_PUBLISHED]
+        scope_sql: list[str] = []
+        params: list[Any] = list(status_values)
+        for scope in scopes:
+            clauses, scope_params = self._rating_scope_clauses(
+                category_code=scope.get("category_code"),
+                league_code=scope.get("league_code"),
+                is_adult_mode=scope.get("is_adult_mode"),
+                adult_gender_scope=scope.get("adult_gender_scope"),
+            )
+            scope_sql.append("(" + (" AND ".join(clauses) or "1") + ")")
+            params.extend(scope_params)
+        if not status_values or not scope_sql:
             return []
-        if normalized_scope in {"men", "women"}:
-            result_rows = [
-                row
-                for row in result_rows
-                if normalize_adult_gender_scope(row.get("gender")) == normalized_scope
-            ]
-        return result_rows
 
+        status_placeholders = ", ".join("?" for _ in status_values)
+        rows = self._connection.execute(
+            f"""
+            SELECT results.player_id,
+                   results.tournament_id,
+                   results.points_total,
+                   tournaments.date AS tournament_date,
+                   tournaments.status AS tournament_status,
+                   tournaments.category_code,
+                   tournaments.league_code,
+                   COALESCE(tournaments.is_adult_mode, 0) AS is_adult_mode,
+                   players.last_name,
+                   players.first_name,
+                   players.middle_name,
+                   players.gender
+            FROM results
+            JOIN tournaments ON tournaments.id = results.tournament_id
+            JOIN players ON players.id = results.player_id
+            WHERE tournaments.status IN ({status_placeholders})
+              AND ({" OR ".join(scope_sql)})
+            ORDER BY COALESCE(tournaments.date, '') DESC, tournaments.id DESC
+            """,
+            params,
+        ).fetchall()
+        return [dict(row) for row in rows]
 
-class RatingSnapshotRepository:
-    """Repository for persisted rating snapshot rows."""
+    def list_rating_totals(
+        self,
+        n: int,
+        *,
+        category_code: str | None = None,
+        league_code: str | None = None,
+        is_adult_mode: bool | None = None,
+        adult_gender_scope: str | None = None,
+        search_term: str | None = None,
+        statuses: Iterable[str] | None = None,
+    ) -> List[RowDict]:
+        """Return one row per player with the rolling top-N ``points`` and ``tournaments_count``.
+
+        The latest N results per player are picked in SQL with the same order
+        as ``app.domain.rating`` (tournament date, then tournament id, newest
+        first), so only per-player aggregates leave the database.
+        """
+        if n <= 0:
+            raise ValueError("N must be a positive integer.")
+        scope_filters = self._rating_scope_filters(
+            category_code=category_code,
+            league_code=league_code,
+            is_adult_mode=is_adult_mode,
+            adult_gender_scope=adult_gender_scope,
+            search_term=search_term,
+            statuses=statuses,
+        )
+        if scope_filters is None:
+            return []
+        where_sql, params, gender_scope = scope_filters
+
+        rows = self._connection.execute(
+            f"""
+            WITH ranked AS (
+                SELECT results.player_id,
+                       COALESCE(results.points_total, 0) AS points_total,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY results.player_id
+                           ORDER BY COALESCE(tournaments.date, '') DESC, results.tournament_id DESC
+                       ) AS basis_rank
+                FROM results
+                JOIN tournaments ON tournaments.id = results.tournament_id
+                JOIN players ON players.id = results.player_id
+                {where_sql}
+            )
+            SELECT ranked.player_id,
+                   SUM(ranked.points_total) AS points,
+                   COUNT(*) AS tournaments_count,
+                   players.last_name,
+                   players.first_name,
+                   players.middle_name,
+                   players.gender
+            FROM ranked
+            JOIN players ON players.id = ranked.player_id
+            WHERE ranked.basis_rank <= ?
+            GROUP BY ranked.player_id
+            """,
+            [*params, n],
+        ).fetchall()
+        return self._filter_gender_scope([dict(row) for row in rows], gender_scope)
+
+
+class RatingChangeLogRepository:
+    """Read access to the trigger-maintained rating change log."""
 
     def __init__(self, connection: sqlite3.Connection) -> None:
         self._connection = connection
 
-    def create_many(self, entries: list[dict[str, Any]]) -> int:
-        if not entries:
-            return 0
-        with self._connection:
+    def latest_seq(self) -> int:
+        row = self._connection.execute("SELECT MAX(seq) FROM rating_change_log").fetchone()
+        return int(row[0] or 0)
+
+    def list_since(self, seq: int) -> List[RowDict]:
+        rows = self._connection.execute(
+            """
+            SELECT seq, tournament_id, player_id
+            FROM rating_change_log
+            WHERE seq > ?
+            ORDER BY seq
+            """,
+            (seq,),
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+
+class RatingCurrentRepository:
+    """Repository for the materialized current rating tables."""
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self._connection = connection
+
+    def is_materialized(self, scope_type: str, scope_key: str) -> bool:
+        row = self._connection.execute(
+            "SELECT 1 FROM rating_current_scopes WHERE scope_type = ? AND scope_key = ?",
+            (scope_type, scope_key),
+        ).fetchone()
+        return row is not None
+
+    def list_rows(self, *, scope_type: str, scope_key: str, n: int) -> List[RowDict]:
+        rows = self._connection.execute(
+            """
+            SELECT rating_current.player_id,
+                   rating_current.position,
+                   rating_current.points,
+                   rating_current.tournaments_count,
+                   players.last_name,
+                   players.first_name,
+                   players.middle_name
+            FROM rating_current
+            JOIN players ON players.id = rating_current.player_id
+            WHERE rating_current.scope_type = ?
+              AND rating_current.scope_key = ?
+              AND rating_current.n = ?
+            ORDER BY rating_current.position
+            """,
+            (scope_type, scope_key, n),
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def replace_scope(self, scope_type: str, scope_key: str, entries: list[dict[str, Any]]) -> int:
+        """Replace every N of one scope and mark the scope as materialized."""
+        with repo_session(self._connection):
+            self._connection.execute(
+                "DELETE FROM rating_current WHERE scope_type = ? AND scope_key = ?",
+                (scope_type, scope_key),
+            )
             self._connection.executemany(
                 """
-                INSERT INTO rating_snapshots (
+                INSERT INTO rating_current (
                     scope_type,
                     scope_key,
+                    n,
                     player_id,
                     position,
                     points,
-                    tournaments_count,
-                    rolling_basis_json,
-                    source_tournament_id,
-                    reason,
-                    operation_group_id,
-                    created_at
+                    tournaments_count
                 )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
                 """,
                 [
                     (
-                        entry.get("scope_type"),
-                        entry.get("scope_key"),
-                        entry.get("player_id"),
-                        entry.get("position"),
-                        entry.get("points"),
-                        entry.get("tournaments_count"),
-                        entry.get("rolling_basis_json"),
-                        entry.get("source_tournament_id"),
-                        entry.get("reason"),
-                        entry.get("operation_group_id"),
-                        entry.get("created_at"),
+                        scope_type,
+                        scope_key,
+                        entry["n"],
+                        entry["player_id"],
+                        entry["position"],
+                        entry["points"],
+                        entry["tournaments_count"],
                     )
                     for entry in entries
                 ],
             )
+            self._connection.execute(
+                """
+                INSERT INTO rating_current_scopes (scope_type, scope_key, refreshed_at)
+                VALUES (?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(scope_type, scope_key) DO UPDATE SET refreshed_at = excluded.refreshed_at
+                """,
+                (scope_type, scope_key),
+            )
         return len(entries)
 
+    def clear(self) -> None:
+        with repo_session(self._connection):
+            self._connection.execute("DELETE FROM rating_current")
+            self._connection.execute("DELETE FROM rating_current_scopes")
+
+
+class PointSchemeRepository:
+    """Repository for named, versioned place→points schemes."""
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self._connection = connection
+
+    def create(self, data: dict[str, Any]) -> int:
+        """Store the next version of ``data["name"]``; versions start at 1."""
+        with repo_session(self._connection):
+            cursor = self._connection.execute(
+                """
+                INSERT INTO point_schemes (name, version, season, category_code, ranges_json)
+                SELECT ?, COALESCE(MAX(version), 0) + 1, ?, ?, ?
+                FROM point_schemes
+                WHERE name = ?
+                """,
+                (
+                    data["name"],
+                    data.get("season"),
+                    data.get("category_code"),
+                    data["ranges_json"],
+                    data["name"],
+                ),
+            )
+        return int(cursor.lastrowid)
+
+    def get(self, scheme_id: int) -> RowDict | None:
+        row = self._connection.execute(
+            "SELECT * FROM point_schemes WHERE id = ?",
+            (scheme_id,),
+        ).fetchone()
+        return _row_to_dict(row)
+
+    def find(self, name: str, version: int | None = None) -> RowDict | None:
+        """Return one version of a scheme, the newest when ``version`` is None."""
+        row = self._connection.execute(
+            """
+            SELECT *
+            FROM point_schemes
+            WHERE name = ? AND (? IS NULL OR version = ?)
+            ORDER BY version DESC
+            LIMIT 1
+            """,
+            (name, version, version),
+        ).fetchone()
+        return _row_to_dict(row)
+
+    def find_for_scope(self, *, season: str | None, category_code: str | None) -> RowDict | None:
+        """Return the newest scheme matching the scope, preferring the most specific one."""
+        row = self._connection.execute(
+            """
+            SELECT *
+            FROM point_schemes
+            WHERE (season IS NULL OR season = ?)
+              AND (category_code IS NULL OR category_code = ?)
+            ORDER BY (season IS NOT NULL) + (category_code IS NOT NULL) DESC,
+                     season IS NOT NULL DESC,
+                     id DESC
+            LIMIT 1
+            """,
+            (season, category_code),
+        ).fetchone()
+        return _row_to_dict(row)
+
+    def list(self) -> List[RowDict]:
+        rows = self._connection.execute(
+            "SELECT * FROM point_schemes ORDER BY name, version"
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+
+class RatingSnapshotRepository:
+    """Repository for persisted rating snapshot sessions.
+
+    Sessions are stored as keyframes and deltas (see ``app.db.snapshot_frames``);
+    the read methods always return fully reconstructed rows.
+    """
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self._connection = connection
+
+    def create_session(self, header: Mapping[str, Any], entries: list[dict[str, Any]]) -> int | None:
+        """Store one scope session and return its id; ``entries`` must be in position order."""
+        if not entries:
+            return None
+        with repo_session(self._connection):
+            latest = self._connection.execute(
+                """
+                SELECT COALESCE(keyframe_session_id, id) AS keyframe_id
+                FROM rating_snapshot_sessions
+                WHERE scope_type = ? AND scope_key = ?
+                ORDER BY created_at DESC
+                LIMIT 1
+                """,
+                (header["scope_type"], header["scope_key"]),
+            ).fetchone()
+            keyframe_rows: dict[int, RowDict] | None = None
+            keyframe_id: int | None = None
+            since_keyframe = 0
+            if latest is not None:
+                keyframe_id = int(latest["keyframe_id"])
+                keyframe_rows = self._stored_rows(keyframe_id)
+                since_keyframe = self._count_deltas(keyframe_id)
+            session_id, _kind = self._write_session(header, entries, keyframe_rows, since_keyframe, keyframe_id)
+            self._connection.executemany(
+                """
+                INSERT INTO player_rating_latest (
+                    player_id,
+                    scope_type,
+                    scope_key,
+                    session_id,
+                    position,
+                    points,
+                    tournaments_count
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(player_id, scope_type, scope_key) DO UPDATE SET
+                    session_id = excluded.session_id,
+                    position = excluded.position,
+                    points = excluded.points,
+                    tournaments_count = excluded.tournaments_count
+                """,
+                [
+                    (
+                        entry["player_id"],
+                        header["scope_type"],
+                        header["scope_key"],
+                        session_id,
+                        entry["position"],
+                        entry["points"],
+                        entry["tournaments_count"],
+                    )
+                    for entry in entries
+                ],
+            )
+        return session_id
+
     def list_sessions(self, *, scope_type: str, scope_key: str) -> List[RowDict]:
         rows = self._connection.execute(
             """
             SELECT
+                id,
                 created_at,
                 scope_type,
                 scope_key,
                 source_tournament_id,
                 reason,
                 operation_group_id,
-                COUNT(*) AS entries_count
-            FROM rating_snapshots
+                entries_count
+            FROM rating_snapshot_sessions
             WHERE scope_type = ? AND scope_key = ?
-            GROUP BY
-                created_at,
-                scope_type,
-                scope_key,
-                source_tournament_id,
-                reason,
-                operation_group_id
             ORDER BY created_at DESC
             """,
             (scope_type, scope_key),
         ).fetchall()
         return [dict(row) for row in rows]
 
-    def list_rows(
-        self,
-        *,
-        snapshot_created_at: str,
-        scope_type: str,
-        scope_key: str,
-    ) -> List[RowDict]:
+    def find_session_id(self, *, scope_type: str, scope_key: str, created_at: str) -> int | None:
+        row = self._connection.execute(
+            """
+            SELECT id
+            FROM rating_snapshot_sessions
+            WHERE scope_type = ? AND scope_key = ? AND created_at = ?
+            """,
+            (scope_type, scope_key, created_at),
+        ).fetchone()
+        return int(row["id"]) if row else None
+
+    def list_rows(self, session_id: int, *, include_basis: bool = False) -> List[RowDict]:
+        """Reconstruct a session's rows in position order.
+
+        With ``include_basis`` every row carries ``rolling_basis`` as a list of
+        ``(tournament_id, tournament_date, points_total)``, loaded in one query.
+        """
+        session = self._get_session(session_id)
+        if session is None:
+            return []
+        keyframe_id = session["keyframe_session_id"] or session_id
         rows = self._connection.execute(
             """
             SELECT
@@ -741,44 +1560,398 @@ class RatingSnapshotRepository:
                 players.middle_name
             FROM rating_snapshots
             JOIN players ON players.id = rating_snapshots.player_id
-            WHERE rating_snapshots.created_at = ?
-              AND rating_snapshots.scope_type = ?
-              AND rating_snapshots.scope_key = ?
-            ORDER BY rating_snapshots.position ASC, rating_snapshots.id ASC
+            WHERE rating_snapshots.session_id IN (?, ?)
             """,
-            (snapshot_created_at, scope_type, scope_key),
+            (keyframe_id, session_id),
         ).fetchall()
-        return [dict(row) for row in rows]
+        basis = self._list_basis(keyframe_id, session_id) if include_basis else {}
+        by_player: dict[int, RowDict] = {}
+        for row in sorted(rows, key=lambda item: item["session_id"] == session_id):
+            by_player[int(row["player_id"])] = dict(row)
+            if include_basis:
+                by_player[int(row["player_id"])]["rolling_basis"] = basis.get(int(row["id"]), [])
+        reconstructed: List[RowDict] = []
+        for position, player_id in enumerate(unpack_ranking(session["ranking"]), start=1):
+            row = by_player.get(player_id)
+            if row is not None:
+                reconstructed.append(_session_row(session, row, position))
+        return reconstructed
 
     def list_latest_rows_for_player(self, player_id: int) -> List[RowDict]:
         rows = self._connection.execute(
             """
             SELECT
-                rating_snapshots.*,
+                latest.player_id,
+                latest.scope_type,
+                latest.scope_key,
+                latest.session_id,
+                latest.position,
+                latest.points,
+                latest.tournaments_count,
+                sessions.source_tournament_id,
+                sessions.reason,
+                sessions.operation_group_id,
+                sessions.created_at,
                 players.last_name,
                 players.first_name,
                 players.middle_name
-            FROM rating_snapshots
-            JOIN players ON players.id = rating_snapshots.player_id
-            JOIN (
-                SELECT
-                    scope_type,
-                    scope_key,
-                    MAX(created_at) AS latest_created_at
-                FROM rating_snapshots
-                WHERE player_id = ?
-                GROUP BY scope_type, scope_key
-            ) latest
-              ON latest.scope_type = rating_snapshots.scope_type
-             AND latest.scope_key = rating_snapshots.scope_key
-             AND latest.latest_created_at = rating_snapshots.created_at
-            WHERE rating_snapshots.player_id = ?
-            ORDER BY rating_snapshots.scope_type ASC, rating_snapshots.scope_key ASC
+            FROM player_rating_latest AS latest
+            JOIN rating_snapshot_sessions AS sessions ON sessions.id = latest.session_id
+            JOIN players ON players.id = latest.player_id
+            WHERE latest.player_id = ?
+            ORDER BY latest.scope_type ASC, latest.scope_key ASC
             """,
-            (player_id, player_id),
+            (player_id,),
         ).fetchall()
         return [dict(row) for row in rows]
 
+    def list_player_series(self, *, player_id: int, scope_type: str, scope_key: str) -> List[RowDict]:
+        """Return the player's row in every session of a scope that ranks them, oldest first."""
+        stored = {
+            int(row["session_id"]): row
+            for row in self._connection.execute(
+                """
+                SELECT rating_snapshots.session_id, rating_snapshots.points, rating_snapshots.tournaments_count
+                FROM rating_snapshots
+                JOIN rating_snapshot_sessions AS sessions ON sessions.id = rating_snapshots.session_id
+                WHERE rating_snapshots.player_id = ?
+                  AND sessions.scope_type = ?
+                  AND sessions.scope_key = ?
+                """,
+                (player_id, scope_type, scope_key),
+            ).fetchall()
+        }
+        series: List[RowDict] = []
+        for session in self._connection.execute(
+            """
+            SELECT id, keyframe_session_id, source_tournament_id, created_at, ranking
+            FROM rating_snapshot_sessions
+            WHERE scope_type = ? AND scope_key = ?
+            ORDER BY created_at ASC
+            """,
+            (scope_type, scope_key),
+        ).fetchall():
+            ranking = unpack_ranking(session["ranking"])
+            if player_id not in ranking:
+                continue
+            row = stored.get(int(session["id"])) or stored.get(int(session["keyframe_session_id"] or 0))
+            if row is None:
+                continue
+            series.append(
+                {
+                    "session_id": int(session["id"]),
+                    "source_tournament_id": int(session["source_tournament_id"]),
+                    "created_at": str(session["created_at"]),
+                    "position": ranking.index(player_id) + 1,
+                    "points": int(row["points"]),
+                    "tournaments_count": int(row["tournaments_count"]),
+                }
+            )
+        return series
+
+    def detach_tournament(self, tournament_id: int) -> set[tuple[str, str]]:
+        """Re-encode sessions that depend on keyframes sourced by a tournament.
+
+        Deleting a tournament cascades to its snapshot sessions; any delta
+        built on one of its keyframes is rewritten first so it stays readable.
+        Returns the scopes that have sessions sourced by the tournament.
+        """
+        sourced = self._connection.execute(
+            """
+            SELECT id, scope_type, scope_key, frame_kind
+            FROM rating_snapshot_sessions
+            WHERE source_tournament_id = ?
+            """,
+            (tournament_id,),
+        ).fetchall()
+        keyframes = [row for row in sourced if row["frame_kind"] == FRAME_KIND_KEYFRAME]
+        with repo_session(self._connection):
+            for keyframe in keyframes:
+                dependents = self._connection.execute(
+                    """
+                    SELECT *
+                    FROM rating_snapshot_sessions
+                    WHERE keyframe_session_id = ? AND source_tournament_id != ?
+                    ORDER BY created_at ASC, id ASC
+                    """,
+                    (keyframe["id"], tournament_id),
+                ).fetchall()
+                # Decode everything first: rewriting one frame changes what later deltas decode against.
+                self._reencode_sessions(
+                    [
+                        (int(session["id"]), self.list_rows(int(session["id"]), include_basis=True))
+                        for session in dependents
+                    ]
+                )
+        return {(str(row["scope_type"]), str(row["scope_key"])) for row in sourced}
+
+    def replace_session_entries(
+        self,
+        entries_by_session: Mapping[int, list[dict[str, Any]]],
+    ) -> set[tuple[str, str]]:
+        """Replace the rows of stored sessions, keeping their ids and headers.
+
+        Each scope is re-encoded from the keyframe preceding its first replaced
+        session to its latest session; a session replaced with no entries is
+        dropped. ``player_rating_latest`` is rebuilt for the returned scopes.
+        """
+        first_by_scope: dict[tuple[str, str], RowDict] = {}
+        for session_id in entries_by_session:
+            session = self._get_session(session_id)
+            if session is None:
+                continue
+            scope = (str(session["scope_type"]), str(session["scope_key"]))
+            first = first_by_scope.get(scope)
+            if first is None or (session["created_at"], session["id"]) < (first["created_at"], first["id"]):
+                first_by_scope[scope] = session
+        with repo_session(self._connection):
+            for (scope_type, scope_key), first in first_by_scope.items():
+                start = self._get_session(int(first["keyframe_session_id"] or first["id"])) or first
+                tail = self._connection.execute(
+                    """
+                    SELECT id
+                    FROM rating_snapshot_sessions
+                    WHERE scope_type = ? AND scope_key = ? AND (created_at, id) >= (?, ?)
+                    ORDER BY created_at ASC, id ASC
+                    """,
+                    (scope_type, scope_key, start["created_at"], start["id"]),
+                ).fetchall()
+                sessions = [
+                    (
+                        int(row["id"]),
+                        entries_by_session[int(row["id"])]
+                        if int(row["id"]) in entries_by_session
+                        else self.list_rows(int(row["id"]), include_basis=True),
+                    )
+                    for row in tail
+                ]
+                dropped = [(session_id,) for session_id, entries in sessions if not entries]
+                self._connection.executemany("DELETE FROM rating_snapshot_sessions WHERE id = ?", dropped)
+                self._reencode_sessions([session for session in sessions if session[1]])
+            self.rebuild_player_latest(first_by_scope)
+        return set(first_by_scope)
+
+    def rebuild_player_latest(self, scopes: Iterable[tuple[str, str]]) -> None:
+        with repo_session(self._connection):
+            for scope_type, scope_key in scopes:
+                rebuild_player_rating_latest(self._connection, scope_type, scope_key)
+
+    def _reencode_sessions(self, sessions: list[tuple[int, list[dict[str, Any]]]]) -> None:
+        """Write decoded sessions of one scope back in order, starting from a keyframe."""
+        keyframe_rows: dict[int, Mapping[str, Any]] | None = None
+        keyframe_id: int | None = None
+        since_keyframe = 0
+        for session_id, entries in sessions:
+            kind = self._rewrite_session(session_id, entries, keyframe_rows, since_keyframe, keyframe_id)
+            if kind == FRAME_KIND_KEYFRAME:
+                keyframe_id = session_id
+                keyframe_rows = {int(entry["player_id"]): entry for entry in entries}
+                since_keyframe = 0
+            else:
+                since_keyframe += 1
+
+    def _write_session(
+        self,
+        header: Mapping[str, Any],
+        entries: list[dict[str, Any]],
+        keyframe_rows: Mapping[int, Mapping[str, Any]] | None,
+        since_keyframe: int,
+        keyframe_id: int | None,
+    ) -> tuple[int, str]:
+        kind, stored = plan_frame(entries, keyframe_rows, since_keyframe)
+        cursor = self._connection.execute(
+            """
+            INSERT INTO rating_snapshot_sessions (
+                scope_type,
+                scope_key,
+                source_tournament_id,
+                reason,
+                operation_group_id,
+                created_at,
+                entries_count,
+                frame_kind,
+                keyframe_session_id,
+                ranking
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                header["scope_type"],
+                header["scope_key"],
+                header["source_tournament_id"],
+                header["reason"],
+                header.get("operation_group_id"),
+                header["created_at"],
+                len(entries),
+                kind,
+                keyframe_id if kind == FRAME_KIND_DELTA else None,
+                pack_ranking(entry["player_id"] for entry in entries),
+            ),
+        )
+        session_id = int(cursor.lastrowid)
+        self._insert_frame_rows(session_id, stored)
+        return session_id, kind
+
+    def _rewrite_session(
+        self,
+        session_id: int,
+        entries: list[dict[str, Any]],
+        keyframe_rows: Mapping[int, Mapping[str, Any]] | None,
+        since_keyframe: int,
+        keyframe_id: int | None,
+    ) -> str:
+        """Re-encode a stored session under its existing id and header."""
+        kind, stored = plan_frame(entries, keyframe_rows, since_keyframe)
+        self._connection.execute(
+            """
+            UPDATE rating_snapshot_sessions
+            SET entries_count = ?,
+                frame_kind = ?,
+                keyframe_session_id = ?,
+                ranking = ?
+            WHERE id = ?
+            """,
+            (
+                len(entries),
+                kind,
+                keyframe_id if kind == FRAME_KIND_DELTA else None,
+                pack_ranking(entry["player_id"] for entry in entries),
+                session_id,
+            ),
+        )
+        self._connection.execute("DELETE FROM rating_snapshots WHERE session_id = ?", (session_id,))
+        self._insert_frame_rows(session_id, stored)
+        return kind
+
+    def _insert_frame_rows(self, session_id: int, stored: Iterable[Mapping[str, Any]]) -> None:
+        basis_rows: list[tuple[int, int, int, str, int]] = []
+        for entry in stored:
+            row_cursor = self._connection.execute(
+                """
+                INSERT INTO rating_snapshots (
+                    session_id,
+                    player_id,
+                    position,
+                    points,
+                    tournaments_count
+                )
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (
+                    session_id,
+                    entry.get("player_id"),
+                    entry.get("position"),
+                    entry.get("points"),
+                    entry.get("tournaments_count"),
+                ),
+            )
+            basis_rows.extend(
+                (int(row_cursor.lastrowid), ordinal, *item)
+                for ordinal, item in enumerate(entry.get("rolling_basis") or ())
+            )
+        self._connection.executemany(
+            """
+            INSERT INTO rating_snapshot_basis (
+                snapshot_row_id,
+                ordinal,
+                tournament_id,
+                tournament_date,
+                points_total
+            )
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            basis_rows,
+        )
+
+    def _get_session(self, session_id: int) -> RowDict | None:
+        row = self._connection.execute(
+            "SELECT * FROM rating_snapshot_sessions WHERE id = ?",
+            (session_id,),
+        ).fetchone()
+        return dict(row) if row else None
+
+    def list_session_ids_counting_tournament(self, tournament_id: int) -> list[int]:
+        """Return ids of sessions whose rolling basis may include a tournament.
+
+        Deltas of a matching keyframe are included even if they override every
+        row that counted it, so the result is a (tight) superset.
+        """
+        rows = self._connection.execute(
+            """
+            WITH direct AS (
+                SELECT DISTINCT rating_snapshots.session_id AS id
+                FROM rating_snapshot_basis
+                JOIN rating_snapshots ON rating_snapshots.id = rating_snapshot_basis.snapshot_row_id
+                WHERE rating_snapshot_basis.tournament_id = ?
+            )
+            SELECT id FROM direct
+            UNION
+            SELECT sessions.id
+            FROM rating_snapshot_sessions AS sessions
+            JOIN direct ON direct.id = sessions.keyframe_session_id
+            ORDER BY 1
+            """,
+            (tournament_id,),
+        ).fetchall()
+        return [int(row[0]) for row in rows]
+
+    def _list_basis(self, *session_ids: int) -> dict[int, list[tuple[int, str, int]]]:
+        rows = self._connection.execute(
+            f"""
+            SELECT
+                rating_snapshot_basis.snapshot_row_id,
+                rating_snapshot_basis.tournament_id,
+                rating_snapshot_basis.tournament_date,
+                rating_snapshot_basis.points_total
+            FROM rating_snapshot_basis
+            JOIN rating_snapshots ON rating_snapshots.id = rating_snapshot_basis.snapshot_row_id
+            WHERE rating_snapshots.session_id IN ({", ".join("?" for _ in session_ids)})
+            ORDER BY rating_snapshot_basis.snapshot_row_id, rating_snapshot_basis.ordinal
+            """,
+            session_ids,
+        ).fetchall()
+        basis: dict[int, list[tuple[int, str, int]]] = {}
+        for row in rows:
+            basis.setdefault(int(row[0]), []).append((int(row[1]), str(row[2]), int(row[3])))
+        return basis
+
+    def _stored_rows(self, session_id: int) -> dict[int, RowDict]:
+        rows = self._connection.execute(
+            """
+            SELECT id, player_id, points, tournaments_count
+            FROM rating_snapshots
+            WHERE session_id = ?
+            """,
+            (session_id,),
+        ).fetchall()
+        basis = self._list_basis(session_id)
+        return {
+            int(row["player_id"]): {**dict(row), "rolling_basis": basis.get(int(row["id"]), [])}
+            for row in rows
+        }
+
+    def _count_deltas(self, keyframe_id: int) -> int:
+        row = self._connection.execute(
+            "SELECT COUNT(*) FROM rating_snapshot_sessions WHERE keyframe_session_id = ?",
+            (keyframe_id,),
+        ).fetchone()
+        return int(row[0]) if row else 0
+
+
+def _session_row(session: Mapping[str, Any], row: RowDict, position: int) -> RowDict:
+    """Present a stored (possibly keyframe) row as a row of ``session``."""
+    return {
+        **row,
+        "session_id": session["id"],
+        "position": position,
+        "scope_type": session["scope_type"],
+        "scope_key": session["scope_key"],
+        "source_tournament_id": session["source_tournament_id"],
+        "reason": session["reason"],
+        "operation_group_id": session["operation_group_id"],
+        "created_at": session["created_at"],
+    }
+
 
 class LeagueTransferRepository:
     """Repository for persisted league transfer events."""
@@ -789,7 +1962,7 @@ class LeagueTransferRepository:
     def create_many(self, entries: list[dict[str, Any]]) -> int:
         if not entries:
             return 0
-        with self._connection:
+        with repo_session(self._connection):
             self._connection.executemany(
                 """
                 INSERT INTO league_transfer_events (
@@ -884,7 +2057,7 @@ class NoteRepository:
                 int(bool(data.get("is_archived"))),
             ),
         )
-        self._connection.commit()
+        commit(self._connection)
         return _lastrowid_as_int(cursor)
 
     def list_for_entity(
@@ -1017,7 +2190,7 @@ class TrainingEntryRepository:
                 int(bool(data.get("is_archived"))),
             ),
         )
-        self._connection.commit()
+        commit(self._connection)
         return _lastrowid_as_int(cursor)
 
     def list_for_player(self, player_id: int, *, include_archived: bool = False) -> List[RowDict]:
@@ -1115,7 +2288,7 @@ class RestorePointRepository:
                 data.get("created_at"),
             ),
         )
-        self._connection.commit()
+        commit(self._connection)
         return _lastrowid_as_int(cursor)
 
     def get(self, restore_point_id: int) -> RowDict | None:
@@ -1166,7 +2339,7 @@ class CoachTaskRepository:
                 data.get("category"),
             ),
         )
-        self._connection.commit()
+        commit(self._connection)
         return _lastrowid_as_int(cursor)
 
     def get(self, task_id: int) -> dict[str, Any] | None:
@@ -1204,11 +2377,11 @@ class CoachTaskRepository:
             f"UPDATE coach_tasks SET {', '.join(fields)} WHERE id = ?",
             params,
         )
-        self._connection.commit()
+        commit(self._connection)
 
     def delete(self, task_id: int) -> None:
         self._connection.execute("DELETE FROM coach_tasks WHERE id = ?", (task_id,))
-        self._connection.commit()
+        commit(self._connection)
 
     def list_all(
         self,
@@ -1297,7 +2470,7 @@ class CoachTaskRepository:
             """,
             (task_id,),
         )
-        self._connection.commit()
+        commit(self._connection)
 
 
 class TrainingPlanRepository:
@@ -1332,7 +2505,7 @@ class TrainingPlanRepository:
                 data.get("exercises_json", "[]"),
             ),
         )
-        self._connection.commit()
+        commit(self._connection)
         return _lastrowid_as_int(cursor)
 
     def get(self, plan_id: int) -> dict[str, Any] | None:
@@ -1370,11 +2543,11 @@ class TrainingPlanRepository:
             f"UPDATE training_plans SET {', '.join(fields)} WHERE id = ?",
             params,
         )
-        self._connection.commit()
+        commit(self._connection)
 
     def delete(self, plan_id: int) -> None:
         self._connection.execute("DELETE FROM training_plans WHERE id = ?", (plan_id,))
-        self._connection.commit()
+        commit(self._connection)
 
     def list_all(self, *, status: str | None = None, player_id: int | None = None) -> List[RowDict]:
         clauses: list[str] = []
@@ -1439,7 +2612,7 @@ class ReportTemplateRepository:
             """,
             (name, config_json),
         )
-        self._connection.commit()
+        commit(self._connection)
         return _lastrowid_as_int(cursor)
 
     def list_templates(self) -> list[sqlite3.Row]:
@@ -1460,4 +2633,4 @@ class ReportTemplateRepository:
             "DELETE FROM report_templates WHERE id = ?",
             (template_id,),
         )
-        self._connection.commit()
+        commit(self._connection)
@@ -2,7 +2,13 @@
 
 from __future__ import annotations
 
+import json
 import sqlite3
+import sys
+from array import array
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from typing import Any
+
 
 SCHEMA_VERSION = "2026.04.wave1"
 
@@ -27,6 +33,194 @@ PLAYER_INDEXES_SQL = [
     "CREATE INDEX IF NOT EXISTS idx_players_birth_date ON players (birth_date);",
 ]
 
+PLAYER_IDENTITY_COLUMNS: list[tuple[str, str]] = [
+    ("fio_key", "TEXT"),
+    ("birth_year", "TEXT"),
+]
+
+PLAYER_IDENTITY_INDEXES_SQL = [
+    "CREATE INDEX IF NOT EXISTS idx_players_identity ON players (fio_key, birth_year);",
+]
+
+RATING_CHANGE_LOG_RETENTION = 10000
+
+# Every write that can change a rolling rating appends the touched tournament
+# and/or player, so incremental rating engines on any connection can catch up.
+RATING_CHANGE_LOG_SQL = [
+    """
+    CREATE TABLE IF NOT EXISTS rating_change_log (
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        tournament_id INTEGER,
+        player_id INTEGER
+    );
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_rating_change_log_retention
+    AFTER INSERT ON rating_change_log
+    BEGIN
+        DELETE FROM rating_change_log WHERE seq <= NEW.seq - {RATING_CHANGE_LOG_RETENTION};
+    END;
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_rating_change_results_insert
+    AFTER INSERT ON results
+    BEGIN
+        INSERT INTO rating_change_log (tournament_id, player_id) VALUES (NEW.tournament_id, NEW.player_id);
+    END;
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_rating_change_results_update
+    AFTER UPDATE OF tournament_id, player_id, points_total ON results
+    BEGIN
+        INSERT INTO rating_change_log (tournament_id, player_id) VALUES (OLD.tournament_id, OLD.player_id);
+        INSERT INTO rating_change_log (tournament_id, player_id)
+        SELECT NEW.tournament_id, NEW.player_id
+        WHERE NEW.tournament_id IS NOT OLD.tournament_id OR NEW.player_id IS NOT OLD.player_id;
+    END;
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_rating_change_results_delete
+    AFTER DELETE ON results
+    BEGIN
+        INSERT INTO rating_change_log (tournament_id, player_id) VALUES (OLD.tournament_id, OLD.player_id);
+    END;
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_rating_change_tournaments_update
+    AFTER UPDATE OF status, date, category_code, league_code, is_adult_mode ON tournaments
+    BEGIN
+        INSERT INTO rating_change_log (tournament_id, player_id) VALUES (NEW.id, NULL);
+    END;
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_rating_change_tournaments_delete
+    AFTER DELETE ON tournaments
+    BEGIN
+        INSERT INTO rating_change_log (tournament_id, player_id) VALUES (OLD.id, NULL);
+    END;
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_rating_change_players_update
+    AFTER UPDATE OF last_name, first_name, middle_name, gender ON players
+    BEGIN
+        INSERT INTO rating_change_log (tournament_id, player_id) VALUES (NULL, NEW.id);
+    END;
+    """,
+]
+
+
+def _rating_current_scope_match_sql(tournament: str) -> str:
+    """SQL condition: a rating_current_scopes row covers the given tournament row."""
+    return f"""(
+        (rating_current_scopes.scope_type = 'category'
+            AND rating_current_scopes.scope_key = {tournament}.category_code
+            AND COALESCE({tournament}.is_adult_mode, 0) = 0)
+        OR (rating_current_scopes.scope_type = 'league'
+            AND rating_current_scopes.scope_key = {tournament}.league_code)
+        OR (rating_current_scopes.scope_type = 'adult'
+            AND COALESCE({tournament}.is_adult_mode, 0) = 1)
+    )"""
+
+
+def _invalidate_rating_current_for_result_sql(row: str) -> str:
+    return f"""
+        DELETE FROM rating_current_scopes
+        WHERE EXISTS (
+            SELECT 1 FROM tournaments
+            WHERE tournaments.id = {row}.tournament_id
+              AND tournaments.status = 'published'
+              AND {_rating_current_scope_match_sql("tournaments")}
+        );
+    """
+
+
+# rating_current holds the materialized current table per scope and N. A scope
+# is only served from it while its rating_current_scopes header exists; the
+# triggers below drop the headers of every scope a write can affect, and the
+# lifecycle flows re-materialize them.
+RATING_CURRENT_SQL = [
+    """
+    CREATE TABLE IF NOT EXISTS rating_current_scopes (
+        scope_type TEXT NOT NULL,
+        scope_key TEXT NOT NULL,
+        refreshed_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (scope_type, scope_key)
+    );
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS rating_current (
+        scope_type TEXT NOT NULL,
+        scope_key TEXT NOT NULL,
+        n INTEGER NOT NULL,
+        player_id INTEGER NOT NULL,
+        position INTEGER NOT NULL,
+        points INTEGER NOT NULL,
+        tournaments_count INTEGER NOT NULL,
+        PRIMARY KEY (scope_type, scope_key, n, player_id),
+        FOREIGN KEY (player_id) REFERENCES players(id) ON DELETE CASCADE
+    );
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_rating_current_position ON rating_current (scope_type, scope_key, n, position);",
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_rating_current_results_insert
+    AFTER INSERT ON results
+    BEGIN
+        {_invalidate_rating_current_for_result_sql("NEW")}
+    END;
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_rating_current_results_update
+    AFTER UPDATE OF tournament_id, player_id, points_total ON results
+    BEGIN
+        {_invalidate_rating_current_for_result_sql("OLD")}
+        {_invalidate_rating_current_for_result_sql("NEW")}
+    END;
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_rating_current_results_delete
+    AFTER DELETE ON results
+    BEGIN
+        {_invalidate_rating_current_for_result_sql("OLD")}
+    END;
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_rating_current_tournaments_update
+    AFTER UPDATE OF status, date, category_code, league_code, is_adult_mode ON tournaments
+    WHEN OLD.status = 'published' OR NEW.status = 'published'
+    BEGIN
+        DELETE FROM rating_current_scopes
+        WHERE (OLD.status = 'published' AND {_rating_current_scope_match_sql("OLD")})
+           OR (NEW.status = 'published' AND {_rating_current_scope_match_sql("NEW")});
+    END;
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_rating_current_tournaments_delete
+    AFTER DELETE ON tournaments
+    WHEN OLD.status = 'published'
+    BEGIN
+        DELETE FROM rating_current_scopes WHERE {_rating_current_scope_match_sql("OLD")};
+    END;
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_rating_current_players_update
+    AFTER UPDATE OF last_name, first_name, middle_name, gender ON players
+    WHEN NEW.last_name IS NOT OLD.last_name
+      OR NEW.first_name IS NOT OLD.first_name
+      OR NEW.middle_name IS NOT OLD.middle_name
+      OR NEW.gender IS NOT OLD.gender
+    BEGIN
+        DELETE FROM rating_current_scopes
+        WHERE EXISTS (
+            SELECT 1 FROM results
+            JOIN tournaments ON tournaments.id = results.tournament_id
+            WHERE results.player_id = NEW.id
+              AND tournaments.status = 'published'
+              AND {_rating_current_scope_match_sql("tournaments")}
+        );
+    END;
+    """,
+]
+
 TOURNAMENT_TABLE_SQL = """
 CREATE TABLE IF NOT EXISTS tournaments (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -105,6 +299,107 @@ RATING_SNAPSHOTS_INDEXES_SQL = [
     "CREATE INDEX IF NOT EXISTS idx_rating_snapshots_source_tournament ON rating_snapshots (source_tournament_id);",
 ]
 
+# Snapshot session headers. Rows in ``rating_snapshots`` reference their
+# session; a delta session reads unchanged rows from ``keyframe_session_id``.
+RATING_SNAPSHOT_SESSIONS_SQL = [
+    """
+    CREATE TABLE IF NOT EXISTS rating_snapshot_sessions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        scope_type TEXT NOT NULL,
+        scope_key TEXT NOT NULL,
+        source_tournament_id INTEGER NOT NULL,
+        reason TEXT NOT NULL,
+        operation_group_id TEXT,
+        created_at TEXT NOT NULL,
+        entries_count INTEGER NOT NULL,
+        frame_kind TEXT NOT NULL,
+        keyframe_session_id INTEGER,
+        ranking BLOB NOT NULL,
+        UNIQUE (scope_type, scope_key, created_at),
+        FOREIGN KEY (source_tournament_id) REFERENCES tournaments(id) ON DELETE CASCADE,
+        FOREIGN KEY (keyframe_session_id) REFERENCES rating_snapshot_sessions(id) ON DELETE SET NULL
+    );
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_rating_snapshot_sessions_keyframe ON rating_snapshot_sessions (keyframe_session_id);",
+    "CREATE INDEX IF NOT EXISTS idx_rating_snapshot_sessions_source_tournament ON rating_snapshot_sessions (source_tournament_id);",
+]
+
+RATING_SNAPSHOT_ROWS_SQL = """
+CREATE TABLE IF NOT EXISTS rating_snapshots (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    session_id INTEGER NOT NULL,
+    player_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    points INTEGER NOT NULL,
+    tournaments_count INTEGER NOT NULL,
+    rolling_basis_json TEXT NOT NULL DEFAULT '[]',
+    FOREIGN KEY (session_id) REFERENCES rating_snapshot_sessions(id) ON DELETE CASCADE,
+    FOREIGN KEY (player_id) REFERENCES players(id) ON DELETE CASCADE
+);
+"""
+
+RATING_SNAPSHOT_ROWS_INDEXES_SQL = [
+    "CREATE INDEX IF NOT EXISTS idx_rating_snapshots_session_position ON rating_snapshots (session_id, position);",
+    "CREATE INDEX IF NOT EXISTS idx_rating_snapshots_player ON rating_snapshots (player_id, session_id);",
+]
+
+# Rolling basis of each stored snapshot row: the tournaments that counted
+# towards its points, newest first (``ordinal`` 0).
+RATING_SNAPSHOT_BASIS_SQL = [
+    """
+    CREATE TABLE IF NOT EXISTS rating_snapshot_basis (
+        snapshot_row_id INTEGER NOT NULL,
+        ordinal INTEGER NOT NULL,
+        tournament_id INTEGER NOT NULL,
+        tournament_date TEXT NOT NULL,
+        points_total INTEGER NOT NULL,
+        PRIMARY KEY (snapshot_row_id, ordinal),
+        FOREIGN KEY (snapshot_row_id) REFERENCES rating_snapshots(id) ON DELETE CASCADE
+    ) WITHOUT ROWID;
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_rating_snapshot_basis_tournament ON rating_snapshot_basis (tournament_id);",
+]
+
+# Newest snapshot position of every player per scope, maintained on snapshot
+# writes so the player card never scans snapshot history.
+PLAYER_RATING_LATEST_SQL = [
+    """
+    CREATE TABLE IF NOT EXISTS player_rating_latest (
+        player_id INTEGER NOT NULL,
+        scope_type TEXT NOT NULL,
+        scope_key TEXT NOT NULL,
+        session_id INTEGER NOT NULL,
+        position INTEGER NOT NULL,
+        points INTEGER NOT NULL,
+        tournaments_count INTEGER NOT NULL,
+        PRIMARY KEY (player_id, scope_type, scope_key),
+        FOREIGN KEY (player_id) REFERENCES players(id) ON DELETE CASCADE,
+        FOREIGN KEY (session_id) REFERENCES rating_snapshot_sessions(id) ON DELETE CASCADE
+    ) WITHOUT ROWID;
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_player_rating_latest_session ON player_rating_latest (session_id);",
+]
+
+# Named place→points tables. A scheme is never edited in place: saving a
+# changed table adds the next version, so ``results.calc_version`` keeps
+# pointing at the exact table that produced the points. ``season`` and
+# ``category_code`` narrow where a scheme applies; NULL matches any value.
+POINT_SCHEMES_SQL = [
+    """
+    CREATE TABLE IF NOT EXISTS point_schemes (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        version INTEGER NOT NULL,
+        season TEXT,
+        category_code TEXT,
+        ranges_json TEXT NOT NULL,
+        created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE (name, version)
+    );
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_point_schemes_scope ON point_schemes (season, category_code);",
+]
+
 LEAGUE_TRANSFER_EVENTS_TABLE_SQL = """
 CREATE TABLE IF NOT EXISTS league_transfer_events (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -429,6 +724,12 @@ def _migrate_tournaments_schema(connection: sqlite3.Connection) -> None:
             has_draft_changes = COALESCE(has_draft_changes, 1),
             warning_state = COALESCE(NULLIF(warning_state, ''), 'none'),
             error_state = COALESCE(NULLIF(error_state, ''), 'none')
+        WHERE status IS NULL OR status = ''
+           OR is_adult_mode IS NULL
+           OR type IS NULL OR type = ''
+           OR has_draft_changes IS NULL
+           OR warning_state IS NULL OR warning_state = ''
+           OR error_state IS NULL OR error_state = ''
         """
     )
 
@@ -440,10 +741,354 @@ def _migrate_audit_log_schema(connection: sqlite3.Connection) -> None:
         connection.execute(f"ALTER TABLE audit_log ADD COLUMN {column_name} {column_sql}")
 
 
+# Migration steps keep doing what they did when they shipped, so the data
+# transforms they need are frozen copies below rather than imports of the live
+# helpers in app.domain.identity and app.db.snapshot_frames.
+
+
+def _migration_fio_key(last_name: object, first_name: object, middle_name: object) -> str:
+    text = " ".join(str(part) for part in (last_name, first_name, middle_name) if part)
+    return " ".join(text.strip().lower().replace("ё", "е").split())
+
+
+def _migration_birth_year(value: object) -> str | None:
+    text = "" if value is None else str(value).strip()
+    return text[:4] if len(text) >= 4 and text[:4].isdigit() else None
+
+
+def _migration_pack_ranking(player_ids: Iterable[int]) -> bytes:
+    packed = array("i", (int(player_id) for player_id in player_ids))
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _migration_unpack_ranking(blob: bytes | None) -> list[int]:
+    packed = array("i")
+    packed.frombytes(bytes(blob or b""))
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed.tolist()
+
+
+def _migration_plan_frame(
+    entries: Sequence[Mapping[str, Any]],
+    keyframe_rows: Mapping[int, Mapping[str, Any]] | None,
+    sessions_since_keyframe: int,
+) -> tuple[str, list[Mapping[str, Any]]]:
+    """Keyframe every 10 sessions, or when a delta would store over half the rows."""
+
+    def signature(row: Mapping[str, Any]) -> tuple[Any, ...]:
+        basis = tuple(map(tuple, row.get("rolling_basis") or ()))
+        return (row.get("points"), row.get("tournaments_count"), basis)
+
+    if keyframe_rows is None or sessions_since_keyframe + 1 >= 10:
+        return "keyframe", list(entries)
+    changed = [
+        entry
+        for entry in entries
+        if (base := keyframe_rows.get(int(entry["player_id"]))) is None or signature(base) != signature(entry)
+    ]
+    if len(changed) * 2 > len(entries):
+        return "keyframe", list(entries)
+    return "delta", changed
+
+
+def _migration_0001_baseline(connection: sqlite3.Connection) -> None:
+    for statement in SCHEMA_SQL:
+        connection.execute(statement)
+    _migrate_tournaments_schema(connection)
+    _migrate_audit_log_schema(connection)
+
+
+def _migration_0002_player_identity_keys(connection: sqlite3.Connection) -> None:
+    for column_name, column_sql in PLAYER_IDENTITY_COLUMNS:
+        if not _column_exists(connection, table="players", column=column_name):
+            connection.execute(f"ALTER TABLE players ADD COLUMN {column_name} {column_sql}")
+    _backfill_player_identity(connection)
+    for statement in PLAYER_IDENTITY_INDEXES_SQL:
+        connection.execute(statement)
+
+
+def _backfill_player_identity(connection: sqlite3.Connection) -> None:
+    rows = connection.execute(
+        "SELECT id, last_name, first_name, middle_name, birth_date FROM players"
+    ).fetchall()
+    connection.executemany(
+        "UPDATE players SET fio_key = ?, birth_year = ? WHERE id = ?",
+        [
+            (_migration_fio_key(row[1], row[2], row[3]), _migration_birth_year(row[4]), row[0])
+            for row in rows
+        ],
+    )
+
+
+def _migration_0003_rating_change_log(connection: sqlite3.Connection) -> None:
+    for statement in RATING_CHANGE_LOG_SQL:
+        connection.execute(statement)
+
+
+def _migration_0004_rating_current(connection: sqlite3.Connection) -> None:
+    for statement in RATING_CURRENT_SQL:
+        connection.execute(statement)
+
+
+def _basis_rows_from_json(row_id: int, raw_value: object) -> list[tuple[int, int, int, str, int]]:
+    try:
+        payload = json.loads(str(raw_value or "[]"))
+    except json.JSONDecodeError:
+        return []
+    if not isinstance(payload, list):
+        return []
+    return [
+        (
+            row_id,
+            ordinal,
+            int(item.get("tournament_id") or 0),
+            str(item.get("tournament_date") or ""),
+            int(item.get("points_total") or 0),
+        )
+        for ordinal, item in enumerate(item for item in payload if isinstance(item, dict))
+    ]
+
+
+_SNAPSHOT_COLUMNS = (
+    "id",
+    "scope_type",
+    "scope_key",
+    "player_id",
+    "position",
+    "points",
+    "tournaments_count",
+    "rolling_basis_json",
+    "source_tournament_id",
+    "reason",
+    "operation_group_id",
+    "created_at",
+)
+
+
+def _migration_0005_rating_snapshot_sessions(connection: sqlite3.Connection) -> None:
+    """Re-encode full-copy snapshot history as keyframe/delta sessions.
+
+    Every legacy ``(scope_type, scope_key, created_at)`` group becomes one
+    ``rating_snapshot_sessions`` header; ``rating_snapshots`` keeps only the
+    rows each session stores and references its header by ``session_id``.
+    """
+    for statement in RATING_SNAPSHOT_SESSIONS_SQL:
+        connection.execute(statement)
+    if _column_exists(connection, table="rating_snapshots", column="session_id"):
+        return
+
+    sessions: dict[tuple[str, str], dict[str, list[dict[str, object]]]] = {}
+    for raw in connection.execute(
+        f"""
+        SELECT {", ".join(_SNAPSHOT_COLUMNS)}
+        FROM rating_snapshots
+        ORDER BY scope_type, scope_key, created_at, position, id
+        """
+    ).fetchall():
+        row = dict(zip(_SNAPSHOT_COLUMNS, raw))
+        row["rolling_basis"] = [
+            basis_row[2:] for basis_row in _basis_rows_from_json(0, row["rolling_basis_json"])
+        ]
+        scope = (str(row["scope_type"]), str(row["scope_key"]))
+        sessions.setdefault(scope, {}).setdefault(str(row["created_at"]), []).append(row)
+
+    headers: list[tuple[object, ...]] = []
+    keyframe_of: dict[tuple[str, str, str], str] = {}
+    stored_ids: dict[tuple[str, str, str], list[object]] = {}
+    for (scope_type, scope_key), scope_sessions in sessions.items():
+        keyframe_rows: dict[int, dict[str, object]] | None = None
+        keyframe_created_at = ""
+        since_keyframe = 0
+        for created_at, rows in scope_sessions.items():
+            kind, stored = _migration_plan_frame(rows, keyframe_rows, since_keyframe)
+            if kind == "keyframe":
+                keyframe_rows = {int(row["player_id"]): row for row in rows}
+                keyframe_created_at = created_at
+                since_keyframe = 0
+            else:
+                since_keyframe += 1
+                keyframe_of[(scope_type, scope_key, created_at)] = keyframe_created_at
+            stored_ids[(scope_type, scope_key, created_at)] = [row["id"] for row in stored]
+            first = rows[0]
+            headers.append(
+                (
+                    scope_type,
+                    scope_key,
+                    first["source_tournament_id"],
+                    first["reason"],
+                    first["operation_group_id"],
+                    created_at,
+                    len(rows),
+                    kind,
+                    _migration_pack_ranking(row["player_id"] for row in rows),
+                )
+            )
+
+    # Session ids follow creation order across scopes.
+    headers.sort(key=lambda header: (header[5], header[0], header[1]))
+    session_ids: dict[tuple[str, str, str], int] = {}
+    for header in headers:
+        cursor = connection.execute(
+            """
+            INSERT INTO rating_snapshot_sessions (
+                scope_type, scope_key, source_tournament_id, reason, operation_group_id,
+                created_at, entries_count, frame_kind, ranking
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            header,
+        )
+        session_ids[(str(header[0]), str(header[1]), str(header[5]))] = int(cursor.lastrowid or 0)
+    connection.executemany(
+        "UPDATE rating_snapshot_sessions SET keyframe_session_id = ? WHERE id = ?",
+        [
+            (session_ids[(*session_key[:2], keyframe_created_at)], session_ids[session_key])
+            for session_key, keyframe_created_at in keyframe_of.items()
+        ],
+    )
+
+    connection.execute("ALTER TABLE rating_snapshots RENAME TO rating_snapshots_legacy")
+    connection.execute(RATING_SNAPSHOT_ROWS_SQL)
+    connection.executemany(
+        """
+        INSERT INTO rating_snapshots (
+            id, session_id, player_id, position, points, tournaments_count, rolling_basis_json
+        )
+        SELECT id, ?, player_id, position, points, tournaments_count, rolling_basis_json
+        FROM rating_snapshots_legacy
+        WHERE id = ?
+        """,
+        [
+            (session_ids[session_key], row_id)
+            for session_key, row_ids in stored_ids.items()
+            for row_id in row_ids
+        ],
+    )
+    connection.execute("DROP TABLE rating_snapshots_legacy")
+    for statement in RATING_SNAPSHOT_ROWS_INDEXES_SQL:
+        connection.execute(statement)
+
+
+def _migration_0006_rating_snapshot_basis(connection: sqlite3.Connection) -> None:
+    for statement in RATING_SNAPSHOT_BASIS_SQL:
+        connection.execute(statement)
+    if not _column_exists(connection, table="rating_snapshots", column="rolling_basis_json"):
+        return
+    basis_rows: list[tuple[int, int, int, str, int]] = []
+    for row_id, raw_value in connection.execute(
+        "SELECT id, rolling_basis_json FROM rating_snapshots"
+    ).fetchall():
+        basis_rows.extend(_basis_rows_from_json(int(row_id), raw_value))
+    connection.executemany(
+        """
+        INSERT OR IGNORE INTO rating_snapshot_basis (
+            snapshot_row_id, ordinal, tournament_id, tournament_date, points_total
+        )
+        VALUES (?, ?, ?, ?, ?)
+        """,
+        basis_rows,
+    )
+    connection.execute("ALTER TABLE rating_snapshots DROP COLUMN rolling_basis_json")
+
+
+def _migration_0007_player_rating_latest(connection: sqlite3.Connection) -> None:
+    for statement in PLAYER_RATING_LATEST_SQL:
+        connection.execute(statement)
+    # Each player points at the newest session of a scope whose ranking includes them.
+    latest: dict[tuple[int, str, str], tuple[int, int, int]] = {}
+    for session_id, keyframe_id, scope_type, scope_key, ranking in connection.execute(
+        """
+        SELECT id, COALESCE(keyframe_session_id, id), scope_type, scope_key, ranking
+        FROM rating_snapshot_sessions
+        ORDER BY created_at DESC
+        """
+    ).fetchall():
+        for position, player_id in enumerate(_migration_unpack_ranking(ranking), start=1):
+            latest.setdefault((player_id, scope_type, scope_key), (int(session_id), int(keyframe_id), position))
+    connection.executemany(
+        """
+        INSERT INTO player_rating_latest (
+            player_id, scope_type, scope_key, session_id, position, points, tournaments_count
+        )
+        SELECT player_id, ?, ?, ?, ?, points, tournaments_count
+        FROM rating_snapshots
+        WHERE player_id = ? AND session_id IN (?, ?)
+        ORDER BY session_id = ? DESC
+        LIMIT 1
+        """,
+        [
+            (scope_type, scope_key, session_id, position, player_id, keyframe_id, session_id, session_id)
+            for (player_id, scope_type, scope_key), (session_id, keyframe_id, position) in latest.items()
+        ],
+    )
+
+
+def _migration_0008_point_schemes(connection: sqlite3.Connection) -> None:
+    for statement in POINT_SCHEMES_SQL:
+        connection.execute(statement)
+
+
+Migration = Callable[[sqlite3.Connection], None]
+
+# Numbered schema migrations. The number of the last applied step is stored in
+# ``PRAGMA user_version``; new steps are only ever appended and must be
+# idempotent, because databases created before versioning start from 0.
+MIGRATIONS: list[tuple[int, Migration]] = [
+    (1, _migration_0001_baseline),
+    (2, _migration_0002_player_identity_keys),
+    (3, _migration_0003_rating_change_log),
+    (4, _migration_0004_rating_current),
+    (5, _migration_0005_rating_snapshot_sessions),
+    (6, _migration_0006_rating_snapshot_basis),
+    (7, _migration_0007_player_rating_latest),
+    (8, _migration_0008_point_schemes),
+]
+
+LATEST_SCHEMA_USER_VERSION = MIGRATIONS[-1][0]
+
+
+def get_schema_user_version(connection: sqlite3.Connection) -> int:
+    """Return the migration number recorded in the database header."""
+    row = connection.execute("PRAGMA user_version").fetchone()
+    return int(row[0]) if row else 0
+
+
+def _set_schema_user_version(connection: sqlite3.Connection, version: int) -> None:
+    connection.execute(f"PRAGMA user_version = {int(version)}")
+
+
+def migrate_schema(connection: sqlite3.Connection) -> list[int]:
+    """Apply pending migrations and return the numbers of applied steps."""
+    current_version = get_schema_user_version(connection)
+    applied: list[int] = []
+    if connection.in_transaction:
+        connection.commit()
+    for version, migration in MIGRATIONS:
+        if version <= current_version:
+            continue
+        # sqlite3 does not open a transaction before DDL, so begin one
+        # explicitly: a failing step leaves neither schema changes nor a new
+        # user_version behind.
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            migration(connection)
+            _set_schema_user_version(connection, version)
+        except BaseException:
+            connection.rollback()
+            raise
+        connection.commit()
+        applied.append(version)
+    return applied
+
+
 def initialize_schema(connection: sqlite3.Connection) -> None:
-    """Initialize database schema if needed."""
-    with connection:
-        for statement in SCHEMA_SQL:
-            connection.execute(statement)
-        _migrate_tournaments_schema(connection)
-        _migrate_audit_log_schema(connection)
+    """Initialize database schema if needed.
+
+    An up-to-date database costs a single ``PRAGMA user_version`` read.
+    """
+    if get_schema_user_version(connection) >= LATEST_SCHEMA_USER_VERSION:
+        return
+    migrate_schema(connection)
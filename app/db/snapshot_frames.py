@@ -0,0 +1,107 @@
+"""Keyframe/delta encoding helpers for rating snapshot storage."""
+
+from __future__ import annotations
+
+import sqlite3
+import sys
+from array import array
+from typing import Any, Iterable, Mapping, Sequence
+
+# A scope writes a full keyframe every K sessions; the sessions in between
+# store only rows that differ from that keyframe. Positions are not compared:
+# every session keeps its own packed ranking of player ids, so a shift in
+# places alone never forces a row into a delta.
+SNAPSHOT_KEYFRAME_INTERVAL = 10
+
+FRAME_KIND_KEYFRAME = "keyframe"
+FRAME_KIND_DELTA = "delta"
+
+_SIGNATURE_COLUMNS = ("points", "tournaments_count", "rolling_basis")
+
+
+def pack_ranking(player_ids: Iterable[int]) -> bytes:
+    """Pack player ids in position order as little-endian int32."""
+    packed = array("i", (int(player_id) for player_id in player_ids))
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def unpack_ranking(blob: bytes | None) -> list[int]:
+    packed = array("i")
+    packed.frombytes(bytes(blob or b""))
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed.tolist()
+
+
+def row_signature(row: Mapping[str, Any]) -> tuple[Any, ...]:
+    """``rolling_basis`` is a sequence of ``(tournament_id, tournament_date, points_total)``."""
+    return tuple(
+        tuple(map(tuple, row.get(column) or ())) if column == "rolling_basis" else row.get(column)
+        for column in _SIGNATURE_COLUMNS
+    )
+
+
+def plan_frame(
+    entries: Sequence[Mapping[str, Any]],
+    keyframe_rows: Mapping[int, Mapping[str, Any]] | None,
+    sessions_since_keyframe: int,
+    interval: int = SNAPSHOT_KEYFRAME_INTERVAL,
+) -> tuple[str, list[Mapping[str, Any]]]:
+    """Return the frame kind and the rows to store for one session.
+
+    ``keyframe_rows`` maps player id to the scope's current keyframe rows, or
+    is None when the scope has no keyframe yet. A delta that would store more
+    than half of the rows is written as a keyframe instead.
+    """
+    if keyframe_rows is None or sessions_since_keyframe + 1 >= interval:
+        return FRAME_KIND_KEYFRAME, list(entries)
+    changed = [
+        entry
+        for entry in entries
+        if (base := keyframe_rows.get(int(entry["player_id"]))) is None
+        or row_signature(base) != row_signature(entry)
+    ]
+    if len(changed) * 2 > len(entries):
+        return FRAME_KIND_KEYFRAME, list(entries)
+    return FRAME_KIND_DELTA, changed
+
+
+def rebuild_player_rating_latest(connection: sqlite3.Connection, scope_type: str, scope_key: str) -> None:
+    """Recompute ``player_rating_latest`` for one scope from its sessions.
+
+    Each player points at the newest session whose ranking includes them.
+    """
+    connection.execute(
+        "DELETE FROM player_rating_latest WHERE scope_type = ? AND scope_key = ?",
+        (scope_type, scope_key),
+    )
+    latest: dict[int, tuple[int, int, int]] = {}
+    for session_id, keyframe_id, ranking in connection.execute(
+        """
+        SELECT id, COALESCE(keyframe_session_id, id), ranking
+        FROM rating_snapshot_sessions
+        WHERE scope_type = ? AND scope_key = ?
+        ORDER BY created_at DESC
+        """,
+        (scope_type, scope_key),
+    ).fetchall():
+        for position, player_id in enumerate(unpack_ranking(ranking), start=1):
+            latest.setdefault(player_id, (int(session_id), int(keyframe_id), position))
+    connection.executemany(
+        """
+        INSERT INTO player_rating_latest (
+            player_id, scope_type, scope_key, session_id, position, points, tournaments_count
+        )
+        SELECT player_id, ?, ?, ?, ?, points, tournaments_count
+        FROM rating_snapshots
+        WHERE player_id = ? AND session_id IN (?, ?)
+        ORDER BY session_id = ? DESC
+        LIMIT 1
+        """,
+        [
+            (scope_type, scope_key, session_id, position, player_id, keyframe_id, session_id, session_id)
+            for player_id, (session_id, keyframe_id, position) in latest.items()
+        ],
+    )
@@ -0,0 +1,85 @@
+"""Unit-of-work transactions shared by repositories and services."""
+
+from __future__ import annotations
+
+import sqlite3
+from types import TracebackType
+
+
+class _SessionState:
+    __slots__ = ("connection", "depth")
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self.connection = connection
+        self.depth = 0
+
+
+# Active sessions keyed by id(connection). The state keeps a strong reference
+# to the connection, so the id cannot be reused while the session is open.
+_ACTIVE_SESSIONS: dict[int, _SessionState] = {}
+
+
+def in_unit_of_work(connection: sqlite3.Connection) -> bool:
+    """Return True if a unit of work currently owns the connection's transaction."""
+    return id(connection) in _ACTIVE_SESSIONS
+
+
+def commit(connection: sqlite3.Connection) -> None:
+    """Commit now, or leave it to the enclosing unit of work."""
+    if not in_unit_of_work(connection):
+        connection.commit()
+
+
+class UnitOfWork:
+    """Group repository writes on one connection into a single transaction.
+
+    The outermost unit of work opens the transaction and commits (or rolls
+    back on error) once on exit; repository ``commit`` calls inside it are
+    deferred. Nested units of work become savepoints, so an inner failure
+    can be rolled back without losing the outer work.
+    """
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self._connection = connection
+        self._savepoint: str | None = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        return self._connection
+
+    def __enter__(self) -> "UnitOfWork":
+        state = _ACTIVE_SESSIONS.get(id(self._connection))
+        if state is None:
+            state = _SessionState(self._connection)
+            if not self._connection.in_transaction:
+                self._connection.execute("BEGIN")
+            _ACTIVE_SESSIONS[id(self._connection)] = state
+        else:
+            self._savepoint = f"uow_{state.depth}"
+            self._connection.execute(f"SAVEPOINT {self._savepoint}")
+        state.depth += 1
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        state = _ACTIVE_SESSIONS[id(self._connection)]
+        state.depth -= 1
+        if self._savepoint is not None:
+            if exc_type is not None:
+                self._connection.execute(f"ROLLBACK TO {self._savepoint}")
+            self._connection.execute(f"RELEASE {self._savepoint}")
+            return
+        del _ACTIVE_SESSIONS[id(self._connection)]
+        if exc_type is not None:
+            self._connection.rollback()
+        else:
+            self._connection.commit()
+
+
+def repo_session(connection: sqlite3.Connection) -> UnitOfWork:
+    """Return a unit of work for ``with repo_session(connection):`` blocks."""
+    return UnitOfWork(connection)
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from typing import Any, Mapping
+
+
+def normalize_fio_key(value: object | None) -> str:
+    """Normalize a full name for identity matching (case, ё, whitespace)."""
+    if value is None:
+        return ""
+    text = str(value).strip().lower().replace("ё", "е")
+    return " ".join(text.split())
+
+
+def player_fio_key(
+    last_name: object | None,
+    first_name: object | None,
+    middle_name: object | None,
+) -> str:
+    """Return the normalized FIO key stored in ``players.fio_key``."""
+    return normalize_fio_key(
+        " ".join(str(part) for part in (last_name, first_name, middle_name) if part)
+    )
+
+
+def fio_matches_search(fio: object | None, search_term: object | None) -> bool:
+    """Return True if the normalized FIO contains the normalized search term.
+
+    ``ResultRepository`` applies the same rule in SQL to ``players.fio_key``.
+    """
+    return normalize_fio_key(search_term) in normalize_fio_key(fio)
+
+
+def birth_year_of(value: object | None) -> str | None:
+    """Return the leading four-digit year of a birth date/year value."""
+    if value is None:
+        return None
+    text = str(value).strip()
+    if len(text) >= 4 and text[:4].isdigit():
+        return text[:4]
+    return None
+
+
+def player_identity_columns(data: Mapping[str, Any]) -> tuple[str, str | None]:
+    """Return ``(fio_key, birth_year)`` for a player payload."""
+    return (
+        player_fio_key(data.get("last_name"), data.get("first_name"), data.get("middle_name")),
+        birth_year_of(data.get("birth_date")),
+    )
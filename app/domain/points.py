@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Mapping
+from array import array
+from dataclasses import dataclass
+from typing import Iterable, Mapping, Sequence
 
 
 PLACE_POINTS: Mapping[range, int] = {
@@ -13,17 +15,96 @@ PLACE_POINTS: Mapping[range, int] = {
     range(33, 65): 2,
 }
 
+# (first_place, last_place, points), inclusive on both ends.
+PointRange = tuple[int, int, int]
+
+DEFAULT_POINT_SCHEME_NAME = "default"
+DEFAULT_POINT_SCHEME_VERSION = 3
+DEFAULT_CALC_VERSION = "v3_no_classification"
+# Adult tournaments keep the points entered from the protocol.
+MANUAL_ADULT_CALC_VERSION = "manual_adult_v1"
+
+
+@dataclass(frozen=True)
+class CompiledPointScheme:
+    """A place→points table flattened into an array indexed by place.
+
+    Places beyond the table are worth 0; ``None`` places are worth 0.
+    """
+
+    name: str
+    version: int
+    ranges: tuple[PointRange, ...]
+    calc_version: str
+    lookup: array
+
+    @property
+    def max_place(self) -> int:
+        return len(self.lookup) - 1
+
+    def points(self, place: int | None) -> int:
+        """Return rating points for a tournament place."""
+        if place is None:
+            return 0
+        if not isinstance(place, int):
+            raise TypeError("Place must be an integer or None.")
+        if place <= 0:
+            raise ValueError("Place must be a positive integer.")
+        if place >= len(self.lookup):
+            return 0
+        return self.lookup[place]
+
+    def points_many(self, places: Iterable[int | None]) -> list[int]:
+        """Map a whole column of places at once."""
+        lookup = self.lookup
+        size = len(lookup)
+        # Out-of-table and invalid places fall back to ``points`` for its rules.
+        return [
+            lookup[place] if type(place) is int and 0 < place < size else self.points(place)
+            for place in places
+        ]
+
+
+def compile_point_scheme(
+    name: str,
+    version: int,
+    ranges: Iterable[Sequence[int]],
+    *,
+    calc_version: str | None = None,
+) -> CompiledPointScheme:
+    """Validate ``(first_place, last_place, points)`` ranges and flatten them."""
+    normalized = sorted((int(first), int(last), int(points)) for first, last, points in ranges)
+    if not normalized:
+        raise ValueError("Таблица очков не может быть пустой.")
+    previous_last = 0
+    for first, last, points in normalized:
+        if first <= 0 or last < first:
+            raise ValueError(f"Некорректный диапазон мест: {first}-{last}.")
+        if first <= previous_last:
+            raise ValueError(f"Диапазоны мест пересекаются: {first}-{last}.")
+        if points < 0:
+            raise ValueError("Очки за место не могут быть отрицательными.")
+        previous_last = last
+    lookup = array("i", [0] * (previous_last + 1))
+    for first, last, points in normalized:
+        lookup[first : last + 1] = array("i", [points] * (last - first + 1))
+    return CompiledPointScheme(
+        name=name,
+        version=int(version),
+        ranges=tuple(normalized),
+        calc_version=calc_version or f"scheme:{name}:v{int(version)}",
+        lookup=lookup,
+    )
+
+
+DEFAULT_POINT_SCHEME = compile_point_scheme(
+    DEFAULT_POINT_SCHEME_NAME,
+    DEFAULT_POINT_SCHEME_VERSION,
+    [(place_range.start, place_range.stop - 1, points) for place_range, points in PLACE_POINTS.items()],
+    calc_version=DEFAULT_CALC_VERSION,
+)
+
+
 def points_for_place(place: int | None) -> int:
     """Return rating points for a tournament place."""
-    if place is None:
-        return 0
-    if not isinstance(place, int):
-        raise TypeError("Place must be an integer or None.")
-    if place <= 0:
-        raise ValueError("Place must be a positive integer.")
-    if place > 64:
-        return 0
-    for place_range, points in PLACE_POINTS.items():
-        if place in place_range:
-            return points
-    return 0
+    return DEFAULT_POINT_SCHEME.points(place)
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+from bisect import bisect_right
 from dataclasses import dataclass
+from datetime import date
+from itertools import accumulate
 from typing import Any, Mapping, Sequence
 
 
@@ -113,6 +116,92 @@ def build_rating_snapshot(
             )
         )
 
+    return _rank_snapshot_rows(snapshot)
+
+
+class RatingTimeline:
+    """Rolling top-N rating of one scope as of any date.
+
+    Built once from the scope's results: every player keeps date-sorted keys
+    and points prefix sums, so ``rows(n, as_of=...)`` costs one bisect per
+    player instead of regrouping the results. ``rows`` matches
+    ``build_rating_snapshot`` over the results dated on or before ``as_of``.
+    """
+
+    def __init__(self, results: Sequence[Mapping[str, Any]]) -> None:
+        self._players: list[tuple[int, str, list[str], list[int]]] = []
+        for player_id, player_bucket in _group_rating_entries(results).items():
+            entries = sorted(player_bucket["entries"], key=_rating_entry_sort_key)
+            self._players.append(
+                (
+                    player_id,
+                    str(player_bucket["fio"]),
+                    [_rating_entry_sort_key(entry)[0] for entry in entries],
+                    list(accumulate((int(entry.get("points_total") or 0) for entry in entries), initial=0)),
+                )
+            )
+
+    def rows(self, n: int, *, as_of: date | str | None = None) -> list[RatingSnapshotRow]:
+        if n <= 0:
+            raise ValueError("N must be a positive integer.")
+        cutoff = _as_of_key(as_of)
+        snapshot: list[RatingSnapshotRow] = []
+        for player_id, fio, dates, prefix_sums in self._players:
+            end = len(dates) if cutoff is None else bisect_right(dates, cutoff)
+            if end == 0:
+                continue
+            count = min(n, end)
+            snapshot.append(
+                RatingSnapshotRow(
+                    player_id=player_id,
+                    place=0,
+                    fio=fio,
+                    points=prefix_sums[end] - prefix_sums[end - count],
+                    tournaments_count=count,
+                )
+            )
+        return _rank_snapshot_rows(snapshot)
+
+
+def build_rating_snapshot_as_of(
+    results: Sequence[Mapping[str, Any]],
+    n: int,
+    as_of: date | str | None,
+) -> list[RatingSnapshotRow]:
+    """Rank the rolling top-N using only results dated on or before ``as_of``."""
+    return RatingTimeline(results).rows(n, as_of=as_of)
+
+
+def _as_of_key(as_of: date | str | None) -> str | None:
+    if as_of is None:
+        return None
+    if isinstance(as_of, date):
+        return as_of.isoformat()[:10]
+    return str(as_of)
+
+
+def build_rating_snapshot_from_totals(
+    totals: Sequence[Mapping[str, Any]],
+) -> list[RatingSnapshotRow]:
+    """Rank per-player rolling totals already aggregated by the database.
+
+    ``totals`` rows carry ``player_id``, ``points``, ``tournaments_count`` and
+    the player name fields, as returned by ``ResultRepository.list_rating_totals``.
+    """
+    snapshot = [
+        RatingSnapshotRow(
+            player_id=int(entry["player_id"]),
+            place=0,
+            fio=_build_fio(entry),
+            points=int(entry.get("points") or 0),
+            tournaments_count=int(entry.get("tournaments_count") or 0),
+        )
+        for entry in totals
+    ]
+    return _rank_snapshot_rows(snapshot)
+
+
+def _rank_snapshot_rows(snapshot: list[RatingSnapshotRow]) -> list[RatingSnapshotRow]:
     snapshot.sort(key=lambda row: (-row.points, row.fio))
     return [
         RatingSnapshotRow(
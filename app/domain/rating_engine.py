@@ -0,0 +1,309 @@
+"""Incremental rolling top-N rating table."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator, Mapping, Sequence
+
+from app.domain.rating import (
+    RatingBasisItem,
+    RatingImpactRow,
+    RatingSnapshotRow,
+    _build_fio,
+    _rating_entry_sort_key,
+)
+
+# (tournament_date, tournament_id, points_total), kept in ascending order so the
+# latest N results are the tail of the list.
+HistoryEntry = tuple[str, int, int]
+RankKey = tuple[int, str, int]
+
+
+@dataclass(frozen=True)
+class _PlayerState:
+    fio: str
+    history: tuple[HistoryEntry, ...]
+    points: int
+    tournaments_count: int
+
+
+def _history_entry(entry: Mapping[str, Any]) -> HistoryEntry:
+    tournament_date, tournament_id = _rating_entry_sort_key(entry)
+    return (tournament_date, tournament_id, int(entry.get("points_total") or 0))
+
+
+class IncrementalRatingTable:
+    """Rolling top-N rating for one scope, updated per player instead of rebuilt.
+
+    Each player keeps a date-sorted point history; the ranking is a sorted
+    list of ``(-points, fio, player_id)`` keys maintained with bisect. Updates
+    touch only the affected players and return the resulting rank deltas in
+    the ``build_rating_impact`` format. Players tied on points and FIO are
+    ordered by id.
+    """
+
+    def __init__(self, n: int) -> None:
+        if n <= 0:
+            raise ValueError("N must be a positive integer.")
+        self._n = n
+        self._players: dict[int, _PlayerState] = {}
+        self._ranking: list[RankKey] = []
+        self._tournament_players: dict[int, set[int]] = {}
+
+    @classmethod
+    def from_results(cls, results: Sequence[Mapping[str, Any]], n: int) -> "IncrementalRatingTable":
+        table = cls(n)
+        grouped = _group_histories(results)
+        for player_id, (fio, history) in grouped.items():
+            table._set_state(player_id, table._build_state(fio, history))
+        table._ranking.sort()
+        return table
+
+    @property
+    def n(self) -> int:
+        return self._n
+
+    def __len__(self) -> int:
+        return len(self._ranking)
+
+    def rows(self) -> list[RatingSnapshotRow]:
+        """Return the current table in ``build_rating_snapshot`` format."""
+        return [
+            self._snapshot_row(player_id, place)
+            for place, (_points, _fio, player_id) in enumerate(self._ranking, start=1)
+        ]
+
+    def row_for(self, player_id: int) -> RatingSnapshotRow | None:
+        state = self._players.get(player_id)
+        if state is None:
+            return None
+        return self._snapshot_row(player_id, self._position(player_id, state) + 1)
+
+    def basis(self, player_id: int) -> list[RatingBasisItem]:
+        state = self._players.get(player_id)
+        if state is None:
+            return []
+        return [
+            RatingBasisItem(
+                tournament_id=tournament_id,
+                tournament_date=tournament_date,
+                points_total=points_total,
+            )
+            for tournament_date, tournament_id, points_total in reversed(state.history[-self._n :])
+        ]
+
+    def basis_by_player(self) -> dict[int, list[RatingBasisItem]]:
+        return {player_id: self.basis(player_id) for player_id in self._players}
+
+    def players_in_tournament(self, tournament_id: int) -> set[int]:
+        return set(self._tournament_players.get(tournament_id, ()))
+
+    def apply_tournament(
+        self,
+        tournament_id: int,
+        tournament_date: object | None,
+        results: Iterable[Mapping[str, Any]],
+    ) -> list[RatingImpactRow]:
+        """Replace one tournament's results (pass none to withdraw it) and return rank deltas."""
+        tournament_rows = {int(entry["player_id"]): entry for entry in results}
+        new_states: dict[int, _PlayerState | None] = {}
+        for player_id in self.players_in_tournament(tournament_id) | set(tournament_rows):
+            current = self._players.get(player_id)
+            history = [
+                item for item in (current.history if current else ()) if item[1] != tournament_id
+            ]
+            fio = current.fio if current else ""
+            entry = tournament_rows.get(player_id)
+            if entry is not None:
+                history.append(
+                    _history_entry(
+                        {**entry, "tournament_id": tournament_id, "tournament_date": tournament_date}
+                    )
+                )
+                fio = _build_fio(entry) or fio
+            new_states[player_id] = self._build_state(fio, history)
+        return self._update(new_states)
+
+    @contextmanager
+    def preview_tournament(
+        self,
+        tournament_id: int,
+        tournament_date: object | None,
+        results: Iterable[Mapping[str, Any]],
+    ) -> Iterator[list[RatingImpactRow]]:
+        """Apply a tournament for the duration of the block, then restore the table.
+
+        Only the tournament's players are saved and restored, so a preview
+        costs O(affected players) rank updates regardless of the table size.
+        """
+        results = list(results)
+        affected = self.players_in_tournament(tournament_id) | {int(entry["player_id"]) for entry in results}
+        previous = {player_id: self._players.get(player_id) for player_id in affected}
+        impact = self.apply_tournament(tournament_id, tournament_date, results)
+        try:
+            yield impact
+        finally:
+            self._swap_states(previous)
+
+    def replace_player_results(
+        self,
+        player_ids: Iterable[int],
+        results: Sequence[Mapping[str, Any]],
+    ) -> list[RatingImpactRow]:
+        """Reload the histories of ``player_ids`` from ``results`` and return rank deltas."""
+        grouped = _group_histories(results)
+        new_states: dict[int, _PlayerState | None] = {}
+        for player_id in set(player_ids):
+            fio, history = grouped.get(player_id, ("", []))
+            new_states[player_id] = self._build_state(fio, history)
+        return self._update(new_states)
+
+    def _build_state(self, fio: str, history: list[HistoryEntry]) -> _PlayerState | None:
+        if not history:
+            return None
+        history.sort()
+        top = history[-self._n :]
+        return _PlayerState(
+            fio=fio,
+            history=tuple(history),
+            points=sum(points_total for _date, _tournament_id, points_total in top),
+            tournaments_count=len(top),
+        )
+
+    def _rank_key(self, player_id: int, state: _PlayerState) -> RankKey:
+        return (-state.points, state.fio, player_id)
+
+    def _position(self, player_id: int, state: _PlayerState) -> int:
+        return bisect_left(self._ranking, self._rank_key(player_id, state))
+
+    def _snapshot_row(self, player_id: int, place: int) -> RatingSnapshotRow:
+        state = self._players[player_id]
+        return RatingSnapshotRow(
+            player_id=player_id,
+            place=place,
+            fio=state.fio,
+            points=state.points,
+            tournaments_count=state.tournaments_count,
+        )
+
+    def _set_state(self, player_id: int, state: _PlayerState | None) -> None:
+        """Store a state without touching the ranking order (bulk load only)."""
+        if state is None:
+            return
+        self._players[player_id] = state
+        self._ranking.append(self._rank_key(player_id, state))
+        for _date, tournament_id, _points in state.history:
+            self._tournament_players.setdefault(tournament_id, set()).add(player_id)
+
+    def _update(self, new_states: Mapping[int, _PlayerState | None]) -> list[RatingImpactRow]:
+        old_rows: dict[int, tuple[int, _PlayerState]] = {}
+        for player_id in new_states:
+            state = self._players.get(player_id)
+            if state is not None:
+                old_rows[player_id] = (self._position(player_id, state) + 1, state)
+        old_keys, new_keys = self._swap_states(new_states)
+
+        impact_rows: list[RatingImpactRow] = []
+        for player_id in new_states:
+            old = old_rows.get(player_id)
+            new_row = self.row_for(player_id)
+            old_place = old[0] if old else None
+            old_points = old[1].points if old else 0
+            new_place = new_row.place if new_row else None
+            new_points = new_row.points if new_row else 0
+            if old_place == new_place and old_points == new_points:
+                continue
+            fio = new_row.fio if new_row else old[1].fio if old else ""
+            impact_rows.append(_impact_row(player_id, fio, old_place, new_place, old_points, new_points))
+
+        # An unaffected player moves by (affected keys ahead of it now) minus
+        # (affected keys ahead of it before). That is zero above the smallest
+        # affected key, and below the largest one unless players were added
+        # or removed.
+        all_keys = old_keys + new_keys
+        if all_keys:
+            start = bisect_left(self._ranking, min(all_keys))
+            stop = len(self._ranking)
+            if len(old_keys) == len(new_keys):
+                stop = bisect_left(self._ranking, max(all_keys))
+            for index in range(start, stop):
+                key = self._ranking[index]
+                player_id = key[2]
+                if player_id in new_states:
+                    continue
+                old_index = index - bisect_left(new_keys, key) + bisect_left(old_keys, key)
+                if old_index == index:
+                    continue
+                state = self._players[player_id]
+                impact_rows.append(
+                    _impact_row(player_id, state.fio, old_index + 1, index + 1, state.points, state.points)
+                )
+
+        impact_rows.sort(key=lambda row: (row.new_place is None, row.new_place or 10**9, row.fio))
+        return impact_rows
+
+    def _swap_states(
+        self, new_states: Mapping[int, _PlayerState | None]
+    ) -> tuple[list[RankKey], list[RankKey]]:
+        """Replace the players' states and return their sorted old and new rank keys."""
+        old_keys: list[RankKey] = []
+        for player_id in new_states:
+            state = self._players.pop(player_id, None)
+            if state is None:
+                continue
+            old_keys.append(self._rank_key(player_id, state))
+            for _date, tournament_id, _points in state.history:
+                members = self._tournament_players[tournament_id]
+                members.discard(player_id)
+                if not members:
+                    del self._tournament_players[tournament_id]
+        old_keys.sort()
+        for key in reversed(old_keys):
+            del self._ranking[bisect_left(self._ranking, key)]
+
+        new_keys: list[RankKey] = []
+        for player_id, new_state in new_states.items():
+            if new_state is None:
+                continue
+            key = self._rank_key(player_id, new_state)
+            insort(self._ranking, key)
+            new_keys.append(key)
+            self._players[player_id] = new_state
+            for _date, tournament_id, _points in new_state.history:
+                self._tournament_players.setdefault(tournament_id, set()).add(player_id)
+        new_keys.sort()
+        return old_keys, new_keys
+
+
+def _impact_row(
+    player_id: int,
+    fio: str,
+    old_place: int | None,
+    new_place: int | None,
+    old_points: int,
+    new_points: int,
+) -> RatingImpactRow:
+    return RatingImpactRow(
+        player_id=player_id,
+        fio=fio,
+        old_place=old_place,
+        new_place=new_place,
+        place_delta=old_place - new_place if old_place is not None and new_place is not None else None,
+        old_points=old_points,
+        new_points=new_points,
+        points_delta=new_points - old_points,
+    )
+
+
+def _group_histories(
+    results: Sequence[Mapping[str, Any]],
+) -> dict[int, tuple[str, list[HistoryEntry]]]:
+    grouped: dict[int, tuple[str, list[HistoryEntry]]] = {}
+    for entry in results:
+        player_id = int(entry["player_id"])
+        _fio, history = grouped.get(player_id, ("", []))
+        history.append(_history_entry(entry))
+        grouped[player_id] = (_build_fio(entry), history)
+    return grouped
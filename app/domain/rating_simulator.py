@@ -0,0 +1,194 @@
+"""What-if rating scenarios evaluated against one loaded scope."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from itertools import accumulate
+from typing import Any
+
+from app.domain.rating import (
+    RatingImpactRow,
+    RatingSnapshotRow,
+    _build_fio,
+    _rank_snapshot_rows,
+    _rating_entry_sort_key,
+    build_rating_impact,
+)
+
+PointsForPlace = Callable[[int | None], int]
+
+
+@dataclass(frozen=True)
+class RatingScenario:
+    """One what-if question.
+
+    ``added_results`` are extra result rows (same shape as
+    ``list_results_for_rating``); ``points_for_place`` recomputes every
+    result's points from its ``place`` instead of using ``points_total``.
+    """
+
+    n: int
+    excluded_tournament_ids: frozenset[int] = frozenset()
+    added_results: tuple[Mapping[str, Any], ...] = ()
+    points_for_place: PointsForPlace | None = None
+    label: str = ""
+
+
+@dataclass(frozen=True)
+class ScenarioOutcome:
+    scenario: RatingScenario
+    rows: list[RatingSnapshotRow]
+    impact: list[RatingImpactRow]
+
+
+@dataclass
+class _PlayerSeries:
+    fio: str
+    first_index: int
+    # Entries newest first as (sort key, tournament id, source index, result row).
+    entries: list[tuple[tuple[str, int], int, int, Mapping[str, Any]]]
+
+
+class RatingSimulator:
+    """Evaluate many rating scenarios for one scope from a single result load.
+
+    Every player's results are sorted once (newest first); per points table
+    the simulator keeps each player's points prefix sums, so a scenario that
+    only changes N costs O(players), and exclusions or additions re-sum only
+    the players they touch. Outcomes are ranked exactly like
+    ``build_rating_snapshot`` over the scenario's results and compared with
+    the baseline through ``build_rating_impact``.
+    """
+
+    def __init__(self, results: Sequence[Mapping[str, Any]], *, baseline_n: int) -> None:
+        if baseline_n <= 0:
+            raise ValueError("N must be a positive integer.")
+        self._players: dict[int, _PlayerSeries] = {}
+        self._tournament_players: dict[int, set[int]] = {}
+        self._result_count = len(results)
+        for index, entry in enumerate(results):
+            player_id = int(entry["player_id"])
+            tournament_id = int(entry.get("tournament_id") or 0)
+            series = self._players.get(player_id)
+            if series is None:
+                series = self._players[player_id] = _PlayerSeries(fio="", first_index=index, entries=[])
+            series.fio = _build_fio(entry)
+            series.entries.append((_rating_entry_sort_key(entry), tournament_id, index, entry))
+            self._tournament_players.setdefault(tournament_id, set()).add(player_id)
+        for series in self._players.values():
+            # Newest first; ties keep source order, as the stable reverse sort does.
+            series.entries.sort(key=lambda item: item[0], reverse=True)
+        self._prefix_sums: dict[PointsForPlace | None, dict[int, list[int]]] = {}
+        self._baseline = self._rows(RatingScenario(n=baseline_n, label="baseline"))
+
+    @property
+    def baseline(self) -> list[RatingSnapshotRow]:
+        return list(self._baseline)
+
+    def sweep_n(self, n_values: Iterable[int]) -> dict[int, ScenarioOutcome]:
+        return {n: self.evaluate(RatingScenario(n=n, label=f"N={n}")) for n in n_values}
+
+    def evaluate_many(self, scenarios: Iterable[RatingScenario]) -> list[ScenarioOutcome]:
+        return [self.evaluate(scenario) for scenario in scenarios]
+
+    def evaluate(self, scenario: RatingScenario) -> ScenarioOutcome:
+        rows = self._rows(scenario)
+        return ScenarioOutcome(scenario=scenario, rows=rows, impact=build_rating_impact(self._baseline, rows))
+
+    def _rows(self, scenario: RatingScenario) -> list[RatingSnapshotRow]:
+        if scenario.n <= 0:
+            raise ValueError("N must be a positive integer.")
+        prefix_sums = self._prefix_sums_for(scenario.points_for_place)
+
+        added: dict[int, list[tuple[tuple[str, int], int, int, Mapping[str, Any]]]] = {}
+        for offset, entry in enumerate(scenario.added_results):
+            added.setdefault(int(entry["player_id"]), []).append(
+                (
+                    _rating_entry_sort_key(entry),
+                    int(entry.get("tournament_id") or 0),
+                    self._result_count + offset,
+                    entry,
+                )
+            )
+        touched = set(added)
+        for tournament_id in scenario.excluded_tournament_ids:
+            touched |= self._tournament_players.get(tournament_id, set())
+
+        ranked: list[tuple[int, RatingSnapshotRow]] = []
+        for player_id, series in self._players.items():
+            if player_id in touched:
+                continue
+            sums = prefix_sums[player_id]
+            count = min(scenario.n, len(sums) - 1)
+            ranked.append(
+                (
+                    series.first_index,
+                    RatingSnapshotRow(
+                        player_id=player_id,
+                        place=0,
+                        fio=series.fio,
+                        points=sums[count],
+                        tournaments_count=count,
+                    ),
+                )
+            )
+        for player_id in touched:
+            row = self._evaluate_touched(player_id, scenario, added.get(player_id, []))
+            if row is not None:
+                ranked.append(row)
+
+        # First appearance in the scenario's results breaks (points, FIO) ties.
+        ranked.sort(key=lambda item: item[0])
+        return _rank_snapshot_rows([row for _, row in ranked])
+
+    def _evaluate_touched(
+        self,
+        player_id: int,
+        scenario: RatingScenario,
+        added: list[tuple[tuple[str, int], int, int, Mapping[str, Any]]],
+    ) -> tuple[int, RatingSnapshotRow] | None:
+        series = self._players.get(player_id)
+        entries = [
+            item
+            for item in (series.entries if series is not None else [])
+            if item[1] not in scenario.excluded_tournament_ids
+        ]
+        if added:
+            entries = sorted(entries + added, key=lambda item: item[0], reverse=True)
+        if not entries:
+            return None
+        top = entries[: scenario.n]
+        fio = _build_fio(added[-1][3]) if added else series.fio if series is not None else ""
+        return (
+            min(item[2] for item in entries),
+            RatingSnapshotRow(
+                player_id=player_id,
+                place=0,
+                fio=fio,
+                points=sum(_entry_points(item[3], scenario.points_for_place) for item in top),
+                tournaments_count=len(top),
+            ),
+        )
+
+    def _prefix_sums_for(self, points_for_place: PointsForPlace | None) -> dict[int, list[int]]:
+        prefix_sums = self._prefix_sums.get(points_for_place)
+        if prefix_sums is None:
+            prefix_sums = {
+                player_id: list(
+                    accumulate(
+                        (_entry_points(item[3], points_for_place) for item in series.entries),
+                        initial=0,
+                    )
+                )
+                for player_id, series in self._players.items()
+            }
+            self._prefix_sums[points_for_place] = prefix_sums
+        return prefix_sums
+
+
+def _entry_points(entry: Mapping[str, Any], points_for_place: PointsForPlace | None) -> int:
+    if points_for_place is None:
+        return int(entry.get("points_total") or 0)
+    place = entry.get("place")
+    return int(points_for_place(int(place) if place is not None else None))
@@ -11,6 +11,8 @@ from __future__ import annotations
 import sqlite3
 from dataclasses import dataclass
 
+from app.db.unit_of_work import commit
+
 
 @dataclass(frozen=True)
 class AttachmentRecord:
@@ -41,7 +43,7 @@ def create_attachment(
         """,
         (entity_type, entity_id, file_path, file_name, description, file_size),
     )
-    connection.commit()
+    commit(connection)
     return int(cursor.lastrowid)  # type: ignore[arg-type]
 
 
@@ -69,4 +71,4 @@ def list_entity_attachments(connection: sqlite3.Connection, entity_type: str, en
 def delete_attachment(connection: sqlite3.Connection, attachment_id: int) -> None:
     """Delete an attachment record."""
     connection.execute("DELETE FROM attachments WHERE id = ?", (attachment_id,))
-    connection.commit()
+    commit(connection)
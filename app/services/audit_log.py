@@ -5,7 +5,8 @@ import sqlite3
 from dataclasses import dataclass
 from pathlib import Path
 
-from app.db.database import get_connection
+from app.db.database import get_shared_connection
+from app.db.unit_of_work import repo_session
 
 IMPORT_FILE = "IMPORT_FILE"
 IMPORT_FOLDER = "IMPORT_FOLDER"
@@ -102,7 +103,7 @@ class AuditEvent:
 
 class AuditLogService:
     def __init__(self, connection: sqlite3.Connection | None = None) -> None:
-        self._connection = connection or get_connection()
+        self._connection = connection or get_shared_connection()
 
     def log_event(
         self,
@@ -121,7 +122,7 @@ class AuditLogService:
         operation_group_id: str | None = None,
     ) -> int:
         context_json = json.dumps(context or {}, ensure_ascii=False)
-        with self._connection:
+        with repo_session(self._connection):
             cursor = self._connection.execute(
                 """
                 INSERT INTO audit_log (
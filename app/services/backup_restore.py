@@ -224,9 +224,9 @@ def create_quick_backup() -> Path:
 
     Returns the path of the created backup file.
     """
-    from app.db.database import get_connection
+    from app.db.database import get_shared_connection
 
-    connection = get_connection()
+    connection = get_shared_connection()
     paths = get_runtime_paths()
     timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d_%H%M%S")
     destination = paths.restore_points_dir / f"quick_backup_{timestamp}.db"
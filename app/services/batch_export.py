@@ -8,8 +8,11 @@ import sqlite3
 from typing import Any, TypedDict, cast
 
 from app.db.repositories import ResultRepository, TournamentRepository
+from app.domain.rating import build_rating_snapshot_from_totals
 from app.runtime_paths import get_runtime_paths
 from app.services.export_service import ExportService
+from app.services.rating_current import list_current_rating
+from app.services.rating_snapshot import CATEGORY_SCOPE
 
 
 class TournamentRow(TypedDict, total=False):
@@ -19,19 +22,6 @@ class TournamentRow(TypedDict, total=False):
     category_code: object
 
 
-class RatingResultRow(TypedDict):
-    player_id: object
-    points_total: object
-    last_name: object
-    first_name: object
-    middle_name: object
-
-
-class PlayerRatingData(TypedDict):
-    entries: list[RatingResultRow]
-    fio: str
-
-
 def _safe_int(value: object | None, default: int = 0) -> int:
     if value is None:
         return default
@@ -137,44 +127,19 @@ class BatchExportService:
         return BatchExportResult(run_directory=run_directory, files_created=files_created)
 
     def _build_rating_rows(self, category_code: str, n_value: int) -> list[list[str]]:
-        results_raw = self._result_repo.list_results_for_rating(category_code=category_code)
-        results: list[RatingResultRow] = [
-            cast(RatingResultRow, entry) for entry in results_raw if isinstance(entry, dict)
-        ]
-        players: dict[int, PlayerRatingData] = {}
-        for entry in results:
-            player_id = _safe_int(entry.get("player_id"), default=-1)
-            if player_id < 0:
-                continue
-            players.setdefault(player_id, {"entries": [], "fio": ""})
-            players[player_id]["entries"].append(entry)
-            fio = " ".join(
-                part
-                for part in [
-                    str(entry.get("last_name") or ""),
-                    str(entry.get("first_name") or ""),
-                    str(entry.get("middle_name") or ""),
-                ]
-                if part
-            )
-            players[player_id]["fio"] = fio
-
-        rating_rows: list[dict[str, object]] = []
-        for player in players.values():
-            entries: list[RatingResultRow] = player["entries"]
-            points_list = [_safe_int(entry.get("points_total"), default=0) for entry in entries]
-            rating_rows.append(
-                {
-                    "fio": str(player["fio"]),
-                    "points": sum(points_list[:n_value]),
-                    "tournaments_count": min(len(points_list), n_value),
-                }
+        rating_rows = list_current_rating(
+            self._connection,
+            scope_type=CATEGORY_SCOPE,
+            scope_key=category_code,
+            n=n_value,
+        )
+        if rating_rows is None:
+            rating_rows = build_rating_snapshot_from_totals(
+                self._result_repo.list_rating_totals(n_value, category_code=category_code, is_adult_mode=False)
             )
-
-        rating_rows.sort(key=lambda row: (-_safe_int(row.get("points"), default=0), str(row.get("fio", ""))))
         return [
-            [str(index), str(row["fio"]), str(row["points"]), str(row["tournaments_count"])]
-            for index, row in enumerate(rating_rows, start=1)
+            [str(row.place), row.fio, str(row.points), str(row.tournaments_count)]
+            for row in rating_rows
         ]
 
     def _build_protocol_rows(self, tournament_id: int) -> list[list[str]]:
@@ -4,6 +4,8 @@ from __future__ import annotations
 import sqlite3
 from dataclasses import dataclass
 
+from app.db.unit_of_work import commit
+
 
 @dataclass(frozen=True)
 class CustomFieldRecord:
@@ -37,7 +39,7 @@ def create_custom_field(
         "INSERT INTO custom_fields (name, field_type, options_json) VALUES (?, ?, ?)",
         (name.strip(), field_type, options_json),
     )
-    connection.commit()
+    commit(connection)
     return int(cursor.lastrowid)  # type: ignore[arg-type]
 
 
@@ -67,7 +69,7 @@ def set_field_value(connection: sqlite3.Connection, custom_field_id: int, player
         """,
         (custom_field_id, player_id, value),
     )
-    connection.commit()
+    commit(connection)
     return int(cursor.lastrowid)  # type: ignore[arg-type]
 
 
@@ -95,4 +97,4 @@ def get_player_custom_values(connection: sqlite3.Connection, player_id: int) ->
 def delete_custom_field(connection: sqlite3.Connection, field_id: int) -> None:
     """Delete a custom field and all its values."""
     connection.execute("DELETE FROM custom_fields WHERE id = ?", (field_id,))
-    connection.commit()
+    commit(connection)
@@ -91,9 +91,9 @@ def run_self_check(*, connection=None) -> SelfCheckReport:
     try:
         active_connection = connection
         if active_connection is None:
-            from app.db.database import get_connection
+            from app.db.database import get_shared_connection
 
-            active_connection = get_connection(runtime_paths.db_path)
+            active_connection = get_shared_connection(runtime_paths.db_path)
         integrity_row = active_connection.execute("PRAGMA integrity_check").fetchone()
         integrity_status = str(integrity_row[0]) if integrity_row else "unknown"
         if integrity_status.lower() != "ok":
@@ -0,0 +1,155 @@
+"""Content-addressed cache of parsed import files."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, TypeVar
+
+from app.runtime_paths import get_runtime_paths
+from app.settings import load_settings
+
+# Bump whenever a parser's output for the same file changes.
+PARSER_VERSION = 1
+
+IMPORT_CACHE_DIR_NAME = "import_cache"
+
+T = TypeVar("T")
+
+_default_cache: "ImportParseCache | None" = None
+
+
+class ImportParseCache:
+    """Parsed results keyed by file content, parser version and a caller version token.
+
+    Entries are kept as pickles: hits always hand out fresh objects, and the
+    same bytes can be written under ``persist_dir`` so unchanged files skip
+    parsing across sessions too. Memory holds at most ``max_entries`` results
+    (least recently used evicted); disk keeps the newest ``max_disk_entries``.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 32,
+        persist_dir: Path | None = None,
+        max_disk_entries: int = 256,
+    ) -> None:
+        self._max_entries = max(int(max_entries), 1)
+        self._persist_dir = persist_dir
+        self._max_disk_entries = max(int(max_disk_entries), 1)
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        # (path, mtime_ns, size) -> content digest, so unchanged files are hashed once.
+        self._digests: dict[tuple[str, int, int], str] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_parse(self, path: str, kind: str, parse: Callable[[], T], *, version: str = "") -> T:
+        """Return the cached result for ``path`` or call ``parse`` and remember it."""
+        try:
+            digest = self._file_digest(path)
+        except OSError:
+            return parse()
+        key = hashlib.sha256(f"{digest}|{PARSER_VERSION}|{version}|{kind}".encode("utf-8")).hexdigest()
+
+        payload = self._entries.get(key)
+        if payload is not None:
+            self._entries.move_to_end(key)
+        else:
+            payload = self._read_persisted(key)
+            if payload is not None:
+                self._remember(key, payload)
+        if payload is not None:
+            try:
+                value = pickle.loads(payload)
+            except Exception:  # noqa: BLE001
+                self._forget(key)
+            else:
+                self.hits += 1
+                return value
+
+        self.misses += 1
+        value = parse()
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        self._remember(key, payload)
+        self._persist(key, payload)
+        return value
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._digests.clear()
+        if self._persist_dir is not None and self._persist_dir.is_dir():
+            for cached in self._persist_dir.glob("*.pickle"):
+                cached.unlink(missing_ok=True)
+
+    def _file_digest(self, path: str) -> str:
+        resolved = str(Path(path).resolve())
+        stat = os.stat(resolved)
+        stat_key = (resolved, stat.st_mtime_ns, stat.st_size)
+        digest = self._digests.get(stat_key)
+        if digest is None:
+            hasher = hashlib.sha256()
+            with open(resolved, "rb") as handle:
+                for chunk in iter(lambda: handle.read(1 << 20), b""):
+                    hasher.update(chunk)
+            digest = hasher.hexdigest()
+            self._digests[stat_key] = digest
+        return digest
+
+    def _remember(self, key: str, payload: bytes) -> None:
+        self._entries[key] = payload
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def _forget(self, key: str) -> None:
+        self._entries.pop(key, None)
+        if self._persist_dir is not None:
+            (self._persist_dir / f"{key}.pickle").unlink(missing_ok=True)
+
+    def _read_persisted(self, key: str) -> bytes | None:
+        if self._persist_dir is None:
+            return None
+        try:
+            return (self._persist_dir / f"{key}.pickle").read_bytes()
+        except OSError:
+            return None
+
+    def _persist(self, key: str, payload: bytes) -> None:
+        if self._persist_dir is None:
+            return
+        try:
+            self._persist_dir.mkdir(parents=True, exist_ok=True)
+            target = self._persist_dir / f"{key}.pickle"
+            temp = target.with_suffix(".tmp")
+            temp.write_bytes(payload)
+            temp.replace(target)
+            stored = sorted(self._persist_dir.glob("*.pickle"), key=lambda item: item.stat().st_mtime_ns)
+            for stale in stored[: max(len(stored) - self._max_disk_entries, 0)]:
+                stale.unlink(missing_ok=True)
+        except OSError:
+            return
+
+
+def get_import_parse_cache() -> ImportParseCache:
+    """Return the shared cache, configured from the ``import_cache`` setting."""
+    global _default_cache
+    if _default_cache is None:
+        settings = load_settings().get("import_cache")
+        settings = settings if isinstance(settings, dict) else {}
+        _default_cache = ImportParseCache(
+            max_entries=int(settings.get("max_entries", 32) or 32),
+            persist_dir=(
+                get_runtime_paths().profile_root / IMPORT_CACHE_DIR_NAME if settings.get("persist") else None
+            ),
+        )
+    return _default_cache
+
+
+def reset_import_parse_cache() -> None:
+    """Drop the shared cache so the next use re-reads settings."""
+    global _default_cache
+    _default_cache = None
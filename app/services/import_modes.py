@@ -5,10 +5,13 @@ from dataclasses import dataclass
 from typing import Callable, Iterable
 
 from app.db.repositories import PlayerRepository
+from app.db.unit_of_work import repo_session
 from app.services.import_xlsx import (
     ImportApplyReport,
+    PlayerIdentityIndex,
     PlayerMatchResolution,
     TableBlock,
+    _normalize_fio_key,
     _normalize_text,
     _parse_birth_value,
     _parse_fio,
@@ -62,6 +65,38 @@ def import_full(
     )
 
 
+def _new_player_entry(
+    *,
+    row: dict[str, object],
+    last_name: str,
+    first_name: str,
+    middle_name: str | None,
+    birth_value: str | None,
+) -> dict[str, object]:
+    coach_raw = row.get("coach")
+    coach = _normalize_text(coach_raw) if coach_raw is not None else None
+    return {
+        "last_name": last_name,
+        "first_name": first_name,
+        "middle_name": middle_name,
+        "birth_date": birth_value,
+        "gender": None,
+        "coach": coach if coach else None,
+        "club": None,
+        "notes": None,
+    }
+
+
+def _flush_new_players(
+    player_repo: PlayerRepository,
+    identity_index: PlayerIdentityIndex,
+    pending: list[dict[str, object]],
+) -> None:
+    for player_id, entry in zip(player_repo.create_many(pending), pending):
+        identity_index.add({"id": player_id, **entry})
+    pending.clear()
+
+
 def import_players_only(
     *,
     connection: sqlite3.Connection,
@@ -72,8 +107,13 @@ def import_players_only(
     created = 0
     existing = 0
     details: list[str] = []
+    # New players are written in batches; a batch is flushed before a row
+    # with the same FIO is matched, so repeated rows still see them.
+    pending: list[dict[str, object]] = []
+    pending_keys: set[str] = set()
 
-    with connection:
+    with repo_session(connection):
+        identity_index = PlayerIdentityIndex.from_repository(player_repo)
         for block in blocks:
             for row in block.rows:
                 fio = row.get("fio")
@@ -83,38 +123,36 @@ def import_players_only(
                 last_name, first_name, middle_name = _parse_fio(fio)
                 birth_date, birth_year = _parse_birth_value(row.get("birth"))
 
+                fio_key = _normalize_fio_key(fio)
+                if fio_key in pending_keys:
+                    _flush_new_players(player_repo, identity_index, pending)
+                    pending_keys.clear()
+
                 candidates = find_player_candidates(
                     fio=fio,
                     birth_date_or_year=birth_date or birth_year,
                     player_repo=player_repo,
+                    identity_index=identity_index,
                 )
 
                 if candidates:
                     existing += 1
                 else:
-                    coach_raw = row.get("coach")
-                    coach = _normalize_text(coach_raw) if coach_raw is not None else None
-                    connection.execute(
-                        """
-                        INSERT INTO players (
-                            last_name, first_name, middle_name,
-                            birth_date, gender, coach, club, notes
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        (
-                            last_name,
-                            first_name,
-                            middle_name,
-                            birth_date or birth_year,
-                            None,
-                            coach if coach else None,
-                            None,
-                            None,
-                        ),
+                    pending.append(
+                        _new_player_entry(
+                            row=row,
+                            last_name=last_name,
+                            first_name=first_name,
+                            middle_name=middle_name,
+                            birth_value=birth_date or birth_year,
+                        )
                     )
+                    pending_keys.add(fio_key)
                     created += 1
                     details.append(f"Создан: {last_name} {first_name}")
 
+        _flush_new_players(player_repo, identity_index, pending)
+
     return PlayersImportReport(created=created, existing=existing, details=details)
 
 
@@ -129,8 +167,12 @@ def import_update_players(
     updated = 0
     unchanged = 0
     details: list[str] = []
+    pending_creates: list[dict[str, object]] = []
+    pending_keys: set[str] = set()
+    pending_updates: dict[int, dict[str, object]] = {}
 
-    with connection:
+    with repo_session(connection):
+        identity_index = PlayerIdentityIndex.from_repository(player_repo)
         for block in blocks:
             for row in block.rows:
                 fio = row.get("fio")
@@ -140,38 +182,34 @@ def import_update_players(
                 last_name, first_name, middle_name = _parse_fio(fio)
                 birth_date, birth_year = _parse_birth_value(row.get("birth"))
 
+                fio_key = _normalize_fio_key(fio)
+                if fio_key in pending_keys:
+                    _flush_new_players(player_repo, identity_index, pending_creates)
+                    pending_keys.clear()
+
                 candidates = find_player_candidates(
                     fio=fio,
                     birth_date_or_year=birth_date or birth_year,
                     player_repo=player_repo,
+                    identity_index=identity_index,
                 )
 
                 if not candidates:
-                    coach_raw = row.get("coach")
-                    coach = _normalize_text(coach_raw) if coach_raw is not None else None
-                    connection.execute(
-                        """
-                        INSERT INTO players (
-                            last_name, first_name, middle_name,
-                            birth_date, gender, coach, club, notes
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        (
-                            last_name,
-                            first_name,
-                            middle_name,
-                            birth_date or birth_year,
-                            None,
-                            coach if coach else None,
-                            None,
-                            None,
-                        ),
+                    pending_creates.append(
+                        _new_player_entry(
+                            row=row,
+                            last_name=last_name,
+                            first_name=first_name,
+                            middle_name=middle_name,
+                            birth_value=birth_date or birth_year,
+                        )
                     )
+                    pending_keys.add(fio_key)
                     created += 1
                     details.append(f"Создан: {last_name} {first_name}")
                 else:
-                    player = candidates[0]
-                    player_id = int(player["id"])  # type: ignore[call-overload]
+                    player_id = int(candidates[0]["id"])  # type: ignore[call-overload]
+                    player = pending_updates.get(player_id, candidates[0])
 
                     player_coach = _normalize_text(player.get("coach"))
                     coach_raw = row.get("coach")
@@ -179,29 +217,24 @@ def import_update_players(
 
                     player_birth = _normalize_text(player.get("birth_date"))
 
-                    set_clauses: list[str] = []
-                    params: list[object] = []
+                    changes: dict[str, object] = {}
 
                     if not player_coach and row_coach:
-                        set_clauses.append("coach = ?")
-                        params.append(row_coach)
+                        changes["coach"] = row_coach
 
                     if not player_birth and (birth_date or birth_year):
-                        set_clauses.append("birth_date = ?")
-                        params.append(birth_date or birth_year)
-
-                    if set_clauses:
-                        set_clauses.append("updated_at = CURRENT_TIMESTAMP")
-                        params.append(player_id)
-                        connection.execute(
-                            f"UPDATE players SET {', '.join(set_clauses)} WHERE id = ?",
-                            params,
-                        )
+                        changes["birth_date"] = birth_date or birth_year
+
+                    if changes:
+                        pending_updates[player_id] = {**player, **changes}
                         updated += 1
                         details.append(f"Обновлен: {last_name} {first_name}")
                     else:
                         unchanged += 1
 
+        _flush_new_players(player_repo, identity_index, pending_creates)
+        player_repo.update_many(list(pending_updates.values()))
+
     return UpdatePlayersReport(
         created=created,
         updated=updated,
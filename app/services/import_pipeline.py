@@ -2,12 +2,15 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from app.services.import_cache import get_import_parse_cache
 from app.services.import_clipboard import parse_tables_from_clipboard_text
 from app.services.import_csv import parse_tables_from_csv
 from app.services.import_json import parse_tables_from_json
 from app.services.import_protocol_docx import parse_tables_from_docx
 from app.services.import_protocol_pdf import parse_tables_from_pdf
-from app.services.import_xlsx import TableBlock, parse_tables_from_xlsx_with_report
+from app.services.import_xlsx import TableBlock, import_profiles_version, parse_tables_from_xlsx_with_report
+
+SUPPORTED_IMPORT_EXTENSIONS = (".xlsx", ".csv", ".json", ".docx", ".pdf")
 
 
 def detect_format(path: str) -> str:
@@ -25,20 +28,33 @@ def detect_format(path: str) -> str:
 
 
 def parse_tables_from_file(path: str) -> list[TableBlock]:
-    """Dispatch to correct parser based on file extension."""
+    """Dispatch to correct parser based on file extension.
+
+    Results are served from the shared parse cache while the file is unchanged.
+    """
     fmt = detect_format(path)
+    if fmt == "xlsx":
+        return parse_tables_from_xlsx_with_report(path)
+    return get_import_parse_cache().get_or_parse(
+        path,
+        f"{fmt}_tables",
+        lambda: _parse_tables_uncached(path, fmt),
+        version=import_profiles_version(),
+    )
+
+
+def _parse_tables_uncached(path: str, fmt: str) -> list[TableBlock]:
     if fmt == "csv":
         return parse_tables_from_csv(path)
     if fmt == "json":
         return parse_tables_from_json(path)
     if fmt == "docx":
         return parse_tables_from_docx(path)
-    if fmt == "pdf":
-        return parse_tables_from_pdf(path)
-    return parse_tables_from_xlsx_with_report(path)
+    return parse_tables_from_pdf(path)
 
 
 __all__ = [
+    "SUPPORTED_IMPORT_EXTENSIONS",
     "detect_format",
     "parse_tables_from_clipboard_text",
     "parse_tables_from_file",
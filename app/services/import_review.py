@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from contextlib import ExitStack
 from dataclasses import dataclass
 from sqlite3 import Connection
 
@@ -8,12 +9,9 @@ from app.db.repositories import (
     ResultRepository,
     TournamentRepository,
 )
-from app.domain.rating import (
-    RatingImpactRow,
-    RatingSnapshotRow,
-    build_rating_impact,
-    build_rating_snapshot,
-)
+from app.domain.rating import RatingImpactRow, RatingSnapshotRow
+from app.domain.rating_engine import IncrementalRatingTable
+from app.services.rating_engine import RatingEngine
 
 
 @dataclass(frozen=True)
@@ -40,7 +38,16 @@ def build_import_rating_preview(
     connection: Connection,
     tournament_id: int,
     n_value: int = 3,
+    engine: RatingEngine | None = None,
+    include_tables: bool = True,
 ) -> ImportRatingImpactPreview:
+    """Preview how the tournament's current results would move the published rating.
+
+    With ``engine`` the scope's cached incremental table is reused and only the
+    tournament's players are re-ranked and then restored, so the preview can be
+    rebuilt after every edit. ``include_tables=False`` skips materialising the
+    full before/after tables when only the impact rows are shown.
+    """
     tournament_repo = TournamentRepository(connection)
     result_repo = ResultRepository(connection)
 
@@ -57,34 +64,28 @@ def build_import_rating_preview(
     if not current_rows:
         return _preview_unavailable("Предпросмотр влияния на рейтинг недоступен: в турнире пока нет результатов.")
 
-    baseline_rows = [
-        row
-        for row in result_repo.list_results_for_rating(
-            category_code=category_code if not is_adult_mode else None,
-            is_adult_mode=True if is_adult_mode else None,
-            statuses=[TOURNAMENT_STATUS_PUBLISHED],
+    filters = {
+        "category_code": category_code if not is_adult_mode else None,
+        "is_adult_mode": True if is_adult_mode else None,
+    }
+    if engine is not None:
+        rating_table = engine.table(n_value, **filters)
+    else:
+        rating_table = IncrementalRatingTable.from_results(
+            result_repo.list_results_for_rating(**filters, statuses=[TOURNAMENT_STATUS_PUBLISHED]),
+            n_value,
         )
-        if int(row.get("tournament_id") or 0) != tournament_id
-    ]
 
-    candidate_rows = list(baseline_rows)
     tournament_date = tournament.get("date")
-    for row in current_rows:
-        candidate_rows.append(
-            {
-                "player_id": row["player_id"],
-                "tournament_id": tournament_id,
-                "points_total": row["points_total"],
-                "tournament_date": tournament_date,
-                "last_name": row["last_name"],
-                "first_name": row["first_name"],
-                "middle_name": row["middle_name"],
-            }
+    with ExitStack() as previews:
+        if rating_table.players_in_tournament(tournament_id):
+            # An already published tournament is left out of the baseline.
+            previews.enter_context(rating_table.preview_tournament(tournament_id, tournament_date, []))
+        before_snapshot = rating_table.rows() if include_tables else []
+        impact_rows = previews.enter_context(
+            rating_table.preview_tournament(tournament_id, tournament_date, current_rows)
         )
-
-    before_snapshot = build_rating_snapshot(baseline_rows, n_value)
-    after_snapshot = build_rating_snapshot(candidate_rows, n_value)
-    impact_rows = build_rating_impact(before_snapshot, after_snapshot)
+        after_snapshot = rating_table.rows() if include_tables else []
 
     return ImportRatingImpactPreview(
         available=True,
@@ -0,0 +1,120 @@
+"""One import file read once for the lifetime of an import wizard."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+
+from openpyxl.utils.exceptions import InvalidFileException
+
+from app.services.import_pipeline import detect_format, parse_tables_from_file
+from app.services.import_xlsx import (
+    TableBlock,
+    _open_workbook_streaming,
+    iter_sheet_table_blocks,
+    map_table_block_rows,
+    split_table_block_preview,
+    table_block_preview_window,
+    validate_rows,
+)
+
+
+@dataclass(frozen=True)
+class WorkbookCells:
+    """Cell values of every sheet, read in one streaming pass."""
+
+    active_sheet: str
+    sheets: dict[str, list[tuple[object, ...]]]
+    widths: dict[str, int]
+
+    def sheet_rows(self, sheet_name: str) -> list[tuple[object, ...]]:
+        return self.sheets.get(sheet_name, self.sheets.get(self.active_sheet, []))
+
+    def sheet_width(self, sheet_name: str) -> int:
+        return self.widths.get(sheet_name, self.widths.get(self.active_sheet, 0))
+
+
+class ImportSession:
+    """Owns the parsed contents of one import file.
+
+    An XLSX file is read once into ``WorkbookCells``; block discovery,
+    previews and re-mapping with a different column mapping all work from
+    that copy. The cell dump lives only as long as the session and is kept
+    out of the shared parse cache, which holds parsed blocks, not workbooks.
+    Other formats are parsed once by ``parse_tables_from_file`` and have no
+    raw cells to preview or re-map.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.format = detect_format(path)
+        self._cells: WorkbookCells | None = None
+        self._blocks: list[TableBlock] | None = None
+
+    @property
+    def blocks(self) -> list[TableBlock]:
+        if self._blocks is None:
+            if self.format == "xlsx":
+                cells = self._workbook_cells()
+                self._blocks = [
+                    block
+                    for sheet_name, rows in cells.sheets.items()
+                    for block in iter_sheet_table_blocks(sheet_name, rows)
+                ]
+            else:
+                self._blocks = parse_tables_from_file(self.path)
+        return list(self._blocks)
+
+    def preview(self, block: TableBlock, preview_rows: int = 8) -> tuple[list[str], list[list[object]]]:
+        """Header labels and the first ``preview_rows`` raw rows of a block."""
+        if self.format != "xlsx":
+            return [], []
+        cells = self._workbook_cells()
+        header_row, last_row = table_block_preview_window(block, preview_rows)
+        width = cells.sheet_width(block.sheet_name)
+        window = [
+            list(row) + [None] * (width - len(row))
+            for row in cells.sheet_rows(block.sheet_name)[header_row - 1 : last_row]
+        ]
+        return split_table_block_preview(window)
+
+    def remap(self, block: TableBlock, column_mapping: dict[str, str]) -> TableBlock:
+        """Rebuild a block's rows with an explicit internal key -> header label mapping."""
+        headers, data_rows = self.preview(block, preview_rows=max(block.end_row - block.start_row, 1))
+        rows = map_table_block_rows(headers, data_rows, column_mapping)
+        return replace(
+            block,
+            rows=rows,
+            warnings=self.validate(rows),
+            errors=[],
+            needs_mapping=False,
+            confidence=1.0,
+            missing_required_columns=[],
+        )
+
+    @staticmethod
+    def validate(rows: list[dict[str, object]]) -> list[str]:
+        return validate_rows(rows)
+
+    def _workbook_cells(self) -> WorkbookCells:
+        if self._cells is None:
+            self._cells = read_workbook_cells(self.path)
+        return self._cells
+
+
+def read_workbook_cells(path: str) -> WorkbookCells:
+    """Read every sheet's cell values; unreadable files give an empty workbook."""
+    try:
+        workbook = _open_workbook_streaming(path)
+    except (InvalidFileException, OSError):
+        return WorkbookCells(active_sheet="", sheets={}, widths={})
+
+    try:
+        sheets: dict[str, list[tuple[object, ...]]] = {}
+        widths: dict[str, int] = {}
+        for sheet in workbook.worksheets:
+            rows = list(sheet.iter_rows(values_only=True))
+            sheets[sheet.title] = rows
+            widths[sheet.title] = max([sheet.max_column or 0, *(len(row) for row in rows)])
+        return WorkbookCells(active_sheet=workbook.active.title, sheets=sheets, widths=widths)
+    finally:
+        workbook.close()
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, replace
 from decimal import Decimal, InvalidOperation
 from datetime import date, datetime
+import hashlib
 import json
+import multiprocessing
+import os
 from pathlib import Path
-from typing import Callable, Iterable, TypedDict, cast
+from typing import Callable, Iterable, Iterator, Sequence, TypedDict, cast
 from uuid import uuid4
 
 from openpyxl import load_workbook
@@ -17,8 +21,11 @@ from app.db.repositories import (
     ResultRepository,
     TournamentRepository,
 )
-from app.domain.points import points_for_place
+from app.db.unit_of_work import repo_session
+from app.domain.identity import birth_year_of, normalize_fio_key, player_fio_key
 from app.runtime_paths import get_runtime_paths
+from app.services.import_cache import get_import_parse_cache
+from app.services.point_schemes import resolve_point_scheme
 
 
 class ImportRow(TypedDict, total=False):
@@ -113,30 +120,37 @@ def _normalize_header(value: object) -> str:
     return "".join(ch for ch in text if ch.isalnum())
 
 
-def detect_headers(row_values: Iterable[object]) -> dict[str, int]:
-    synonyms = {
-        "fio": ["фио", "игрок", "фамилияимя", "фамилия", "имя"],
-        "birth": ["др", "датарождения", "годрождения", "рождения"],
-        "coach": ["тренер", "coach"],
-        "place": ["место", "place", "позиция"],
-        "score_set": ["набор", "очки", "наборочков", "score", "результат"],
-        "score_sector20": ["с20", "sector20", "сектор20", "20"],
-        "score_big_round": ["бр", "biground", "большойраунд", "br"],
-    }
-    normalized_synonyms = {
-        key: {_normalize_header(item) for item in values}
-        for key, values in synonyms.items()
-    }
+_HEADER_SYNONYMS = {
+    "fio": ["фио", "игрок", "фамилияимя", "фамилия", "имя"],
+    "birth": ["др", "датарождения", "годрождения", "рождения"],
+    "coach": ["тренер", "coach"],
+    "place": ["место", "place", "позиция"],
+    "score_set": ["набор", "очки", "наборочков", "score", "результат"],
+    "score_sector20": ["с20", "sector20", "сектор20", "20"],
+    "score_big_round": ["бр", "biground", "большойраунд", "br"],
+}
+
+
+def _header_keys_by_alias() -> dict[str, str]:
+    """Normalized alias -> field; the first field listing an alias wins."""
+    keys_by_alias: dict[str, str] = {}
+    for key, aliases in _HEADER_SYNONYMS.items():
+        for alias in aliases:
+            keys_by_alias.setdefault(_normalize_header(alias), key)
+    return keys_by_alias
+
+
+_HEADER_KEYS_BY_ALIAS = _header_keys_by_alias()
+
 
+def detect_headers(row_values: Iterable[object]) -> dict[str, int]:
     mapping: dict[str, int] = {}
     for idx, cell_value in enumerate(row_values):
-        normalized = _normalize_header(cell_value)
-        if not normalized:
+        if cell_value is None:
             continue
-        for key, options in normalized_synonyms.items():
-            if normalized in options:
-                mapping[key] = idx
-                break
+        key = _HEADER_KEYS_BY_ALIAS.get(_normalize_header(cell_value))
+        if key is not None:
+            mapping[key] = idx
     return mapping
 
 
@@ -179,6 +193,32 @@ def _row_has_total(row_values: Iterable[object]) -> bool:
     return False
 
 
+def _empty_import_row() -> dict[str, object]:
+    return {
+        "fio": None,
+        "birth": None,
+        "coach": None,
+        "place": None,
+        "score_set": None,
+        "score_sector20": None,
+        "score_big_round": None,
+    }
+
+
+def _import_row_from_values(row_values: list[object], header_mapping: dict[str, int]) -> dict[str, object]:
+    row_data = _empty_import_row()
+    for key in row_data:
+        column_index = header_mapping.get(key)
+        if column_index is not None and column_index < len(row_values):
+            row_data[key] = row_values[column_index]
+    return row_data
+
+
+def _open_workbook_streaming(path: str):
+    """Open a workbook for one forward pass; the caller must ``close()`` it."""
+    return load_workbook(path, read_only=True, data_only=True)
+
+
 def _parse_first_table(path: str) -> tuple[
     list[str],
     list[dict[str, object]],
@@ -186,42 +226,32 @@ def _parse_first_table(path: str) -> tuple[
     bool,
 ]:
     try:
-        workbook = load_workbook(path, data_only=True)
+        workbook = _open_workbook_streaming(path)
     except (InvalidFileException, OSError):
         return [], [], {}, False
-    sheet = workbook.active
 
     header_mapping: dict[str, int] = {}
     header_labels: list[str] = []
     rows: list[dict[str, object]] = []
     header_found = False
 
-    for row in sheet.iter_rows(values_only=True):
-        row_values = list(row)
-        if not header_found:
-            candidate_mapping = detect_headers(row_values)
-            if candidate_mapping.get("fio") is not None:
-                header_mapping = candidate_mapping
-                header_labels = [str(value).strip() if value is not None else "" for value in row_values]
-                header_found = True
-            continue
+    try:
+        for row in workbook.active.iter_rows(values_only=True):
+            row_values = list(row)
+            if not header_found:
+                candidate_mapping = detect_headers(row_values)
+                if candidate_mapping.get("fio") is not None:
+                    header_mapping = candidate_mapping
+                    header_labels = [str(value).strip() if value is not None else "" for value in row_values]
+                    header_found = True
+                continue
 
-        if _is_row_empty(row_values) or _row_has_total(row_values):
-            break
-
-        row_data: dict[str, object] = {
-            "fio": None,
-            "birth": None,
-            "coach": None,
-            "place": None,
-            "score_set": None,
-            "score_sector20": None,
-            "score_big_round": None,
-        }
-        for key in row_data:
-            if key in header_mapping:
-                row_data[key] = row_values[header_mapping[key]]
-        rows.append(row_data)
+            if _is_row_empty(row_values) or _row_has_total(row_values):
+                break
+
+            rows.append(_import_row_from_values(row_values, header_mapping))
+    finally:
+        workbook.close()
 
     return header_labels, rows, header_mapping, header_found
 
@@ -269,16 +299,22 @@ def save_import_profile(profile: ImportProfile | dict[str, object]) -> None:
         ], ensure_ascii=False, indent=2),
         encoding="utf-8",
     )
+    _invalidate_import_profile_matcher()
+
+
+def import_profiles_version() -> str:
+    """Digest of the stored import profiles; changes whenever a profile is saved or deleted."""
+    return get_import_profile_matcher().version
 
 
 def list_import_profiles() -> list[ImportProfile]:
-    path = _profile_storage_path()
-    if not path.exists():
-        return []
+    return list(get_import_profile_matcher().profiles)
 
+
+def _parse_import_profiles(text: str) -> list[ImportProfile]:
     try:
-        raw = json.loads(path.read_text(encoding="utf-8"))
-    except (OSError, json.JSONDecodeError):
+        raw = json.loads(text)
+    except json.JSONDecodeError:
         return []
 
     profiles: list[ImportProfile] = []
@@ -310,6 +346,86 @@ def list_import_profiles() -> list[ImportProfile]:
     return profiles
 
 
+class ImportProfileMatcher:
+    """Import profiles compiled for scoring header rows.
+
+    Every normalized alias points at the profiles (and the field within each
+    profile) it maps to, so one pass over a header row scores all profiles
+    with the same rules as ``apply_profile_to_headers``.
+    """
+
+    def __init__(self, profiles: Iterable[ImportProfile], *, version: str = "") -> None:
+        self.profiles: tuple[ImportProfile, ...] = tuple(profiles)
+        self.version = version
+        self._required = [frozenset(profile.required_columns) for profile in self.profiles]
+        # Normalized alias -> (profile index, field); within a profile the first field listing the alias wins.
+        by_alias: dict[str, dict[int, str]] = {}
+        for index, profile in enumerate(self.profiles):
+            for internal_key, aliases in profile.header_aliases.items():
+                for alias in aliases:
+                    by_alias.setdefault(_normalize_header(alias), {}).setdefault(index, internal_key)
+        by_alias.pop("", None)
+        self._candidates = {alias: tuple(fields.items()) for alias, fields in by_alias.items()}
+
+    def score(self, headers_row: Iterable[object]) -> list[tuple[dict[str, str], float]]:
+        """``apply_profile_to_headers`` for every profile, in profile order."""
+        mappings: list[dict[str, str]] = [{} for _ in self.profiles]
+        matched = [0] * len(self.profiles)
+        for value in headers_row:
+            header = str(value).strip() if value is not None else ""
+            for index, internal_key in self._candidates.get(_normalize_header(header), ()):
+                mappings[index][header] = internal_key
+                if internal_key in self._required[index]:
+                    matched[index] += 1
+        return [
+            (mapping, matched[index] / len(self._required[index]) if self._required[index] else 0.0)
+            for index, mapping in enumerate(mappings)
+        ]
+
+    def best_match(
+        self,
+        headers_row: Iterable[object],
+        *,
+        above: float,
+    ) -> tuple[ImportProfile, dict[str, str], float] | None:
+        """The first profile with the highest confidence strictly above ``above``."""
+        best: tuple[ImportProfile, dict[str, str], float] | None = None
+        for profile, (mapping, confidence) in zip(self.profiles, self.score(headers_row)):
+            if confidence > (above if best is None else best[2]):
+                best = (profile, mapping, confidence)
+        return best
+
+
+# Profiles path -> (file stamp, matcher); reset whenever profiles are written.
+_profile_matchers: dict[str, tuple[tuple[int, int] | None, ImportProfileMatcher]] = {}
+
+
+def get_import_profile_matcher() -> ImportProfileMatcher:
+    """Return the compiled profiles, re-reading the file only after it changed."""
+    path = _profile_storage_path()
+    try:
+        stat = path.stat()
+        stamp: tuple[int, int] | None = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        stamp = None
+    cached = _profile_matchers.get(str(path))
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    try:
+        payload = path.read_bytes() if stamp is not None else b""
+    except OSError:
+        payload = b""
+    matcher = ImportProfileMatcher(
+        _parse_import_profiles(payload.decode("utf-8", errors="replace")) if payload else [],
+        version=hashlib.sha256(payload).hexdigest() if payload else "",
+    )
+    _profile_matchers[str(path)] = (stamp, matcher)
+    return matcher
+
+
+def _invalidate_import_profile_matcher() -> None:
+    _profile_matchers.clear()
 
 
 def delete_import_profile(name: str) -> None:
@@ -330,6 +446,9 @@ def delete_import_profile(name: str) -> None:
         ], ensure_ascii=False, indent=2),
         encoding="utf-8",
     )
+    _invalidate_import_profile_matcher()
+
+
 def apply_profile_to_headers(
     profile: ImportProfile | dict[str, object],
     headers_row: Iterable[object],
@@ -365,68 +484,61 @@ def apply_profile_to_headers(
     return mapping, confidence
 
 
-def _rows_for_table(
-    sheet,
-    start_index: int,
-    header_mapping: dict[str, int],
-    max_col: int,
-) -> tuple[list[dict[str, object]], int]:
-    rows: list[dict[str, object]] = []
-    idx = start_index
-    sheet_rows = list(sheet.iter_rows(values_only=True, max_col=max_col))
-    while idx < len(sheet_rows):
-        row_values = list(sheet_rows[idx])
-        if _is_row_empty(row_values) or _row_has_total(row_values):
-            break
-
-        if detect_headers(row_values).get("fio") is not None:
-            break
-
-        row_data: dict[str, object] = {
-            "fio": None,
-            "birth": None,
-            "coach": None,
-            "place": None,
-            "score_set": None,
-            "score_sector20": None,
-            "score_big_round": None,
-        }
-        for key in row_data:
-            if key in header_mapping:
-                row_data[key] = row_values[header_mapping[key]]
-        rows.append(row_data)
-        idx += 1
-
-    return rows, idx
-
-
 def read_table_block_preview(
     path: str,
     block: TableBlock,
     preview_rows: int = 8,
+) -> tuple[list[str], list[list[object]]]:
+    return get_import_parse_cache().get_or_parse(
+        path,
+        f"xlsx_preview:{block.sheet_name}:{block.start_row}:{block.end_row}:{preview_rows}",
+        lambda: _read_table_block_preview(path, block, preview_rows),
+    )
+
+
+def _read_table_block_preview(
+    path: str,
+    block: TableBlock,
+    preview_rows: int,
 ) -> tuple[list[str], list[list[object]]]:
     try:
-        workbook = load_workbook(path, data_only=True)
+        workbook = _open_workbook_streaming(path)
     except (InvalidFileException, OSError):
         return [], []
 
-    sheet = workbook[block.sheet_name] if block.sheet_name in workbook.sheetnames else workbook.active
-    max_col = max(sheet.max_column, 1)
-    sheet_rows = list(sheet.iter_rows(values_only=True, max_col=max_col))
+    try:
+        sheet = workbook[block.sheet_name] if block.sheet_name in workbook.sheetnames else workbook.active
+        header_row, last_row = table_block_preview_window(block, preview_rows)
+        sheet_rows = [
+            list(row)
+            for row in sheet.iter_rows(
+                min_row=header_row,
+                max_row=last_row,
+                max_col=sheet.max_column,
+                values_only=True,
+            )
+        ]
+    finally:
+        workbook.close()
+
+    return split_table_block_preview(sheet_rows)
 
-    header_index = max(block.start_row - 1, 0)
-    if header_index >= len(sheet_rows):
-        return [], []
 
-    headers = [str(value).strip() if value is not None else "" for value in list(sheet_rows[header_index])]
-    data: list[list[object]] = []
-    start_data = header_index + 1
-    end_data = min(max(block.end_row - 1, start_data), len(sheet_rows) - 1)
-    for idx in range(start_data, end_data + 1):
-        data.append(list(sheet_rows[idx]))
-        if len(data) >= max(preview_rows, 1):
-            break
-    return headers, data
+def table_block_preview_window(block: TableBlock, preview_rows: int) -> tuple[int, int]:
+    """Sheet rows (1-based, inclusive) holding a block's header and its first ``preview_rows`` rows."""
+    header_row = max(block.start_row, 1)
+    last_row = max(block.end_row, header_row + 1)
+    return header_row, min(last_row, header_row + max(preview_rows, 1))
+
+
+def split_table_block_preview(sheet_rows: list[list[object]]) -> tuple[list[str], list[list[object]]]:
+    """Pad a block's raw rows to one width and split off the header labels."""
+    if not sheet_rows:
+        return [], []
+    width = max(len(row) for row in sheet_rows)
+    sheet_rows = [row + [None] * (width - len(row)) for row in sheet_rows]
+    headers = [str(value).strip() if value is not None else "" for value in sheet_rows[0]]
+    return headers, sheet_rows[1:]
 
 
 def parse_table_block_with_mapping(
@@ -439,21 +551,22 @@ def parse_table_block_with_mapping(
         block,
         preview_rows=max(block.end_row - block.start_row, 1),
     )
+    return map_table_block_rows(headers, data_rows, column_mapping)
+
+
+def map_table_block_rows(
+    headers: list[str],
+    data_rows: list[list[object]],
+    column_mapping: dict[str, str],
+) -> list[dict[str, object]]:
+    """Build import rows from raw block rows using an internal key -> header label mapping."""
     if not headers:
         return []
 
     header_to_index = {header: idx for idx, header in enumerate(headers)}
     rows: list[dict[str, object]] = []
     for values in data_rows:
-        row_data: dict[str, object] = {
-            "fio": None,
-            "birth": None,
-            "coach": None,
-            "place": None,
-            "score_set": None,
-            "score_sector20": None,
-            "score_big_round": None,
-        }
+        row_data = _empty_import_row()
         for internal_key, header in column_mapping.items():
             if internal_key not in SUPPORTED_MAPPING_KEYS:
                 continue
@@ -469,70 +582,128 @@ def parse_table_block_with_mapping(
 
 
 def parse_tables_from_xlsx_with_report(path: str) -> list[TableBlock]:
+    return get_import_parse_cache().get_or_parse(
+        path,
+        "xlsx_tables",
+        lambda: list(iter_tables_from_xlsx(path)),
+        version=import_profiles_version(),
+    )
+
+
+def iter_tables_from_xlsx(path: str) -> Iterator[TableBlock]:
+    """Yield the workbook's table blocks in one forward pass over each sheet.
+
+    The workbook is opened read-only, so rows are streamed from the file and
+    a block is yielded as soon as its terminating row (empty, "итого" or a
+    new header) is read. The terminating row itself is consumed.
+    """
     try:
-        workbook = load_workbook(path, data_only=True)
+        workbook = _open_workbook_streaming(path)
     except (InvalidFileException, OSError):
-        return []
+        return
 
-    blocks: list[TableBlock] = []
-    for sheet in workbook.worksheets:
-        max_col = max(sheet.max_column, 1)
-        sheet_rows = list(sheet.iter_rows(values_only=True, max_col=max_col))
-        idx = 0
-        while idx < len(sheet_rows):
-            row_values = list(sheet_rows[idx])
-            header_mapping = detect_headers(row_values)
-            if header_mapping.get("fio") is None:
-                idx += 1
-                continue
+    try:
+        for sheet in workbook.worksheets:
+            yield from iter_sheet_table_blocks(sheet.title, sheet.iter_rows(values_only=True))
+    finally:
+        workbook.close()
 
-            header_labels = [str(value).strip() if value is not None else "" for value in row_values]
-            rows, end_idx = _rows_for_table(sheet, idx + 1, header_mapping, max_col)
-            warnings = validate_rows(rows)
-            missing_required, needs_mapping, confidence = _calculate_mapping_stats(header_mapping)
-
-            if (confidence < 1.0 or needs_mapping) and header_labels:
-                for profile in list_import_profiles():
-                    profile_mapping, profile_confidence = apply_profile_to_headers(profile, header_labels)
-                    if profile_confidence > confidence:
-                        confidence = profile_confidence
-                        needs_mapping = confidence < 1.0
-                        missing_required = [
-                            _default_required_fields().get(key, key)
-                            for key in profile.required_columns
-                            if key not in profile_mapping.values()
-                        ]
-
-            source_to_internal = {
-                header_labels[column_idx]: key
-                for key, column_idx in header_mapping.items()
-                if 0 <= column_idx < len(header_labels)
-            }
 
-            errors = []
-            for label in missing_required:
-                errors.append(f"Не найден столбец {label}.")
-
-            blocks.append(
-                TableBlock(
-                    sheet_name=sheet.title,
-                    start_row=idx + 1,
-                    end_row=end_idx,
-                    header_mapping=source_to_internal,
-                    rows=rows,
-                    warnings=warnings,
-                    errors=errors,
-                    needs_mapping=needs_mapping,
-                    confidence=confidence,
-                    missing_required_columns=missing_required,
-                )
-            )
-            idx = end_idx + 1
+def iter_sheet_table_blocks(sheet_name: str, sheet_rows: Iterable[Sequence[object]]) -> Iterator[TableBlock]:
+    """Detect table blocks in one sheet's rows (cell values, first row is row 1)."""
+    header_labels: list[str] = []
+    header_mapping: dict[str, int] = {}
+    start_row = 0
+    rows: list[dict[str, object]] = []
+    in_table = False
+    row_number = 0
+    for row_number, row in enumerate(sheet_rows, start=1):
+        row_values = list(row)
+        if not in_table:
+            candidate_mapping = detect_headers(row_values)
+            if candidate_mapping.get("fio") is not None:
+                header_mapping = candidate_mapping
+                header_labels = [str(value).strip() if value is not None else "" for value in row_values]
+                start_row = row_number
+                rows = []
+                in_table = True
+            continue
+
+        if (
+            _is_row_empty(row_values)
+            or _row_has_total(row_values)
+            or detect_headers(row_values).get("fio") is not None
+        ):
+            in_table = False
+            yield _build_table_block(sheet_name, start_row, row_number - 1, header_labels, header_mapping, rows)
+            continue
+        rows.append(_import_row_from_values(row_values, header_mapping))
+
+    if in_table:
+        yield _build_table_block(sheet_name, start_row, row_number, header_labels, header_mapping, rows)
+
+
+def _build_table_block(
+    sheet_name: str,
+    start_row: int,
+    end_row: int,
+    header_labels: list[str],
+    header_mapping: dict[str, int],
+    rows: list[dict[str, object]],
+) -> TableBlock:
+    warnings = validate_rows(rows)
+    missing_required, needs_mapping, confidence = _calculate_mapping_stats(header_mapping)
+
+    if (confidence < 1.0 or needs_mapping) and header_labels:
+        match = get_import_profile_matcher().best_match(header_labels, above=confidence)
+        if match is not None:
+            profile, profile_mapping, confidence = match
+            needs_mapping = confidence < 1.0
+            missing_required = [
+                _default_required_fields().get(key, key)
+                for key in profile.required_columns
+                if key not in profile_mapping.values()
+            ]
+
+    source_to_internal = {
+        header_labels[column_idx]: key
+        for key, column_idx in header_mapping.items()
+        if 0 <= column_idx < len(header_labels)
+    }
+
+    errors = []
+    for label in missing_required:
+        errors.append(f"Не найден столбец {label}.")
 
-    return blocks
+    return TableBlock(
+        sheet_name=sheet_name,
+        start_row=start_row,
+        end_row=end_row,
+        header_mapping=source_to_internal,
+        rows=rows,
+        warnings=warnings,
+        errors=errors,
+        needs_mapping=needs_mapping,
+        confidence=confidence,
+        missing_required_columns=missing_required,
+    )
 
 
-def import_batch_from_folder(folder: str, recursive: bool = False) -> dict[str, object]:
+def import_batch_from_folder(
+    folder: str,
+    recursive: bool = False,
+    *,
+    workers: int | None = 1,
+    extensions: Iterable[str] = (".xlsx",),
+    progress: Callable[[int, int], None] | None = None,
+) -> dict[str, object]:
+    """Parse every protocol file in ``folder`` and report per-file status.
+
+    ``workers`` > 1 parses files in a process pool (``None`` uses every
+    core). Items keep the sorted file order regardless of completion order,
+    and a failing file, or a crashed worker, only marks its own item.
+    ``progress`` is called with ``(done, total)`` after each file.
+    """
     base_path = Path(folder)
     if not base_path.exists():
         return {
@@ -561,64 +732,60 @@ def import_batch_from_folder(folder: str, recursive: bool = False) -> dict[str,
             ],
         }
 
-    pattern = "**/*.xlsx" if recursive else "*.xlsx"
-    files = sorted(base_path.glob(pattern))
+    suffixes = {suffix.lower() for suffix in extensions}
+    candidates = base_path.rglob("*") if recursive else base_path.glob("*")
+    files = sorted(path for path in candidates if path.is_file() and path.suffix.lower() in suffixes)
 
+    worker_count = (os.cpu_count() or 1) if workers is None else max(int(workers), 1)
+    worker_count = min(worker_count, len(files))
     items: list[dict[str, object]] = []
-    success = 0
-    error = 0
-
-    for file_path in files:
-        try:
-            tables = parse_tables_from_xlsx_with_report(str(file_path))
-            if not tables:
-                items.append(
-                    {
-                        "path": str(file_path),
-                        "status": "error",
-                        "message": "Не удалось распознать таблицы.",
-                        "tables": 0,
-                    }
-                )
-                error += 1
-                continue
-
-            item_status = "ok"
-            message = "OK"
-            if all((not block.rows) or block.errors for block in tables):
-                item_status = "error"
-                message = "; ".join(block.errors[0] for block in tables if block.errors) or "Нет данных."
-
-            items.append(
-                {
-                    "path": str(file_path),
-                    "status": item_status,
-                    "message": message,
-                    "tables": len(tables),
-                }
-            )
-            if item_status == "ok":
-                success += 1
-            else:
-                error += 1
-        except Exception as exc:  # noqa: BLE001
-            items.append(
-                {
-                    "path": str(file_path),
-                    "status": "error",
-                    "message": str(exc),
-                    "tables": 0,
-                }
-            )
-            error += 1
-
+    if worker_count <= 1:
+        for file_path in files:
+            items.append(_batch_import_item(str(file_path)))
+            if progress is not None:
+                progress(len(items), len(files))
+    else:
+        # Spawned workers never inherit the Qt/SQLite state of a forked GUI process.
+        spawn_context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=worker_count, mp_context=spawn_context) as executor:
+            futures = [executor.submit(_batch_import_item, str(file_path)) for file_path in files]
+            for file_path, future in zip(files, futures):
+                try:
+                    items.append(future.result())
+                except Exception as exc:  # noqa: BLE001
+                    items.append(_batch_error_item(str(file_path), str(exc) or type(exc).__name__))
+                if progress is not None:
+                    progress(len(items), len(files))
+
+    success = sum(1 for item in items if item["status"] == "ok")
     return {
         "success": success,
-        "error": error,
+        "error": len(items) - success,
         "items": items,
     }
 
 
+def _batch_import_item(path: str) -> dict[str, object]:
+    """Parse one batch file; runs in a pool worker, so it returns only a summary."""
+    from app.services.import_pipeline import parse_tables_from_file
+
+    try:
+        tables = parse_tables_from_file(path)
+    except Exception as exc:  # noqa: BLE001
+        return _batch_error_item(path, str(exc))
+    if not tables:
+        return _batch_error_item(path, "Не удалось распознать таблицы.")
+
+    if all((not block.rows) or block.errors for block in tables):
+        message = "; ".join(block.errors[0] for block in tables if block.errors) or "Нет данных."
+        return {"path": path, "status": "error", "message": message, "tables": len(tables)}
+    return {"path": path, "status": "ok", "message": "OK", "tables": len(tables)}
+
+
+def _batch_error_item(path: str, message: str) -> dict[str, object]:
+    return {"path": path, "status": "error", "message": message, "tables": 0}
+
+
 def parse_first_table_from_xlsx(path: str) -> tuple[list[str], list[dict[str, object]]]:
     header_labels, rows, _, _ = _parse_first_table(path)
     return header_labels, rows
@@ -691,17 +858,11 @@ def _normalize_text(value: object | None) -> str:
 
 
 def _normalize_fio_key(value: object | None) -> str:
-    text = _normalize_text(value).lower().replace("ё", "е")
-    return " ".join(text.split())
+    return normalize_fio_key(value)
 
 
 def _birth_year_from_value(value: object | None) -> str | None:
-    if value is None:
-        return None
-    text = _normalize_text(value)
-    if len(text) >= 4 and text[:4].isdigit():
-        return text[:4]
-    return None
+    return birth_year_of(value)
 
 
 def _parse_fio(value: object) -> tuple[str, str, str | None]:
@@ -775,47 +936,95 @@ def _player_match_key(fio: object | None, birth_date_or_year: object | None) ->
     return f"{_normalize_fio_key(fio)}|{birth_token}"
 
 
+def _player_fio_key(player: dict[str, object]) -> str:
+    stored = player.get("fio_key")
+    if isinstance(stored, str):
+        return stored
+    return player_fio_key(player.get("last_name"), player.get("first_name"), player.get("middle_name"))
+
+
+def _player_birth_year(player: dict[str, object]) -> str | None:
+    # A stored fio_key means PlayerRepository wrote the row, so birth_year is current too.
+    if player.get("fio_key") is not None:
+        stored = player.get("birth_year")
+        return str(stored) if stored else None
+    return birth_year_of(player.get("birth_date"))
+
+
+class PlayerIdentityIndex:
+    """In-memory FIO/birth lookup over all players, built once per import session.
+
+    Players are bucketed by normalized FIO key, with secondary buckets by
+    (FIO key, birth date) and (FIO key, birth year). Newly created players
+    must be registered with add() so later rows of the same session see them.
+    """
+
+    def __init__(self, players: Iterable[dict[str, object]] = ()) -> None:
+        self._order: dict[int, int] = {}
+        self._by_fio: dict[str, list[dict[str, object]]] = {}
+        self._by_birth_date: dict[tuple[str, str], list[dict[str, object]]] = {}
+        self._by_birth_year: dict[tuple[str, str], list[dict[str, object]]] = {}
+        for player in players:
+            self.add(player)
+
+    @classmethod
+    def from_repository(cls, player_repo: PlayerRepository) -> "PlayerIdentityIndex":
+        return cls(player_repo.list())
+
+    def add(self, player: dict[str, object]) -> None:
+        fio_key = _player_fio_key(player)
+        if not fio_key:
+            return
+        self._order[id(player)] = len(self._order)
+        self._by_fio.setdefault(fio_key, []).append(player)
+        birth_text = _normalize_text(player.get("birth_date"))
+        if birth_text:
+            self._by_birth_date.setdefault((fio_key, birth_text), []).append(player)
+        birth_year = _player_birth_year(player)
+        if birth_year:
+            self._by_birth_year.setdefault((fio_key, birth_year), []).append(player)
+
+    def candidates(
+        self,
+        fio: object,
+        birth_date_or_year: object | None = None,
+    ) -> list[dict[str, object]]:
+        """Return players matching ``fio`` (and birth, if given) in insertion order."""
+        fio_key = _normalize_fio_key(fio)
+        if not fio_key:
+            return []
+        input_birth_date, input_birth_year = _parse_birth_value(birth_date_or_year)
+        if not (input_birth_date or input_birth_year):
+            return list(self._by_fio.get(fio_key, []))
+
+        matched: dict[int, dict[str, object]] = {}
+        if input_birth_date:
+            for player in self._by_birth_date.get((fio_key, input_birth_date), []):
+                matched[id(player)] = player
+        if input_birth_year:
+            for player in self._by_birth_year.get((fio_key, input_birth_year), []):
+                matched[id(player)] = player
+        return sorted(matched.values(), key=lambda player: self._order[id(player)])
+
+    def groups(self) -> dict[str, list[dict[str, object]]]:
+        """Return players grouped by normalized FIO key."""
+        return {key: list(players) for key, players in self._by_fio.items()}
+
+
 def find_player_candidates(
     fio: object,
     birth_date_or_year: object | None,
     *,
     player_repo: PlayerRepository,
+    identity_index: PlayerIdentityIndex | None = None,
 ) -> list[dict[str, object]]:
-    fio_key = _normalize_fio_key(fio)
-    if not fio_key:
-        return []
-
-    input_birth_date, input_birth_year = _parse_birth_value(birth_date_or_year)
-    candidates: list[dict[str, object]] = []
-    for player in player_repo.list():
-        player_fio = _normalize_fio_key(
-            " ".join(
-                part for part in (
-                    player.get("last_name"),
-                    player.get("first_name"),
-                    player.get("middle_name"),
-                ) if part
-            )
-        )
-        if player_fio != fio_key:
-            continue
-
-        if input_birth_date or input_birth_year:
-            player_birth_raw = player.get("birth_date")
-            player_birth_text = _normalize_text(player_birth_raw)
-            player_birth_year = _birth_year_from_value(player_birth_raw)
-            has_birth_match = False
-
-            if input_birth_date and player_birth_text == input_birth_date:
-                has_birth_match = True
-            if input_birth_year and player_birth_year == input_birth_year:
-                has_birth_match = True
-
-            if not has_birth_match:
-                continue
-
-        candidates.append(player)
-    return candidates
+    if identity_index is None:
+        # One-off lookups seek the persisted fio_key index instead of loading all players.
+        fio_key = _normalize_fio_key(fio)
+        if not fio_key:
+            return []
+        identity_index = PlayerIdentityIndex(player_repo.list_by_fio_key(fio_key))
+    return identity_index.candidates(fio, birth_date_or_year)
 
 
 def _parse_integer_value(value: object | None) -> tuple[int | None, bool]:
@@ -848,58 +1057,42 @@ def parse_int(value: object | None, warnings: list[str] | None = None) -> int |
     return parsed
 
 
-def import_tournament_rows(
-    *,
-    connection,
-    rows: Iterable[dict[str, object]],
-    tournament_name: str,
-    tournament_date: str | None,
-    category_code: str | None,
-    is_adult_mode: bool = False,
-    source_files: list[str] | None = None,
-    player_match_resolver: Callable[[str, str | None, list[dict[str, object]]], PlayerMatchResolution | None] | None = None,
-    operation_group_id: str | None = None,
-) -> ImportApplyReport:
-    from app.services.restore_points import create_restore_point
+@dataclass(frozen=True)
+class _RowPlayerMatch:
+    """Player decision for one import row, made before any write.
+
+    ``player_id`` is an existing player's id, or a negative placeholder for a
+    player this import creates from ``new_player``.
+    """
+
+    row: ImportRow
+    player_id: int
+    new_player: dict[str, object] | None = None
+    selected_manually: bool = False
 
-    tournament_repo = TournamentRepository(connection)
-    player_repo = PlayerRepository(connection)
-    result_repo = ResultRepository(connection)
-    source_files_payload = list(source_files or [])
-    operation_group_id_value = str(operation_group_id or "").strip() or uuid4().hex
-    create_restore_point(
-        connection=connection,
-        title=f"Before import {tournament_name}",
-        reason="import_apply",
-        source="import_xlsx",
-        operation_group_id=operation_group_id_value,
-    )
-    tournament_id = tournament_repo.create(
-        {
-            "name": tournament_name,
-            "date": tournament_date,
-            "category_code": category_code,
-            "league_code": None,
-            "is_adult_mode": 1 if is_adult_mode else 0,
-            "source_files": json.dumps(source_files_payload),
-            "status": TOURNAMENT_STATUS_DRAFT,
-            "has_draft_changes": 1,
-        }
-    )
-    remembered_rules = _load_player_match_rules()
-    parsed_rows = [row for row in rows if isinstance(row, dict)]
-    warnings = validate_rows(parsed_rows)
-    imported_rows = 0
-    skipped_rows = 0
-    players_created = 0
-    players_reused = 0
-    players_matched_manually = 0
+
+def _match_import_players(
+    parsed_rows: list[dict[str, object]],
+    *,
+    player_repo: PlayerRepository,
+    remembered_rules: dict[str, int],
+    player_match_resolver: Callable[[str, str | None, list[dict[str, object]]], PlayerMatchResolution | None] | None,
+) -> tuple[list[_RowPlayerMatch], set[str]]:
+    """Resolve every row to a player without writing anything.
+
+    Runs before the import transaction opens, so an interactive resolver never
+    holds the database write lock. Returns the per-row matches and the keys
+    of ``remembered_rules`` that should be saved once the import commits.
+    """
+    identity_index = PlayerIdentityIndex.from_repository(player_repo)
+    matches: list[_RowPlayerMatch] = []
+    changed_rules: set[str] = set()
+    pending_players = 0
 
     for row_data in parsed_rows:
         row = cast(ImportRow, row_data)
         fio = row.get("fio")
         if fio is None or _normalize_text(fio) == "":
-            skipped_rows += 1
             continue
         last_name, first_name, middle_name = _parse_fio(fio)
         birth_date, birth_year = _parse_birth_value(row.get("birth"))
@@ -908,6 +1101,7 @@ def import_tournament_rows(
             fio=fio,
             birth_date_or_year=birth_date or birth_year,
             player_repo=player_repo,
+            identity_index=identity_index,
         )
 
         player: dict[str, object] | None = None
@@ -957,73 +1151,142 @@ def import_tournament_rows(
                     selected_manually = True
                     if bool(resolution.get("remember")):
                         remembered_rules[match_key] = selected_player_id
-                        _save_player_match_rules(remembered_rules)
+                        changed_rules.add(match_key)
                 elif action != "create":
                     raise ValueError("Неизвестное решение по выбору игрока.")
 
         if player is None:
-            player_id = player_repo.create(
-                {
-                    "last_name": last_name,
-                    "first_name": first_name,
-                    "middle_name": middle_name,
-                    "birth_date": birth_date,
-                    "gender": None,
-                    "coach": _normalize_text(row.get("coach")) or None,
-                    "club": None,
-                    "notes": None,
-                }
-            )
-            players_created += 1
-        else:
-            parsed_player_id = parse_int(player.get("id"))
-            if parsed_player_id is None:
-                raise ValueError("У найденного игрока отсутствует корректный id.")
-            player_id = parsed_player_id
-            players_reused += 1
-            if selected_manually:
-                players_matched_manually += 1
-
-        place = parse_int(row.get("place"))
-        score_set = parse_int(row.get("score_set"))
-        score_sector20 = parse_int(row.get("score_sector20"))
-        score_big_round = parse_int(row.get("score_big_round"))
-
-        points_place = points_for_place(place) if place is not None else 0
-        points_classification = 0
-        points_total = points_place
-        ranks = {
-            "rank_set": None,
-            "rank_sector20": None,
-            "rank_big_round": None,
-        }
+            new_player: dict[str, object] = {
+                "last_name": last_name,
+                "first_name": first_name,
+                "middle_name": middle_name,
+                "birth_date": birth_date,
+                "gender": None,
+                "coach": _normalize_text(row.get("coach")) or None,
+                "club": None,
+                "notes": None,
+            }
+            pending_players += 1
+            placeholder_id = -pending_players
+            identity_index.add({"id": placeholder_id, **new_player})
+            matches.append(_RowPlayerMatch(row=row, player_id=placeholder_id, new_player=new_player))
+            continue
+
+        parsed_player_id = parse_int(player.get("id"))
+        if parsed_player_id is None:
+            raise ValueError("У найденного игрока отсутствует корректный id.")
+        matches.append(_RowPlayerMatch(row=row, player_id=parsed_player_id, selected_manually=selected_manually))
+
+    return matches, changed_rules
+
+
+def import_tournament_rows(
+    *,
+    connection,
+    rows: Iterable[dict[str, object]],
+    tournament_name: str,
+    tournament_date: str | None,
+    category_code: str | None,
+    is_adult_mode: bool = False,
+    source_files: list[str] | None = None,
+    player_match_resolver: Callable[[str, str | None, list[dict[str, object]]], PlayerMatchResolution | None] | None = None,
+    operation_group_id: str | None = None,
+) -> ImportApplyReport:
+    from app.services.restore_points import create_restore_point
 
-        result_repo.create(
+    tournament_repo = TournamentRepository(connection)
+    player_repo = PlayerRepository(connection)
+    result_repo = ResultRepository(connection)
+    source_files_payload = list(source_files or [])
+    operation_group_id_value = str(operation_group_id or "").strip() or uuid4().hex
+    parsed_rows = [row for row in rows if isinstance(row, dict)]
+    warnings = validate_rows(parsed_rows)
+    remembered_rules = _load_player_match_rules()
+    matches, changed_rules = _match_import_players(
+        parsed_rows,
+        player_repo=player_repo,
+        remembered_rules=remembered_rules,
+        player_match_resolver=player_match_resolver,
+    )
+    create_restore_point(
+        connection=connection,
+        title=f"Before import {tournament_name}",
+        reason="import_apply",
+        source="import_xlsx",
+        operation_group_id=operation_group_id_value,
+    )
+    players_created = 0
+    players_reused = 0
+    players_matched_manually = 0
+    result_entries: list[dict[str, object]] = []
+    created_ids: dict[int, int] = {}
+    with repo_session(connection):
+        tournament_id = tournament_repo.create(
             {
-                "tournament_id": tournament_id,
-                "player_id": player_id,
-                "place": place,
-                "score_set": score_set,
-                "score_sector20": score_sector20,
-                "score_big_round": score_big_round,
-                "rank_set": ranks["rank_set"],
-                "rank_sector20": ranks["rank_sector20"],
-                "rank_big_round": ranks["rank_big_round"],
-                "points_classification": points_classification,
-                "points_place": points_place,
-                "points_total": points_total,
-                "calc_version": "v3_no_classification",
+                "name": tournament_name,
+                "date": tournament_date,
+                "category_code": category_code,
+                "league_code": None,
+                "is_adult_mode": 1 if is_adult_mode else 0,
+                "source_files": json.dumps(source_files_payload),
+                "status": TOURNAMENT_STATUS_DRAFT,
+                "has_draft_changes": 1,
             }
         )
-        imported_rows += 1
+        new_players = [match for match in matches if match.new_player is not None]
+        created_ids.update(
+            zip(
+                (match.player_id for match in new_players),
+                player_repo.create_many([cast(dict[str, object], match.new_player) for match in new_players]),
+            )
+        )
+        players_created = len(new_players)
+        for match in matches:
+            player_id = created_ids.get(match.player_id, match.player_id)
+            if match.new_player is None:
+                players_reused += 1
+                if match.selected_manually:
+                    players_matched_manually += 1
+
+            row = match.row
+            result_entries.append(
+                {
+                    "tournament_id": tournament_id,
+                    "player_id": player_id,
+                    "place": parse_int(row.get("place")),
+                    "score_set": parse_int(row.get("score_set")),
+                    "score_sector20": parse_int(row.get("score_sector20")),
+                    "score_big_round": parse_int(row.get("score_big_round")),
+                    "rank_set": None,
+                    "rank_sector20": None,
+                    "rank_big_round": None,
+                    "points_classification": 0,
+                }
+            )
+
+        scheme = resolve_point_scheme(connection, season=None, category_code=category_code)
+        for entry, points in zip(
+            result_entries,
+            scheme.points_many([cast(int | None, entry["place"]) for entry in result_entries]),
+        ):
+            entry["points_place"] = points
+            entry["points_total"] = points
+            entry["calc_version"] = scheme.calc_version
+        result_repo.create_many(result_entries)
+
+    if changed_rules:
+        for match_key in changed_rules:
+            rule_player_id = remembered_rules[match_key]
+            remembered_rules[match_key] = created_ids.get(rule_player_id, rule_player_id)
+        _save_player_match_rules(remembered_rules)
 
     return ImportApplyReport(
         tournament_id=tournament_id,
         tournament_name=tournament_name,
         tournament_status=TOURNAMENT_STATUS_DRAFT,
         has_draft_changes=True,
-        imported_rows=imported_rows,
-        skipped_rows=skipped_rows,
+        imported_rows=len(result_entries),
+        skipped_rows=len(parsed_rows) - len(result_entries),
         total_rows=len(parsed_rows),
         warnings=warnings,
         source_files=source_files_payload,
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable
+from typing import Iterable, cast
 from uuid import uuid4
 
 from app.db.repositories import PlayerRepository, ResultRepository, TournamentRepository
+from app.db.unit_of_work import repo_session
+from app.domain.identity import birth_year_of
+from app.domain.points import MANUAL_ADULT_CALC_VERSION
 from app.services.audit_log import AuditLogService, TOURNAMENT_CREATED
 
 
@@ -39,110 +42,132 @@ def create_manual_adult_tournament(
 
     normalized_league = str(league_code or "").strip() or None
     operation_group_id_value = str(operation_group_id or "").strip() or uuid4().hex
-    tournament_id = tournament_repo.create(
-        {
-            "name": normalized_name,
-            "date": tournament_date,
-            "category_code": None,
-            "league_code": normalized_league,
-            "is_adult_mode": 1,
-            "source_files": "[]",
-            "status": "draft",
-            "has_draft_changes": 1,
-        }
-    )
-
-    warnings: list[str] = []
-    imported_rows = 0
-    skipped_rows = 0
-
-    for index, row in enumerate(rows, start=1):
-        fio = str(row.get("fio") or "").strip()
-        if not fio:
-            warnings.append(f"Строка {index}: не указано ФИО.")
-            skipped_rows += 1
-            continue
-
-        last_name, first_name, middle_name = _parse_fio(fio)
-        if not last_name or not first_name:
-            warnings.append(f"Строка {index}: неполное ФИО '{fio}'.")
-            skipped_rows += 1
-            continue
-
-        birth_date, birth_year = _parse_birth_value(row.get("birth"))
-        gender = _parse_gender(row.get("gender"))
-        place = _parse_int(row.get("place"))
-        points_total = _parse_int(row.get("points_total"))
-        if points_total is None:
-            warnings.append(f"Строка {index}: для взрослого турнира нужны итоговые очки.")
-            skipped_rows += 1
-            continue
-
-        player = player_repo.find_by_identity(
-            last_name=last_name,
-            first_name=first_name,
-            middle_name=middle_name,
-            birth_date=birth_date,
-            birth_year=birth_year,
+    with repo_session(connection):
+        tournament_id = tournament_repo.create(
+            {
+                "name": normalized_name,
+                "date": tournament_date,
+                "category_code": None,
+                "league_code": normalized_league,
+                "is_adult_mode": 1,
+                "source_files": "[]",
+                "status": "draft",
+                "has_draft_changes": 1,
+            }
         )
-        if player is None:
-            player_id = player_repo.create(
+
+        warnings: list[str] = []
+        imported_rows = 0
+        skipped_rows = 0
+        result_entries: list[dict[str, object]] = []
+        # Players new to the database are inserted together after the loop;
+        # until then result rows point at them by negative placeholder ids.
+        new_players: list[dict[str, object]] = []
+
+        for index, row in enumerate(rows, start=1):
+            fio = str(row.get("fio") or "").strip()
+            if not fio:
+                warnings.append(f"Строка {index}: не указано ФИО.")
+                skipped_rows += 1
+                continue
+
+            last_name, first_name, middle_name = _parse_fio(fio)
+            if not last_name or not first_name:
+                warnings.append(f"Строка {index}: неполное ФИО '{fio}'.")
+                skipped_rows += 1
+                continue
+
+            birth_date, birth_year = _parse_birth_value(row.get("birth"))
+            gender = _parse_gender(row.get("gender"))
+            place = _parse_int(row.get("place"))
+            points_total = _parse_int(row.get("points_total"))
+            if points_total is None:
+                warnings.append(f"Строка {index}: для взрослого турнира нужны итоговые очки.")
+                skipped_rows += 1
+                continue
+
+            player = player_repo.find_by_identity(
+                last_name=last_name,
+                first_name=first_name,
+                middle_name=middle_name,
+                birth_date=birth_date,
+                birth_year=birth_year,
+            )
+            if player is not None:
+                player_id = int(player["id"])
+            else:
+                pending_index = next(
+                    (
+                        pending_index
+                        for pending_index, pending in enumerate(new_players)
+                        if _same_identity(pending, last_name, first_name, middle_name, birth_date, birth_year)
+                    ),
+                    None,
+                )
+                if pending_index is None:
+                    pending_index = len(new_players)
+                    new_players.append(
+                        {
+                            "last_name": last_name,
+                            "first_name": first_name,
+                            "middle_name": middle_name,
+                            "birth_date": birth_date,
+                            "gender": gender,
+                            "coach": None,
+                            "club": None,
+                            "notes": None,
+                        }
+                    )
+                player_id = -(pending_index + 1)
+
+            result_entries.append(
                 {
-                    "last_name": last_name,
-                    "first_name": first_name,
-                    "middle_name": middle_name,
-                    "birth_date": birth_date,
-                    "gender": gender,
-                    "coach": None,
-                    "club": None,
-                    "notes": None,
+                    "tournament_id": tournament_id,
+                    "player_id": player_id,
+                    "place": place,
+                    "score_set": None,
+                    "score_sector20": None,
+                    "score_big_round": None,
+                    "rank_set": None,
+                    "rank_sector20": None,
+                    "rank_big_round": None,
+                    "points_classification": 0,
+                    "points_place": points_total,
+                    "points_total": points_total,
+                    "calc_version": MANUAL_ADULT_CALC_VERSION,
                 }
             )
-        else:
-            player_id = int(player["id"])
-
-        result_repo.create(
-            {
+            imported_rows += 1
+
+        if imported_rows == 0:
+            raise ValueError("Для взрослого турнира нужна хотя бы одна корректная строка результата.")
+        created_ids = player_repo.create_many(new_players)
+        for entry in result_entries:
+            player_id = cast(int, entry["player_id"])
+            if player_id < 0:
+                entry["player_id"] = created_ids[-player_id - 1]
+        result_repo.create_many(result_entries)
+
+        audit_log.log_event(
+            TOURNAMENT_CREATED,
+            "Создан взрослый турнир вручную",
+            (
+                f"Турнир ID: {tournament_id}; строк={imported_rows}; "
+                f"пропущено={skipped_rows}"
+            ),
+            context={
                 "tournament_id": tournament_id,
-                "player_id": player_id,
-                "place": place,
-                "score_set": None,
-                "score_sector20": None,
-                "score_big_round": None,
-                "rank_set": None,
-                "rank_sector20": None,
-                "rank_big_round": None,
-                "points_classification": 0,
-                "points_place": points_total,
-                "points_total": points_total,
-                "calc_version": "manual_adult_v1",
-            }
+                "is_adult_mode": True,
+                "league_code": normalized_league,
+                "imported_rows": imported_rows,
+                "skipped_rows": skipped_rows,
+                "warnings": warnings,
+            },
+            entity_type="tournament",
+            entity_id=str(tournament_id),
+            source="manual_tournament",
+            operation_group_id=operation_group_id_value,
         )
-        imported_rows += 1
-
-    if imported_rows == 0:
-        raise ValueError("Для взрослого турнира нужна хотя бы одна корректная строка результата.")
-
-    audit_log.log_event(
-        TOURNAMENT_CREATED,
-        "Создан взрослый турнир вручную",
-        (
-            f"Турнир ID: {tournament_id}; строк={imported_rows}; "
-            f"пропущено={skipped_rows}"
-        ),
-        context={
-            "tournament_id": tournament_id,
-            "is_adult_mode": True,
-            "league_code": normalized_league,
-            "imported_rows": imported_rows,
-            "skipped_rows": skipped_rows,
-            "warnings": warnings,
-        },
-        entity_type="tournament",
-        entity_id=str(tournament_id),
-        source="manual_tournament",
-        operation_group_id=operation_group_id_value,
-    )
 
     return ManualTournamentCreateReport(
         tournament_id=tournament_id,
@@ -155,6 +180,28 @@ def create_manual_adult_tournament(
     )
 
 
+def _same_identity(
+    player: dict[str, object],
+    last_name: str,
+    first_name: str,
+    middle_name: str | None,
+    birth_date: str | None,
+    birth_year: str | None,
+) -> bool:
+    """Match a not yet inserted player the way PlayerRepository.find_by_identity does."""
+    if (player["last_name"], player["first_name"], player["middle_name"] or "") != (
+        last_name,
+        first_name,
+        middle_name or "",
+    ):
+        return False
+    if birth_date:
+        return player["birth_date"] == birth_date
+    if birth_year:
+        return birth_year_of(player["birth_date"]) == birth_year
+    return True
+
+
 def _parse_fio(value: str) -> tuple[str, str, str | None]:
     parts = [part.strip() for part in str(value).split() if part.strip()]
     if not parts:
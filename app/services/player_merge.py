@@ -4,8 +4,9 @@ from dataclasses import dataclass
 import sqlite3
 
 from app.db.repositories import PlayerRepository
+from app.db.unit_of_work import repo_session
 from app.services.audit_log import AuditLogService
-from app.services.import_xlsx import _normalize_fio_key
+from app.domain.identity import normalize_fio_key
 
 MERGE_PLAYERS = "MERGE_PLAYERS"
 
@@ -26,7 +27,7 @@ class MergeResult:
 
 
 def normalize_fio(fio: object) -> str:
-    return _normalize_fio_key(fio)
+    return normalize_fio_key(fio)
 
 
 class PlayerMergeService:
@@ -44,29 +45,13 @@ class PlayerMergeService:
         return int(row[0]) if row else 0
 
     def find_possible_duplicates(self) -> list[DuplicateGroup]:
-        grouped: dict[str, list[dict[str, object]]] = {}
-        for player in self._player_repo.list():
-            fio = " ".join(
-                part
-                for part in (
-                    player.get("last_name"),
-                    player.get("first_name"),
-                    player.get("middle_name"),
-                )
-                if part
-            )
-            normalized = normalize_fio(fio)
-            if not normalized:
-                continue
-            grouped.setdefault(normalized, []).append(player)
-
-        duplicates = [
+        groups: dict[str, list[dict[str, object]]] = {}
+        for player in self._player_repo.list_identity_duplicates():
+            groups.setdefault(str(player["fio_key"]), []).append(player)
+        return [
             DuplicateGroup(normalized_fio=normalized, players=players)
-            for normalized, players in grouped.items()
-            if len(players) > 1
+            for normalized, players in groups.items()
         ]
-        duplicates.sort(key=lambda item: item.normalized_fio)
-        return duplicates
 
     def merge_players(self, primary_id: int, duplicate_id: int, merge_strategy: str = "prefer_primary") -> MergeResult:
         if primary_id == duplicate_id:
@@ -87,7 +72,7 @@ class PlayerMergeService:
         transferred = 0
         removed = 0
 
-        with self._connection:
+        with repo_session(self._connection):
             for row in duplicate_results:
                 existing = self._connection.execute(
                     "SELECT id, points_total FROM results WHERE tournament_id = ? AND player_id = ?",
@@ -127,19 +112,18 @@ class PlayerMergeService:
             }
             self._player_repo.update(primary_id, patch)
             self._player_repo.delete(duplicate_id)
-
-        self._audit_log.log_event(
-            MERGE_PLAYERS,
-            "Слияние дублей игроков",
-            f"Слили игрока #{duplicate_id} в #{primary_id}. Перенесено результатов: {transferred}. Удалено дублей результатов: {removed}.",
-            context={
-                "primary_id": primary_id,
-                "duplicate_id": duplicate_id,
-                "merge_strategy": merge_strategy,
-                "results_transferred": transferred,
-                "duplicate_results_removed": removed,
-            },
-        )
+            self._audit_log.log_event(
+                MERGE_PLAYERS,
+                "Слияние дублей игроков",
+                f"Слили игрока #{duplicate_id} в #{primary_id}. Перенесено результатов: {transferred}. Удалено дублей результатов: {removed}.",
+                context={
+                    "primary_id": primary_id,
+                    "duplicate_id": duplicate_id,
+                    "merge_strategy": merge_strategy,
+                    "results_transferred": transferred,
+                    "duplicate_results_removed": removed,
+                },
+            )
 
         return MergeResult(
             primary_id=primary_id,
@@ -0,0 +1,96 @@
+"""Stored place→points schemes and their compiled lookup tables."""
+
+from __future__ import annotations
+
+import json
+from sqlite3 import Connection
+from typing import Any, Iterable, Mapping, Sequence
+
+from app.db.repositories import PointSchemeRepository
+from app.domain.points import DEFAULT_POINT_SCHEME, CompiledPointScheme, compile_point_scheme
+
+# Stored versions are immutable, so compiled tables are shared across connections.
+_COMPILED: dict[tuple[str, int, str], CompiledPointScheme] = {}
+
+
+def save_point_scheme(
+    connection: Connection,
+    *,
+    name: str,
+    ranges: Iterable[Sequence[int]],
+    season: str | None = None,
+    category_code: str | None = None,
+) -> CompiledPointScheme:
+    """Validate ``(first_place, last_place, points)`` ranges and store them as the next version."""
+    scheme_name = str(name or "").strip()
+    if not scheme_name:
+        raise ValueError("Укажите название таблицы очков.")
+    if scheme_name == DEFAULT_POINT_SCHEME.name:
+        raise ValueError("Встроенную таблицу очков нельзя изменить.")
+    draft = compile_point_scheme(scheme_name, 0, ranges)
+    repo = PointSchemeRepository(connection)
+    scheme_id = repo.create(
+        {
+            "name": scheme_name,
+            "season": _scope_value(season),
+            "category_code": _scope_value(category_code),
+            "ranges_json": json.dumps([list(item) for item in draft.ranges]),
+        }
+    )
+    stored = repo.get(scheme_id)
+    if stored is None:
+        raise RuntimeError("Не удалось сохранить таблицу очков.")
+    return _compile_row(stored)
+
+
+def get_point_scheme(connection: Connection, name: str, version: int | None = None) -> CompiledPointScheme:
+    """Return a stored scheme (newest version by default) or the built-in one."""
+    if name == DEFAULT_POINT_SCHEME.name:
+        return DEFAULT_POINT_SCHEME
+    row = PointSchemeRepository(connection).find(name, version)
+    if row is None:
+        raise ValueError(f"Таблица очков не найдена: {name}.")
+    return _compile_row(row)
+
+
+def resolve_point_scheme(
+    connection: Connection,
+    *,
+    season: str | None,
+    category_code: str | None,
+) -> CompiledPointScheme:
+    """Return the scheme that applies to a season and category."""
+    return PointSchemeResolver(connection).resolve(season=season, category_code=category_code)
+
+
+class PointSchemeResolver:
+    """Resolve schemes for many tournaments with one lookup per distinct scope."""
+
+    def __init__(self, connection: Connection) -> None:
+        self._repo = PointSchemeRepository(connection)
+        self._by_scope: dict[tuple[str | None, str | None], CompiledPointScheme] = {}
+
+    def resolve(self, *, season: str | None, category_code: str | None) -> CompiledPointScheme:
+        key = (_scope_value(season), _scope_value(category_code))
+        scheme = self._by_scope.get(key)
+        if scheme is None:
+            row = self._repo.find_for_scope(season=key[0], category_code=key[1])
+            scheme = _compile_row(row) if row is not None else DEFAULT_POINT_SCHEME
+            self._by_scope[key] = scheme
+        return scheme
+
+    def for_tournament(self, tournament: Mapping[str, Any]) -> CompiledPointScheme:
+        return self.resolve(season=tournament.get("season"), category_code=tournament.get("category_code"))
+
+
+def _scope_value(value: object | None) -> str | None:
+    return str(value).strip() or None if value is not None else None
+
+
+def _compile_row(row: Mapping[str, Any]) -> CompiledPointScheme:
+    key = (str(row["name"]), int(row["version"]), str(row["ranges_json"]))
+    scheme = _COMPILED.get(key)
+    if scheme is None:
+        scheme = compile_point_scheme(key[0], key[1], json.loads(key[2]))
+        _COMPILED[key] = scheme
+    return scheme
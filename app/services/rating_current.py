@@ -0,0 +1,122 @@
+"""Materialized current rating tables (``rating_current``)."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from app.db.repositories import RatingCurrentRepository, ResultRepository, TournamentRepository
+from app.db.unit_of_work import repo_session
+from app.domain.rating import (
+    RatingSnapshotRow,
+    _build_fio,
+    _rating_entry_sort_key,
+    build_rating_snapshot_from_totals,
+)
+from app.services.rating_snapshot import RatingScopeFilters, _build_scope_requests, partition_scope_results
+
+# N values offered by the rating screen; every materialized scope stores all of them.
+RATING_CURRENT_N_VALUES: tuple[int, ...] = tuple(range(3, 13))
+
+ScopeRequest = tuple[str, str, RatingScopeFilters]
+
+
+def refresh_current_ratings_for_tournament(connection, tournament_id: int) -> int:
+    """Re-materialize the scopes a tournament belongs to; returns the number of scopes."""
+    tournament = TournamentRepository(connection).get(tournament_id)
+    if tournament is None:
+        return 0
+    scope_requests = _build_scope_requests(tournament)
+    _materialize_scopes(connection, scope_requests)
+    return len(scope_requests)
+
+
+def refresh_current_rating_scopes(connection, scope_requests: list[ScopeRequest]) -> int:
+    """Re-materialize only the given scopes; returns the number of scopes."""
+    _materialize_scopes(connection, scope_requests)
+    return len(scope_requests)
+
+
+def rebuild_current_ratings(connection) -> int:
+    """Rebuild every materialized scope from published results; returns the number of scopes."""
+    scope_requests: dict[tuple[str, str], ScopeRequest] = {}
+    for source in TournamentRepository(connection).list_published_scope_sources():
+        for scope_type, scope_key, filters in _build_scope_requests(source):
+            scope_requests.setdefault((scope_type, scope_key), (scope_type, scope_key, filters))
+    with repo_session(connection):
+        RatingCurrentRepository(connection).clear()
+        _materialize_scopes(connection, list(scope_requests.values()))
+    return len(scope_requests)
+
+
+def list_current_rating(
+    connection,
+    *,
+    scope_type: str,
+    scope_key: str,
+    n: int,
+) -> list[RatingSnapshotRow] | None:
+    """Return the materialized table, or None if the scope/N is not materialized."""
+    current_repo = RatingCurrentRepository(connection)
+    if n not in RATING_CURRENT_N_VALUES or not current_repo.is_materialized(scope_type, scope_key):
+        return None
+    return [
+        RatingSnapshotRow(
+            player_id=int(row["player_id"]),
+            place=int(row["position"]),
+            fio=_build_fio(row),
+            points=int(row["points"]),
+            tournaments_count=int(row["tournaments_count"]),
+        )
+        for row in current_repo.list_rows(scope_type=scope_type, scope_key=scope_key, n=n)
+    ]
+
+
+def _materialize_scopes(connection, scope_requests: list[ScopeRequest]) -> None:
+    if not scope_requests:
+        return
+    partitions = partition_scope_results(
+        ResultRepository(connection).list_results_for_rating_scopes(
+            [filters for _, _, filters in scope_requests]
+        ),
+        scope_requests,
+    )
+
+    current_repo = RatingCurrentRepository(connection)
+    with repo_session(connection):
+        for (scope_type, scope_key, _filters), scope_results in zip(scope_requests, partitions):
+            current_repo.replace_scope(scope_type, scope_key, _build_current_entries(scope_results))
+
+
+def _build_current_entries(results: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Rank one scope for every N from a single prefix sum per player."""
+    players: dict[int, dict[str, Any]] = {}
+    for row in results:
+        player = players.setdefault(int(row["player_id"]), {"row": row, "entries": []})
+        player["entries"].append(row)
+
+    prefix_sums: dict[int, list[int]] = {}
+    for player_id, player in players.items():
+        entries = sorted(player["entries"], key=_rating_entry_sort_key, reverse=True)
+        sums = [0]
+        for entry in entries[: max(RATING_CURRENT_N_VALUES)]:
+            sums.append(sums[-1] + int(entry.get("points_total") or 0))
+        prefix_sums[player_id] = sums
+
+    entries: list[dict[str, Any]] = []
+    for n_value in RATING_CURRENT_N_VALUES:
+        totals = []
+        for player_id in sorted(players):
+            sums = prefix_sums[player_id]
+            count = min(n_value, len(sums) - 1)
+            totals.append({**players[player_id]["row"], "points": sums[count], "tournaments_count": count})
+        for row in build_rating_snapshot_from_totals(totals):
+            entries.append(
+                {
+                    "n": n_value,
+                    "player_id": row.player_id,
+                    "position": row.place,
+                    "points": row.points,
+                    "tournaments_count": row.tournaments_count,
+                }
+            )
+    return entries
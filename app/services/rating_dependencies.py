@@ -0,0 +1,152 @@
+"""Rating scopes and snapshot sessions that depend on one tournament."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Mapping
+
+from app.db.repositories import TOURNAMENT_STATUS_PUBLISHED, RatingSnapshotRepository, ResultRepository
+from app.domain.rating import RatingImpactRow
+from app.domain.rating_engine import IncrementalRatingTable
+from app.domain.tournament_lifecycle import TournamentStatus
+from app.services.rating_current import ScopeRequest
+from app.services.rating_snapshot import _build_scope_requests, partition_scope_results, snapshot_payload_rows
+
+
+@dataclass(frozen=True)
+class TournamentRatingDependencies:
+    """What a published tournament feeds.
+
+    ``scope_requests`` are the rating scopes its results count in;
+    ``snapshot_session_ids`` are the stored sessions whose rolling basis
+    includes it (found through the basis index, so unrelated history is
+    never scanned).
+    """
+
+    tournament_id: int
+    scope_requests: tuple[ScopeRequest, ...]
+    snapshot_session_ids: tuple[int, ...]
+
+    @property
+    def scopes(self) -> tuple[tuple[str, str], ...]:
+        return tuple((scope_type, scope_key) for scope_type, scope_key, _filters in self.scope_requests)
+
+
+@dataclass(frozen=True)
+class ScopeImpact:
+    scope_type: str
+    scope_key: str
+    rows: list[RatingImpactRow]
+
+
+def collect_tournament_dependencies(
+    connection,
+    tournament: Mapping[str, Any],
+) -> TournamentRatingDependencies:
+    """Return the scopes and snapshot sessions a tournament currently feeds."""
+    tournament_id = int(tournament["id"])
+    is_published = str(tournament.get("status") or "") == TOURNAMENT_STATUS_PUBLISHED
+    return TournamentRatingDependencies(
+        tournament_id=tournament_id,
+        scope_requests=tuple(_build_scope_requests(dict(tournament))) if is_published else (),
+        snapshot_session_ids=tuple(
+            RatingSnapshotRepository(connection).list_session_ids_counting_tournament(tournament_id)
+        ),
+    )
+
+
+def build_withdrawal_impact(
+    connection,
+    dependencies: TournamentRatingDependencies,
+    *,
+    n_value: int,
+) -> list[ScopeImpact]:
+    """Rank deltas in every dependent scope if the tournament left the published rating.
+
+    One result scan covers all scopes; each scope's table re-ranks only the
+    tournament's players and the bystanders they pass.
+    """
+    scope_requests = list(dependencies.scope_requests)
+    if not scope_requests:
+        return []
+    partitions = partition_scope_results(
+        ResultRepository(connection).list_results_for_rating_scopes(
+            [filters for _, _, filters in scope_requests]
+        ),
+        scope_requests,
+    )
+    impacts: list[ScopeImpact] = []
+    for (scope_type, scope_key, _filters), scope_results in zip(scope_requests, partitions):
+        table = IncrementalRatingTable.from_results(scope_results, n_value)
+        rows = table.apply_tournament(dependencies.tournament_id, None, [])
+        if rows:
+            impacts.append(ScopeImpact(scope_type=scope_type, scope_key=scope_key, rows=rows))
+    return impacts
+
+
+def regenerate_dependent_sessions(
+    connection,
+    dependencies: TournamentRatingDependencies,
+    *,
+    n_value: int,
+) -> list[int]:
+    """Rebuild the stored sessions that counted the tournament from current results.
+
+    A session is re-ranked over the tournaments it was built from: those in
+    its rolling basis plus the sources of its scope's sessions up to it,
+    whatever their status is now. A session whose source tournament no longer
+    has results in its scope is dropped, as publishing would not have created
+    it. Returns the ids of the regenerated and dropped sessions.
+    """
+    filters_by_scope = {
+        (scope_type, scope_key): filters for scope_type, scope_key, filters in dependencies.scope_requests
+    }
+    snapshot_repo = RatingSnapshotRepository(connection)
+    counted_by_scope: dict[tuple[str, str], dict[int, set[int]]] = {}
+    for session_id in dependencies.snapshot_session_ids:
+        rows = snapshot_repo.list_rows(session_id, include_basis=True)
+        if not rows:
+            continue
+        scope = (str(rows[0]["scope_type"]), str(rows[0]["scope_key"]))
+        if scope not in filters_by_scope:
+            continue
+        counted_by_scope.setdefault(scope, {})[session_id] = {
+            int(tournament_id) for row in rows for tournament_id, _date, _points in row["rolling_basis"]
+        }
+    if not counted_by_scope:
+        return []
+
+    scope_requests: list[ScopeRequest] = [
+        (scope_type, scope_key, filters_by_scope[(scope_type, scope_key)])
+        for scope_type, scope_key in counted_by_scope
+    ]
+    partitions = partition_scope_results(
+        ResultRepository(connection).list_results_for_rating_scopes(
+            [filters for _, _, filters in scope_requests],
+            statuses=[status.value for status in TournamentStatus],
+        ),
+        scope_requests,
+    )
+    entries_by_session: dict[int, list[dict[str, Any]]] = {}
+    for (scope_type, scope_key, _filters), scope_results in zip(scope_requests, partitions):
+        counted = counted_by_scope[(scope_type, scope_key)]
+        scope_tournament_ids = {int(row["tournament_id"]) for row in scope_results}
+        sources: set[int] = set()
+        # list_sessions is newest first; walk it oldest first to accumulate sources.
+        for session in reversed(snapshot_repo.list_sessions(scope_type=scope_type, scope_key=scope_key)):
+            source_tournament_id = int(session["source_tournament_id"])
+            sources.add(source_tournament_id)
+            session_id = int(session["id"])
+            if session_id not in counted:
+                continue
+            if source_tournament_id not in scope_tournament_ids:
+                entries_by_session[session_id] = []
+                continue
+            tournament_ids = counted[session_id] | sources
+            table = IncrementalRatingTable.from_results(
+                [row for row in scope_results if int(row["tournament_id"]) in tournament_ids],
+                n_value,
+            )
+            entries_by_session[session_id] = snapshot_payload_rows(table.rows(), table.basis_by_player())
+    snapshot_repo.replace_session_entries(entries_by_session)
+    return list(entries_by_session)
@@ -0,0 +1,107 @@
+"""Incremental rating tables kept in sync with the database change log."""
+
+from __future__ import annotations
+
+import sqlite3
+from typing import Any
+
+from app.db.repositories import RatingChangeLogRepository, ResultRepository
+from app.domain.rating import RatingImpactRow, RatingTimeline
+from app.domain.rating_engine import IncrementalRatingTable
+from app.domain.rating_simulator import RatingSimulator
+
+ScopeKey = tuple[int, tuple[tuple[str, Any], ...]]
+
+
+class RatingEngine:
+    """Cache of incremental rating tables for one connection.
+
+    Tables are loaded on first use per ``(n, scope filters)``. ``sync`` reads
+    the ``rating_change_log`` written by triggers (on any connection) and
+    reloads only the players touched since the last sync, so publish,
+    correction and withdrawal cost O(affected players) instead of a rebuild.
+    As-of timelines are cached per scope too and dropped on any change.
+    """
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self._connection = connection
+        self._result_repo = ResultRepository(connection)
+        self._change_log = RatingChangeLogRepository(connection)
+        self._tables: dict[ScopeKey, tuple[dict[str, Any], IncrementalRatingTable]] = {}
+        self._timelines: dict[tuple[tuple[str, Any], ...], RatingTimeline] = {}
+        self._last_seq = 0
+
+    def table(self, n: int, **filters: Any) -> IncrementalRatingTable:
+        """Return the up-to-date table for ``list_results_for_rating`` filters."""
+        if self._connection.in_transaction:
+            # Uncommitted changes may still roll back (and their log seqs be
+            # reused), so tables built inside a transaction are never cached.
+            return IncrementalRatingTable.from_results(
+                self._result_repo.list_results_for_rating(**filters),
+                n,
+            )
+        self.sync()
+        key: ScopeKey = (n, tuple(sorted(filters.items())))
+        cached = self._tables.get(key)
+        if cached is not None:
+            return cached[1]
+        if not self._tables and not self._timelines:
+            self._last_seq = self._change_log.latest_seq()
+        table = IncrementalRatingTable.from_results(
+            self._result_repo.list_results_for_rating(**filters),
+            n,
+        )
+        self._tables[key] = (dict(filters), table)
+        return table
+
+    def timeline(self, **filters: Any) -> RatingTimeline:
+        """Return the as-of timeline for ``list_results_for_rating`` filters."""
+        if self._connection.in_transaction:
+            return RatingTimeline(self._result_repo.list_results_for_rating(**filters))
+        self.sync()
+        key = tuple(sorted(filters.items()))
+        timeline = self._timelines.get(key)
+        if timeline is None:
+            if not self._tables and not self._timelines:
+                self._last_seq = self._change_log.latest_seq()
+            timeline = RatingTimeline(self._result_repo.list_results_for_rating(**filters))
+            self._timelines[key] = timeline
+        return timeline
+
+    def simulator(self, baseline_n: int, **filters: Any) -> RatingSimulator:
+        """Load a scope once for what-if scenarios against its N=``baseline_n`` table."""
+        return RatingSimulator(self._result_repo.list_results_for_rating(**filters), baseline_n=baseline_n)
+
+    def sync(self) -> dict[ScopeKey, list[RatingImpactRow]]:
+        """Apply logged changes to the loaded tables and return their rank deltas."""
+        if self._connection.in_transaction or not (self._tables or self._timelines):
+            return {}
+        changes = self._change_log.list_since(self._last_seq)
+        if not changes:
+            return {}
+        pruned = int(changes[0]["seq"]) != self._last_seq + 1
+        self._last_seq = int(changes[-1]["seq"])
+        self._timelines.clear()
+        if pruned:
+            # Part of the log was trimmed before this engine read it; start over.
+            self._tables.clear()
+            return {}
+
+        tournament_ids = {int(row["tournament_id"]) for row in changes if row["tournament_id"] is not None}
+        player_ids = {int(row["player_id"]) for row in changes if row["player_id"] is not None}
+        player_ids |= self._result_repo.list_player_ids_for_tournaments(tournament_ids)
+
+        impacts: dict[ScopeKey, list[RatingImpactRow]] = {}
+        for key, (filters, table) in self._tables.items():
+            affected = set(player_ids)
+            for tournament_id in tournament_ids:
+                affected |= table.players_in_tournament(tournament_id)
+            if not affected:
+                continue
+            results = self._result_repo.list_results_for_rating(**filters, player_ids=affected)
+            impacts[key] = table.replace_player_results(affected, results)
+        return impacts
+
+    def invalidate(self) -> None:
+        self._tables.clear()
+        self._timelines.clear()
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import json
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, TypedDict
 
 from app.db.repositories import RatingSnapshotRepository, ResultRepository, TournamentRepository
-from app.domain.rating import RatingBasisItem, build_rating_basis, build_rating_snapshot
+from app.domain.rating import RatingBasisItem, RatingSnapshotRow, normalize_adult_gender_scope
+from app.domain.rating_engine import IncrementalRatingTable
 from app.services.audit_log import AuditLogService, RATING_SNAPSHOT_CREATED
 
 CATEGORY_SCOPE = "category"
@@ -44,6 +44,7 @@ class RatingSnapshotEntry:
 
 @dataclass(frozen=True)
 class RatingSnapshotSession:
+    id: int
     scope_type: str
     scope_key: str
     source_tournament_id: int
@@ -75,6 +76,16 @@ class PlayerRatingStateEntry:
     created_at: str
 
 
+@dataclass(frozen=True)
+class PlayerRatingPoint:
+    session_id: int
+    source_tournament_id: int
+    created_at: str
+    position: int
+    points: int
+    tournaments_count: int
+
+
 def create_rating_snapshot_for_tournament_publish(
     connection,
     tournament_id: int,
@@ -101,38 +112,33 @@ def create_rating_snapshot_for_tournament_publish(
     reason = SNAPSHOT_REASON_PUBLISH
     created_sessions: list[RatingSnapshotSession] = []
     created_count = 0
-    for scope_type, scope_key, filters in scope_requests:
-        published_results = result_repo.list_results_for_rating(**filters)
-        if not published_results:
-            continue
-
-        snapshot_rows = build_rating_snapshot(published_results, n_value)
+    scope_snapshots = build_scope_snapshots(
+        result_repo.list_results_for_rating_scopes([filters for _, _, filters in scope_requests]),
+        scope_requests,
+        n_value,
+    )
+    for (scope_type, scope_key, _filters), (snapshot_rows, basis_by_player) in zip(
+        scope_requests, scope_snapshots
+    ):
         if not snapshot_rows:
             continue
 
-        basis_by_player = build_rating_basis(published_results, n_value)
-        payload_rows = [
+        payload_rows = snapshot_payload_rows(snapshot_rows, basis_by_player)
+        session_id = snapshot_repo.create_session(
             {
                 "scope_type": scope_type,
                 "scope_key": scope_key,
-                "player_id": row.player_id,
-                "position": row.place,
-                "points": row.points,
-                "tournaments_count": row.tournaments_count,
-                "rolling_basis_json": json.dumps(
-                    [asdict(item) for item in basis_by_player.get(row.player_id, [])],
-                    ensure_ascii=False,
-                ),
                 "source_tournament_id": tournament_id,
                 "reason": reason,
                 "operation_group_id": operation_group_id,
                 "created_at": created_at,
-            }
-            for row in snapshot_rows
-        ]
-        scope_count = snapshot_repo.create_many(payload_rows)
+            },
+            payload_rows,
+        )
+        scope_count = len(payload_rows)
         created_count += scope_count
         session = RatingSnapshotSession(
+            id=int(session_id),
             scope_type=scope_type,
             scope_key=scope_key,
             source_tournament_id=tournament_id,
@@ -151,6 +157,7 @@ def create_rating_snapshot_for_tournament_publish(
                 f"entries={scope_count}"
             ),
             context={
+                "session_id": session.id,
                 "scope_type": scope_type,
                 "scope_key": scope_key,
                 "source_tournament_id": tournament_id,
@@ -188,6 +195,7 @@ def list_rating_snapshot_sessions(
     snapshot_repo = RatingSnapshotRepository(connection)
     return [
         RatingSnapshotSession(
+            id=int(row["id"]),
             scope_type=str(row["scope_type"]),
             scope_key=str(row["scope_key"]),
             source_tournament_id=int(row["source_tournament_id"]),
@@ -203,17 +211,27 @@ def list_rating_snapshot_sessions(
 def list_rating_snapshot_rows(
     connection,
     *,
-    snapshot_created_at: str,
-    scope_type: str,
-    scope_key: str,
+    session_id: int | None = None,
+    snapshot_created_at: str | None = None,
+    scope_type: str | None = None,
+    scope_key: str | None = None,
 ) -> list[RatingSnapshotEntry]:
+    """Return one session's rows by ``session_id`` (or by scope and ``created_at``)."""
     snapshot_repo = RatingSnapshotRepository(connection)
-    rows = snapshot_repo.list_rows(
-        snapshot_created_at=snapshot_created_at,
-        scope_type=scope_type,
-        scope_key=scope_key,
-    )
-    return [_snapshot_entry_from_row(row) for row in rows]
+    if session_id is None:
+        if snapshot_created_at is None or scope_type is None or scope_key is None:
+            return []
+        session_id = snapshot_repo.find_session_id(
+            scope_type=scope_type,
+            scope_key=scope_key,
+            created_at=snapshot_created_at,
+        )
+        if session_id is None:
+            return []
+    return [
+        _snapshot_entry_from_row(row)
+        for row in snapshot_repo.list_rows(session_id, include_basis=True)
+    ]
 
 
 def list_latest_player_rating_states(connection, *, player_id: int) -> list[PlayerRatingStateEntry]:
@@ -235,6 +253,25 @@ def list_latest_player_rating_states(connection, *, player_id: int) -> list[Play
     ]
 
 
+def list_player_rating_series(
+    connection,
+    *,
+    player_id: int,
+    scope_type: str,
+    scope_key: str,
+) -> list[PlayerRatingPoint]:
+    """Return the player's snapshot positions in one scope, oldest first."""
+    snapshot_repo = RatingSnapshotRepository(connection)
+    return [
+        PlayerRatingPoint(**row)
+        for row in snapshot_repo.list_player_series(
+            player_id=player_id,
+            scope_type=scope_type,
+            scope_key=scope_key,
+        )
+    ]
+
+
 def _snapshot_entry_from_row(row: dict[str, Any]) -> RatingSnapshotEntry:
     return RatingSnapshotEntry(
         id=int(row["id"]),
@@ -245,7 +282,10 @@ def _snapshot_entry_from_row(row: dict[str, Any]) -> RatingSnapshotEntry:
         fio=_build_fio(row),
         points=int(row["points"]),
         tournaments_count=int(row["tournaments_count"]),
-        rolling_basis=_parse_basis_json(row.get("rolling_basis_json")),
+        rolling_basis=[
+            RatingBasisItem(tournament_id=tournament_id, tournament_date=tournament_date, points_total=points_total)
+            for tournament_id, tournament_date, points_total in row.get("rolling_basis") or ()
+        ],
         source_tournament_id=int(row["source_tournament_id"]),
         reason=str(row["reason"]),
         operation_group_id=str(row["operation_group_id"]) if row["operation_group_id"] is not None else None,
@@ -253,27 +293,6 @@ def _snapshot_entry_from_row(row: dict[str, Any]) -> RatingSnapshotEntry:
     )
 
 
-def _parse_basis_json(raw_value: object) -> list[RatingBasisItem]:
-    try:
-        payload = json.loads(str(raw_value or "[]"))
-    except json.JSONDecodeError:
-        return []
-    if not isinstance(payload, list):
-        return []
-    basis_items: list[RatingBasisItem] = []
-    for item in payload:
-        if not isinstance(item, dict):
-            continue
-        basis_items.append(
-            RatingBasisItem(
-                tournament_id=int(item.get("tournament_id") or 0),
-                tournament_date=str(item.get("tournament_date") or ""),
-                points_total=int(item.get("points_total") or 0),
-            )
-        )
-    return basis_items
-
-
 def _build_fio(row: dict[str, Any]) -> str:
     last_name = str(row.get("last_name") or "").strip()
     first_name = str(row.get("first_name") or "").strip()
@@ -281,6 +300,84 @@ def _build_fio(row: dict[str, Any]) -> str:
     return " ".join(part for part in (last_name, first_name, middle_name) if part)
 
 
+def partition_scope_results(
+    results: list[dict[str, Any]],
+    scope_requests: list[tuple[str, str, RatingScopeFilters]],
+) -> list[list[dict[str, Any]]]:
+    """Split one ``list_results_for_rating_scopes`` scan into per-scope lists."""
+    partitions: list[list[dict[str, Any]]] = [[] for _ in scope_requests]
+    for row in results:
+        gender_scope = normalize_adult_gender_scope(row.get("gender"))
+        for index, (_scope_type, _scope_key, filters) in enumerate(scope_requests):
+            if _row_matches_scope(row, filters, gender_scope):
+                partitions[index].append(row)
+    return partitions
+
+
+def build_scope_snapshots(
+    results: list[dict[str, Any]],
+    scope_requests: list[tuple[str, str, RatingScopeFilters]],
+    n_value: int,
+) -> list[tuple[list[RatingSnapshotRow], dict[int, list[RatingBasisItem]]]]:
+    """Partition one result scan by scope and build each scope's snapshot and basis.
+
+    ``results`` is the union returned by
+    ``ResultRepository.list_results_for_rating_scopes``; the output follows the
+    order of ``scope_requests``.
+    """
+    partitions = partition_scope_results(results, scope_requests)
+    snapshots: list[tuple[list[RatingSnapshotRow], dict[int, list[RatingBasisItem]]]] = []
+    for rows in partitions:
+        table = IncrementalRatingTable.from_results(rows, n_value)
+        snapshots.append((table.rows(), table.basis_by_player()))
+    return snapshots
+
+
+def snapshot_payload_rows(
+    snapshot_rows: list[RatingSnapshotRow],
+    basis_by_player: dict[int, list[RatingBasisItem]],
+) -> list[dict[str, Any]]:
+    """Return ``RatingSnapshotRepository`` session entries for one scope's table."""
+    return [
+        {
+            "player_id": row.player_id,
+            "position": row.place,
+            "points": row.points,
+            "tournaments_count": row.tournaments_count,
+            "rolling_basis": [
+                (item.tournament_id, item.tournament_date, item.points_total)
+                for item in basis_by_player.get(row.player_id, [])
+            ],
+        }
+        for row in snapshot_rows
+    ]
+
+
+def _row_matches_scope(
+    row: dict[str, Any],
+    filters: RatingScopeFilters,
+    gender_scope: str | None,
+) -> bool:
+    category_code = filters.get("category_code")
+    league_code = filters.get("league_code")
+    is_adult_mode = filters.get("is_adult_mode")
+    adult_gender_scope = filters.get("adult_gender_scope")
+    if adult_gender_scope is not None and is_adult_mode is None:
+        is_adult_mode = True
+    if is_adult_mode is None and category_code:
+        is_adult_mode = False
+
+    if category_code and row.get("category_code") != category_code:
+        return False
+    if league_code and row.get("league_code") != league_code:
+        return False
+    if is_adult_mode is not None and bool(int(row.get("is_adult_mode") or 0)) != is_adult_mode:
+        return False
+    if adult_gender_scope in {ADULT_MEN_SCOPE_KEY, ADULT_WOMEN_SCOPE_KEY}:
+        return gender_scope == adult_gender_scope
+    return True
+
+
 def _build_scope_requests(
     tournament: dict[str, Any],
 ) -> list[tuple[str, str, RatingScopeFilters]]:
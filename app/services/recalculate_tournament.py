@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import TypedDict, cast
+from typing import Sequence, TypedDict, cast
 
 from app.db.repositories import ResultRepository, TournamentRepository
-from app.domain.points import points_for_place
+from app.db.unit_of_work import repo_session
+from app.domain.points import MANUAL_ADULT_CALC_VERSION, CompiledPointScheme
+from app.services.point_schemes import PointSchemeResolver
 
 
 def _as_int_or_none(value: object | None) -> int | None:
@@ -18,6 +20,9 @@ def _as_int_or_none(value: object | None) -> int | None:
 
 class TournamentRow(TypedDict, total=False):
     id: object
+    season: object
+    category_code: object
+    is_adult_mode: object
 
 
 class ResultRow(TypedDict, total=False):
@@ -38,9 +43,36 @@ class RecalculationReport:
     results_updated: int = 0
     warnings: list[str] = field(default_factory=list)
     errors: list[str] = field(default_factory=list)
+    results_by_tournament: dict[int, int] = field(default_factory=dict)
 
 
-def recalculate_tournament_results(*, connection, tournament_id: int) -> RecalculationReport:
+def _place_points(
+    scheme: CompiledPointScheme,
+    results: list[ResultRow],
+    places: list[int | None],
+    report: RecalculationReport,
+) -> list[int | None]:
+    """Map the place column in one pass; invalid places are reported per result."""
+    try:
+        return list(scheme.points_many(places))
+    except (TypeError, ValueError):
+        pass
+    place_points: list[int | None] = []
+    for result, place in zip(results, places):
+        try:
+            place_points.append(scheme.points(place))
+        except (TypeError, ValueError) as exc:
+            report.errors.append(f"result_id={result.get('id')}: {exc}")
+            place_points.append(None)
+    return place_points
+
+
+def recalculate_tournament_results(
+    *,
+    connection,
+    tournament_id: int,
+    point_schemes: PointSchemeResolver | None = None,
+) -> RecalculationReport:
     tournament_repo = TournamentRepository(connection)
     result_repo = ResultRepository(connection)
     report = RecalculationReport()
@@ -55,54 +87,68 @@ def recalculate_tournament_results(*, connection, tournament_id: int) -> Recalcu
     ]
     report.tournaments_processed = 1
     is_adult_mode = bool(int(tournament.get("is_adult_mode") or 0))
-    for result in results:
-        try:
-            place = _as_int_or_none(result.get("place"))
-            if is_adult_mode:
-                points_total = _as_int_or_none(result.get("points_total")) or 0
-                points_place = points_total
-                calc_version = "manual_adult_v1"
-            else:
-                points_place = points_for_place(place) if place is not None else 0
-                points_total = points_place
-                calc_version = "v3_no_classification"
-            points_classification = 0
-            ranks = {
-                "rank_set": None,
-                "rank_sector20": None,
-                "rank_big_round": None,
-            }
-
-            result_id = _as_int_or_none(result.get("id"))
-            if result_id is None:
-                raise ValueError("У результата отсутствует корректный id.")
-
-            result_repo.update(
-                result_id,
-                {
-                    "tournament_id": result.get("tournament_id"),
-                    "player_id": result.get("player_id"),
-                    "place": place,
-                    "score_set": result.get("score_set"),
-                    "score_sector20": result.get("score_sector20"),
-                    "score_big_round": result.get("score_big_round"),
-                    "rank_set": ranks["rank_set"],
-                    "rank_sector20": ranks["rank_sector20"],
-                    "rank_big_round": ranks["rank_big_round"],
-                    "points_classification": points_classification,
-                    "points_place": points_place,
-                    "points_total": points_total,
-                    "calc_version": calc_version,
-                },
-            )
-            report.results_updated += 1
-        except Exception as exc:  # noqa: BLE001
-            report.errors.append(f"result_id={result.get('id')}: {exc}")
+    places = [_as_int_or_none(result.get("place")) for result in results]
+    if not is_adult_mode:
+        scheme = (point_schemes or PointSchemeResolver(connection)).for_tournament(tournament)
+        place_points = _place_points(scheme, results, places, report)
+    with repo_session(connection):
+        for index, result in enumerate(results):
+            try:
+                place = places[index]
+                if is_adult_mode:
+                    points_total = _as_int_or_none(result.get("points_total")) or 0
+                    points_place = points_total
+                    calc_version = MANUAL_ADULT_CALC_VERSION
+                else:
+                    points_place = place_points[index]
+                    if points_place is None:
+                        continue
+                    points_total = points_place
+                    calc_version = scheme.calc_version
+                points_classification = 0
+                ranks = {
+                    "rank_set": None,
+                    "rank_sector20": None,
+                    "rank_big_round": None,
+                }
+
+                result_id = _as_int_or_none(result.get("id"))
+                if result_id is None:
+                    raise ValueError("У результата отсутствует корректный id.")
+
+                result_repo.update(
+                    result_id,
+                    {
+                        "tournament_id": result.get("tournament_id"),
+                        "player_id": result.get("player_id"),
+                        "place": place,
+                        "score_set": result.get("score_set"),
+                        "score_sector20": result.get("score_sector20"),
+                        "score_big_round": result.get("score_big_round"),
+                        "rank_set": ranks["rank_set"],
+                        "rank_sector20": ranks["rank_sector20"],
+                        "rank_big_round": ranks["rank_big_round"],
+                        "points_classification": points_classification,
+                        "points_place": points_place,
+                        "points_total": points_total,
+                        "calc_version": calc_version,
+                    },
+                )
+                report.results_updated += 1
+            except Exception as exc:  # noqa: BLE001
+                report.errors.append(f"result_id={result.get('id')}: {exc}")
 
     return report
 
 
-def recalculate_all_tournaments(*, connection) -> RecalculationReport:
+def recalculate_all_tournaments(*, connection, set_based: bool = False) -> RecalculationReport:
+    """Recalculate every tournament and rebuild the current rating tables.
+
+    ``set_based`` runs one joined UPDATE over all results instead of
+    rewriting each result; it writes only rows that change, so
+    ``results_updated`` and ``results_by_tournament`` count actual changes.
+    """
+    from app.services.rating_current import rebuild_current_ratings
     from app.services.restore_points import create_restore_point
 
     tournament_repo = TournamentRepository(connection)
@@ -117,24 +163,92 @@ def recalculate_all_tournaments(*, connection) -> RecalculationReport:
     tournaments: list[TournamentRow] = [
         cast(TournamentRow, item) for item in tournaments_raw if isinstance(item, dict)
     ]
+    if set_based:
+        with repo_session(connection):
+            report = _recalculate_set_based(connection, tournaments)
+            rebuild_current_ratings(connection)
+        return report
+    point_schemes = PointSchemeResolver(connection)
+    with repo_session(connection):
+        for tournament in tournaments:
+            tournament_id = _as_int_or_none(tournament.get("id"))
+            if tournament_id is None:
+                report.errors.append("tournament_id=<missing>: отсутствует корректный id турнира")
+                continue
+            try:
+                one_report = recalculate_tournament_results(
+                    connection=connection,
+                    tournament_id=tournament_id,
+                    point_schemes=point_schemes,
+                )
+                report.tournaments_processed += one_report.tournaments_processed
+                report.results_updated += one_report.results_updated
+                report.results_by_tournament[tournament_id] = one_report.results_updated
+                report.warnings.extend(
+                    f"tournament_id={tournament_id}: {item}" for item in one_report.warnings
+                )
+                report.errors.extend(
+                    f"tournament_id={tournament_id}: {item}" for item in one_report.errors
+                )
+            except Exception as exc:  # noqa: BLE001
+                report.errors.append(f"tournament_id={tournament_id}: {exc}")
+        rebuild_current_ratings(connection)
+    return report
+
+
+def recalculate_season_points(
+    *,
+    connection,
+    season: str,
+    scheme: CompiledPointScheme | None = None,
+) -> RecalculationReport:
+    """Re-score every place-scored result of a season in a single pass.
+
+    ``scheme`` forces one table for the whole season; otherwise each
+    tournament uses the scheme resolved for its season and category. Only
+    rows whose points or ``calc_version`` change are written.
+    """
+    from app.services.rating_current import rebuild_current_ratings
+
+    tournaments = [
+        cast(TournamentRow, item)
+        for item in TournamentRepository(connection).list()
+        if str(item.get("season") or "").strip() == season and not int(item.get("is_adult_mode") or 0)
+    ]
+    with repo_session(connection):
+        report = _recalculate_set_based(connection, tournaments, scheme=scheme)
+        if report.results_updated:
+            rebuild_current_ratings(connection)
+    return report
+
+
+def _recalculate_set_based(
+    connection,
+    tournaments: list[TournamentRow],
+    *,
+    scheme: CompiledPointScheme | None = None,
+) -> RecalculationReport:
+    point_schemes = PointSchemeResolver(connection)
+    report = RecalculationReport()
+    tournament_versions: dict[int, str] = {}
+    point_tables: dict[str, Sequence[int]] = {}
     for tournament in tournaments:
         tournament_id = _as_int_or_none(tournament.get("id"))
         if tournament_id is None:
             report.errors.append("tournament_id=<missing>: отсутствует корректный id турнира")
             continue
-        try:
-            one_report = recalculate_tournament_results(
-                connection=connection,
-                tournament_id=tournament_id,
-            )
-            report.tournaments_processed += one_report.tournaments_processed
-            report.results_updated += one_report.results_updated
-            report.warnings.extend(
-                f"tournament_id={tournament_id}: {item}" for item in one_report.warnings
-            )
-            report.errors.extend(
-                f"tournament_id={tournament_id}: {item}" for item in one_report.errors
-            )
-        except Exception as exc:  # noqa: BLE001
-            report.errors.append(f"tournament_id={tournament_id}: {exc}")
+        if int(tournament.get("is_adult_mode") or 0):
+            tournament_versions[tournament_id] = MANUAL_ADULT_CALC_VERSION
+            continue
+        tournament_scheme = scheme or point_schemes.for_tournament(tournament)
+        tournament_versions[tournament_id] = tournament_scheme.calc_version
+        point_tables[tournament_scheme.calc_version] = tournament_scheme.lookup
+
+    report.results_by_tournament = ResultRepository(connection).recalculate_points(
+        tournament_versions,
+        point_tables,
+        manual_calc_version=MANUAL_ADULT_CALC_VERSION,
+    )
+    report.tournaments_processed = len(tournament_versions)
+    report.results_updated = sum(report.results_by_tournament.values())
     return report
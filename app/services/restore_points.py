@@ -173,9 +173,11 @@ def _apply_restore_action(*, paths, payload: dict[str, Any]) -> dict[str, Any]:
     source_path = Path(str(payload.get("file_path") or ""))
     if not source_path.exists():
         return {"action": "restore_db", "status": "missing_restore_point"}
+    from app.db.database import get_connection, release_database
+
     paths.db_path.parent.mkdir(parents=True, exist_ok=True)
+    release_database(paths.db_path, discard_wal=True)
     shutil.copy2(source_path, paths.db_path)
-    from app.db.database import get_connection
 
     connection = get_connection(paths.db_path)
     try:
@@ -192,6 +194,9 @@ def _apply_restore_action(*, paths, payload: dict[str, Any]) -> dict[str, Any]:
 
 
 def _apply_reset_action(*, paths) -> dict[str, Any]:
+    from app.db.database import get_connection, release_database
+
+    release_database(paths.db_path)
     timestamp = _timestamp_token()
     backup_dir = paths.profile_backups_dir / f"profile_reset_{timestamp}"
     if paths.profile_root.exists():
@@ -207,8 +212,6 @@ def _apply_reset_action(*, paths) -> dict[str, Any]:
             else:
                 child.unlink(missing_ok=True)
     paths.ensure_exists()
-    from app.db.database import get_connection
-
     connection = get_connection(paths.db_path)
     try:
         AuditLogService(connection).log_event(
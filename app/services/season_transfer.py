@@ -11,8 +11,11 @@ from app.db.repositories import (
     ResultRepository,
     TournamentRepository,
 )
-from app.domain.rating import build_rating_snapshot
+from app.db.unit_of_work import repo_session
+from app.domain.rating import RatingSnapshotRow, build_rating_snapshot_from_totals
 from app.services.audit_log import AuditLogService, SEASON_TRANSFER_APPLIED
+from app.services.rating_current import list_current_rating
+from app.services.rating_snapshot import LEAGUE_SCOPE
 from app.services.restore_points import create_restore_point
 
 
@@ -51,14 +54,10 @@ def compute_season_transfer_candidates(
     """Compute candidates for season-level transfers between two leagues."""
     result_repo = ResultRepository(connection)
 
-    premier_results = result_repo.list_results_for_rating(
-        league_code=premier_league_code, statuses=["published"]
-    )
-    first_results = result_repo.list_results_for_rating(
-        league_code=first_league_code, statuses=["published"]
-    )
+    premier_snapshot = _league_rating(connection, result_repo, premier_league_code, n)
+    first_snapshot = _league_rating(connection, result_repo, first_league_code, n)
 
-    if not premier_results or not first_results:
+    if not premier_snapshot or not first_snapshot:
         return SeasonTransferPreview(
             available=False,
             reason="Нет опубликованных результатов для одной из лиг.",
@@ -67,9 +66,6 @@ def compute_season_transfer_candidates(
             warnings=[],
         )
 
-    premier_snapshot = build_rating_snapshot(premier_results, n)
-    first_snapshot = build_rating_snapshot(first_results, n)
-
     warnings: list[str] = []
 
     relegated = _select_bottom(
@@ -95,6 +91,20 @@ def compute_season_transfer_candidates(
     )
 
 
+def _league_rating(
+    connection,
+    result_repo: ResultRepository,
+    league_code: str,
+    n: int,
+) -> list[RatingSnapshotRow]:
+    current = list_current_rating(connection, scope_type=LEAGUE_SCOPE, scope_key=league_code, n=n)
+    if current is not None:
+        return current
+    return build_rating_snapshot_from_totals(
+        result_repo.list_rating_totals(n, league_code=league_code, statuses=["published"])
+    )
+
+
 def apply_season_transfers(
     *,
     connection,
@@ -112,58 +122,55 @@ def apply_season_transfers(
         operation_group_id=operation_group_id,
     )
 
-    # Create a marker tournament to satisfy the FK constraint
-    tournament_repo = TournamentRepository(connection)
-    now_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    marker_tournament_id = tournament_repo.create(
-        {
-            "name": f"Сезонные переходы {now_str}",
-            "date": now_str,
-            "category_code": "TRANSFER",
-            "league_code": "TRANSFER",
-            "is_adult_mode": 0,
-            "source_files": "[]",
-            "status": "published",
-            "type": "season_transfer",
-        }
-    )
-
-    created_at = datetime.now(timezone.utc).isoformat(timespec="microseconds")
-    entries: list[dict[str, object]] = []
-
-    for candidate in preview.relegated:
-        entries.append(
+    with repo_session(connection):
+        # Create a marker tournament to satisfy the FK constraint; a failed
+        # insert below rolls it back together with the transfer rows
+        tournament_repo = TournamentRepository(connection)
+        now_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        marker_tournament_id = tournament_repo.create(
             {
-                "player_id": candidate.player_id,
-                "from_league_code": candidate.league_code,
-                "to_league_code": "FIRST",
-                "source_tournament_id": marker_tournament_id,
-                "reason": "season_transfer",
-                "operation_group_id": operation_group_id,
-                "created_at": created_at,
+                "name": f"Сезонные переходы {now_str}",
+                "date": now_str,
+                "category_code": "TRANSFER",
+                "league_code": "TRANSFER",
+                "is_adult_mode": 0,
+                "source_files": "[]",
+                "status": "published",
+                "type": "season_transfer",
             }
         )
 
-    for candidate in preview.promoted:
-        entries.append(
-            {
-                "player_id": candidate.player_id,
-                "from_league_code": candidate.league_code,
-                "to_league_code": "PREMIER",
-                "source_tournament_id": marker_tournament_id,
-                "reason": "season_transfer",
-                "operation_group_id": operation_group_id,
-                "created_at": created_at,
-            }
-        )
+        created_at = datetime.now(timezone.utc).isoformat(timespec="microseconds")
+        entries: list[dict[str, object]] = []
 
-    transfer_repo = LeagueTransferRepository(connection)
-    try:
+        for candidate in preview.relegated:
+            entries.append(
+                {
+                    "player_id": candidate.player_id,
+                    "from_league_code": candidate.league_code,
+                    "to_league_code": "FIRST",
+                    "source_tournament_id": marker_tournament_id,
+                    "reason": "season_transfer",
+                    "operation_group_id": operation_group_id,
+                    "created_at": created_at,
+                }
+            )
+
+        for candidate in preview.promoted:
+            entries.append(
+                {
+                    "player_id": candidate.player_id,
+                    "from_league_code": candidate.league_code,
+                    "to_league_code": "PREMIER",
+                    "source_tournament_id": marker_tournament_id,
+                    "reason": "season_transfer",
+                    "operation_group_id": operation_group_id,
+                    "created_at": created_at,
+                }
+            )
+
+        transfer_repo = LeagueTransferRepository(connection)
         transfer_repo.create_many(entries)
-    except Exception:
-        # Rollback marker tournament on failure to avoid orphan rows
-        tournament_repo.delete(marker_tournament_id)
-        raise
 
     # Audit logging is non-critical; failure here does not corrupt transfer data
     try:
@@ -11,6 +11,8 @@ from __future__ import annotations
 import sqlite3
 from dataclasses import dataclass
 
+from app.db.unit_of_work import commit
+
 
 @dataclass(frozen=True)
 class TagRecord:
@@ -26,7 +28,7 @@ def create_tag(connection: sqlite3.Connection, name: str, color: str | None = No
         "INSERT INTO tags (name, color) VALUES (?, ?)",
         (name.strip(), color),
     )
-    connection.commit()
+    commit(connection)
     return int(cursor.lastrowid)  # type: ignore[arg-type]
 
 
@@ -42,7 +44,7 @@ def assign_tag(connection: sqlite3.Connection, tag_id: int, entity_type: str, en
         "INSERT OR IGNORE INTO entity_tags (tag_id, entity_type, entity_id) VALUES (?, ?, ?)",
         (tag_id, entity_type, entity_id),
     )
-    connection.commit()
+    commit(connection)
 
 
 def remove_tag_assignment(connection: sqlite3.Connection, tag_id: int, entity_type: str, entity_id: str) -> None:
@@ -51,7 +53,7 @@ def remove_tag_assignment(connection: sqlite3.Connection, tag_id: int, entity_ty
         "DELETE FROM entity_tags WHERE tag_id = ? AND entity_type = ? AND entity_id = ?",
         (tag_id, entity_type, entity_id),
     )
-    connection.commit()
+    commit(connection)
 
 
 def list_entity_tags(connection: sqlite3.Connection, entity_type: str, entity_id: str) -> list[TagRecord]:
@@ -72,4 +74,4 @@ def list_entity_tags(connection: sqlite3.Connection, entity_type: str, entity_id
 def delete_tag(connection: sqlite3.Connection, tag_id: int) -> None:
     """Delete a tag and all its assignments."""
     connection.execute("DELETE FROM tags WHERE id = ?", (tag_id,))
-    connection.commit()
+    commit(connection)
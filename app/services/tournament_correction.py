@@ -9,7 +9,14 @@ from typing import Any
 from app.db.repositories import TournamentRepository
 from app.domain.tournament_lifecycle import TournamentStatus
 from app.services.audit_log import AuditLogService, TOURNAMENT_CORRECTED
+from app.services.rating_current import refresh_current_rating_scopes
+from app.services.rating_dependencies import (
+    build_withdrawal_impact,
+    collect_tournament_dependencies,
+    regenerate_dependent_sessions,
+)
 from app.services.recalculate_tournament import recalculate_tournament_results
+from app.services.rating_snapshot import _build_scope_requests
 from app.services.restore_points import create_restore_point
 from app.services.tournament_lifecycle import transition_tournament_status
 
@@ -40,11 +47,17 @@ def correct_tournament(
     updates: dict[str, Any] | None = None,
     actor: str | None = None,
     operation_group_id: str | None = None,
+    n_value: int = 3,
 ) -> dict[str, Any]:
     """Apply correction operation for a published tournament.
 
     The operation requires a reason, writes explicit audit old/new payload,
     recalculates affected results and records correction trace in tournament history.
+    Only the rating scopes the tournament fed (before and after the update)
+    are re-materialized, and the stored snapshot sessions that counted the
+    tournament are regenerated with ``n_value`` (the N snapshots are
+    published with). The result lists the players whose place moved and the
+    regenerated sessions.
     """
 
     normalized_reason = str(reason or "").strip()
@@ -70,6 +83,9 @@ def correct_tournament(
         operation_group_id=operation_group_id,
     )
 
+    dependencies = collect_tournament_dependencies(connection, tournament)
+    rating_impacts = build_withdrawal_impact(connection, dependencies, n_value=n_value)
+
     requested_updates = dict(updates or {})
     editable_updates = {
         key: value for key, value in requested_updates.items() if key in _TOURNAMENT_CORRECTION_FIELDS
@@ -108,6 +124,30 @@ def correct_tournament(
         connection=connection,
         tournament_id=tournament_id,
     )
+    # The status change re-materializes the tournament's current scopes; a
+    # category or league change also leaves its previous scopes to refresh.
+    current_scopes = {
+        (scope_type, scope_key)
+        for scope_type, scope_key, _filters in _build_scope_requests({**tournament, **editable_updates})
+    }
+    stale_scope_requests = [
+        request for request in dependencies.scope_requests if (request[0], request[1]) not in current_scopes
+    ]
+    refresh_current_rating_scopes(connection, stale_scope_requests)
+    regenerated_sessions = regenerate_dependent_sessions(connection, dependencies, n_value=n_value)
+    moved_players = [
+        {
+            "scope_type": impact.scope_type,
+            "scope_key": impact.scope_key,
+            "player_id": row.player_id,
+            "fio": row.fio,
+            "old_place": row.old_place,
+            "new_place": row.new_place,
+            "points_delta": row.points_delta,
+        }
+        for impact in rating_impacts
+        for row in impact.rows
+    ]
 
     audit_log_service.log_event(
         TOURNAMENT_CORRECTED,
@@ -121,6 +161,10 @@ def correct_tournament(
             "tournament_id": tournament_id,
             "changed_fields": sorted(editable_updates.keys()),
             "recalculated_results": recalc_report.results_updated,
+            "affected_scopes": [f"{scope_type}:{scope_key}" for scope_type, scope_key in dependencies.scopes],
+            "affected_snapshot_sessions": list(dependencies.snapshot_session_ids),
+            "regenerated_snapshot_sessions": regenerated_sessions,
+            "moved_players": len(moved_players),
             "warnings": recalc_report.warnings,
             "errors": recalc_report.errors,
             "history_marker": "correction",
@@ -140,6 +184,10 @@ def correct_tournament(
         "to_status": TournamentStatus.REVIEW.value,
         "changed_fields": sorted(editable_updates.keys()),
         "results_recalculated": recalc_report.results_updated,
+        "affected_scopes": list(dependencies.scopes),
+        "affected_snapshot_sessions": list(dependencies.snapshot_session_ids),
+        "regenerated_snapshot_sessions": regenerated_sessions,
+        "moved_players": moved_players,
         "warnings": recalc_report.warnings,
         "errors": recalc_report.errors,
         "operation_group_id": operation_id,
@@ -6,6 +6,7 @@ import json
 from typing import Any
 
 from app.db.repositories import TournamentRepository
+from app.db.unit_of_work import repo_session
 from app.domain.tournament_lifecycle import TournamentStatus, can_transition
 from app.services.audit_log import (
     AuditLogService,
@@ -70,57 +71,63 @@ def transition_tournament_status(
             },
         }
 
-    actor = payload.get("actor")
-    tournament_repo.set_status(
-        tournament_id,
-        target_status,
-        actor=str(actor) if actor is not None else None,
-        context=payload,
-    )
-
-    reason = str(payload.get("reason") or "").strip() or None
-    source = str(payload.get("actor") or "").strip() or "tournament_lifecycle"
-    operation_group_id = str(payload.get("operation_group_id") or "").strip() or None
-    old_value_json = json.dumps({"status": from_status}, ensure_ascii=False)
-    new_value_json = json.dumps({"status": target_status}, ensure_ascii=False)
-    event_type = _resolve_tournament_event_type(from_status=from_status, to_status=target_status)
-    audit_log_service.log_event(
-        event_type,
-        "Статус турнира изменён",
-        f"Турнир ID: {tournament_id}; {from_status} -> {target_status}",
-        context={
-            "tournament_id": tournament_id,
-            "from_status": from_status,
-            "to_status": target_status,
-            "reason": reason,
-        },
-        entity_type="tournament",
-        entity_id=str(tournament_id),
-        reason=reason,
-        old_value_json=old_value_json,
-        new_value_json=new_value_json,
-        source=source,
-        operation_group_id=operation_group_id,
-    )
-
-    snapshot_result = None
-    transfer_result = None
-    if target_status == TournamentStatus.PUBLISHED.value:
-        from app.services.rating_snapshot import create_rating_snapshot_for_tournament_publish
-        from app.services.league_transfer import record_league_transfers_for_tournament_publish
-
-        snapshot_result = create_rating_snapshot_for_tournament_publish(
-            connection=connection,
-            tournament_id=tournament_id,
-            n_value=3,
-            operation_group_id=operation_group_id,
+    with repo_session(connection):
+        actor = payload.get("actor")
+        tournament_repo.set_status(
+            tournament_id,
+            target_status,
+            actor=str(actor) if actor is not None else None,
+            context=payload,
         )
-        transfer_result = record_league_transfers_for_tournament_publish(
-            connection=connection,
-            tournament_id=tournament_id,
+
+        reason = str(payload.get("reason") or "").strip() or None
+        source = str(payload.get("actor") or "").strip() or "tournament_lifecycle"
+        operation_group_id = str(payload.get("operation_group_id") or "").strip() or None
+        old_value_json = json.dumps({"status": from_status}, ensure_ascii=False)
+        new_value_json = json.dumps({"status": target_status}, ensure_ascii=False)
+        event_type = _resolve_tournament_event_type(from_status=from_status, to_status=target_status)
+        audit_log_service.log_event(
+            event_type,
+            "Статус турнира изменён",
+            f"Турнир ID: {tournament_id}; {from_status} -> {target_status}",
+            context={
+                "tournament_id": tournament_id,
+                "from_status": from_status,
+                "to_status": target_status,
+                "reason": reason,
+            },
+            entity_type="tournament",
+            entity_id=str(tournament_id),
+            reason=reason,
+            old_value_json=old_value_json,
+            new_value_json=new_value_json,
+            source=source,
             operation_group_id=operation_group_id,
         )
 
+        snapshot_result = None
+        transfer_result = None
+        if target_status == TournamentStatus.PUBLISHED.value:
+            from app.services.rating_snapshot import create_rating_snapshot_for_tournament_publish
+            from app.services.league_transfer import record_league_transfers_for_tournament_publish
+
+            snapshot_result = create_rating_snapshot_for_tournament_publish(
+                connection=connection,
+                tournament_id=tournament_id,
+                n_value=3,
+                operation_group_id=operation_group_id,
+            )
+            transfer_result = record_league_transfers_for_tournament_publish(
+                connection=connection,
+                tournament_id=tournament_id,
+                operation_group_id=operation_group_id,
+            )
+
+        if TournamentStatus.PUBLISHED.value in {from_status, target_status}:
+            from app.services.rating_current import refresh_current_ratings_for_tournament
+
+            refresh_current_ratings_for_tournament(connection, tournament_id)
+
     return {
         "ok": True,
         "data": {
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import json
+from pathlib import Path
+
 from app.runtime_paths import get_runtime_paths
 
 
@@ -8,8 +10,9 @@ def get_settings_path():
     return get_runtime_paths().settings_path
 
 
-def load_settings() -> dict[str, object]:
-    path = get_settings_path()
+def load_settings(path: Path | None = None) -> dict[str, object]:
+    if path is None:
+        path = get_settings_path()
     if not path.exists():
         return {}
     try:
@@ -101,3 +104,17 @@ def get_organization_profile() -> dict[str, object]:
 def update_organization_profile(data: dict[str, object]) -> None:
     """Update organization profile settings."""
     update_setting("organization_profile", data)
+
+
+def get_database_settings(settings_path: Path | None = None) -> dict[str, object]:
+    """Get SQLite connection tuning overrides (journal_mode, cache_size, ...).
+
+    Missing keys fall back to ``app.db.database.DEFAULT_PRAGMA_PROFILE``.
+    """
+    value = load_settings(settings_path).get("database")
+    return value if isinstance(value, dict) else {}
+
+
+def update_database_settings(database: dict[str, object]) -> None:
+    """Update SQLite connection tuning overrides; applied after restart."""
+    update_setting("database", database)
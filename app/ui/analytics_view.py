@@ -18,7 +18,7 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from app.db.database import get_connection
+from app.db.database import get_read_connection
 from app.services.analytics import AnalyticsService
 
 logger = logging.getLogger(__name__)
@@ -67,7 +67,7 @@ class TournamentAnalyticsTab(QWidget):
 
     def _load_tournaments(self) -> None:
         try:
-            connection = get_connection()
+            connection = get_read_connection()
             rows = connection.execute(
                 "SELECT id, name, date FROM tournaments ORDER BY date DESC, name"
             ).fetchall()
@@ -84,7 +84,7 @@ class TournamentAnalyticsTab(QWidget):
         if tournament_id is None:
             return
         try:
-            connection = get_connection()
+            connection = get_read_connection()
             stats = self._service.tournament_stats(connection, int(tournament_id))
             self._stats_table.setRowCount(0)
             if stats is None:
@@ -161,7 +161,7 @@ class PlayerAnalyticsTab(QWidget):
 
     def _load_players(self) -> None:
         try:
-            connection = get_connection()
+            connection = get_read_connection()
             rows = connection.execute(
                 "SELECT id, last_name, first_name FROM players ORDER BY last_name, first_name"
             ).fetchall()
@@ -178,7 +178,7 @@ class PlayerAnalyticsTab(QWidget):
         if player_id is None:
             return
         try:
-            connection = get_connection()
+            connection = get_read_connection()
             progress = self._service.player_progress(connection, int(player_id))
             self._progress_table.setRowCount(len(progress))
             for i, entry in enumerate(progress):
@@ -260,7 +260,7 @@ class ComparisonTab(QWidget):
     def _refresh_list(self) -> None:
         self._selection_list.clear()
         try:
-            connection = get_connection()
+            connection = get_read_connection()
             if self._mode_combo.currentText() == "Турниры":
                 rows = connection.execute(
                     "SELECT id, name, date FROM tournaments ORDER BY date DESC, name"
@@ -292,7 +292,7 @@ class ComparisonTab(QWidget):
         if not ids:
             return
         try:
-            connection = get_connection()
+            connection = get_read_connection()
             if self._mode_combo.currentText() == "Турниры":
                 entries = self._service.compare_tournaments(connection, ids)
                 self._results_table.setColumnCount(5)
@@ -14,6 +14,9 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
 )
 
+from app.services.import_session import ImportSession
+from app.services.import_xlsx import TableBlock
+
 
 class ColumnMappingDialog(QDialog):
     def __init__(
@@ -27,6 +30,8 @@ class ColumnMappingDialog(QDialog):
         self.resize(950, 560)
 
         self._headers = [str(item) for item in headers]
+        self._session: ImportSession | None = None
+        self._block: TableBlock | None = None
         self._required_groups = (
             (("fio",), "ФИО"),
             (("birth_year", "birth_date"), "Дата рождения или год рождения"),
@@ -93,6 +98,26 @@ class ColumnMappingDialog(QDialog):
         self._guess_initial_mapping()
         self._update_status()
 
+    @classmethod
+    def for_block(
+        cls,
+        session: ImportSession,
+        block: TableBlock,
+        parent=None,
+    ) -> "ColumnMappingDialog":
+        """Build the dialog from a session's preview of ``block``."""
+        headers, preview_rows = session.preview(block)
+        dialog = cls(headers, preview_rows, parent)
+        dialog._session = session
+        dialog._block = block
+        return dialog
+
+    def mapped_block(self) -> TableBlock:
+        """The block re-read with the chosen mapping; only for dialogs built by ``for_block``."""
+        if self._session is None or self._block is None:
+            raise RuntimeError("Диалог создан без сессии импорта.")
+        return self._session.remap(self._block, self.mapping())
+
     def mapping(self) -> dict[str, str]:
         mapped: dict[str, str] = {}
         for key, combo in self._combos.items():
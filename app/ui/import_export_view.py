@@ -1,9 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import replace
 from uuid import uuid4
 
-from PySide6.QtCore import QDate, Qt
+from PySide6.QtCore import QDate, QObject, QThread, Qt, Signal
 from PySide6.QtWidgets import (
     QApplication,
     QCheckBox,
@@ -19,6 +18,7 @@ from PySide6.QtWidgets import (
     QListWidget,
     QListWidgetItem,
     QMessageBox,
+    QProgressDialog,
     QPushButton,
     QScrollArea,
     QSizePolicy,
@@ -34,10 +34,13 @@ from app.services.category_suggestion import suggest_category_code
 from app.services.import_report import build_import_session_report, persist_import_session_report
 from app.services.import_review import build_import_rating_preview
 from app.services.league_transfer import build_league_transfer_preview
+from app.services.rating_engine import RatingEngine
 from app.services.import_pipeline import (
+    SUPPORTED_IMPORT_EXTENSIONS,
     parse_tables_from_clipboard_text,
     parse_tables_from_file,
 )
+from app.services.import_session import ImportSession
 from app.services.import_xlsx import (
     ImportApplyReport,
     TableBlock,
@@ -45,9 +48,6 @@ from app.services.import_xlsx import (
     import_batch_from_folder,
     import_tournament_table_blocks,
     list_import_profiles,
-    parse_table_block_with_mapping,
-    parse_tables_from_xlsx_with_report,
-    read_table_block_preview,
     save_import_profile,
 )
 from app.services.tournament_lifecycle import transition_tournament_status
@@ -176,6 +176,31 @@ class ImportProfilesDialog(QDialog):
         self._reload()
 
 
+class FolderImportWorker(QObject):
+    """Parses a folder of protocols on a worker thread; touches files only, never the database."""
+
+    progress = Signal(int, int)
+    finished = Signal(dict)
+    failed = Signal(str)
+
+    def __init__(self, folder: str) -> None:
+        super().__init__()
+        self._folder = folder
+
+    def run(self) -> None:
+        try:
+            result = import_batch_from_folder(
+                self._folder,
+                workers=None,
+                extensions=SUPPORTED_IMPORT_EXTENSIONS,
+                progress=self.progress.emit,
+            )
+        except Exception as exc:  # noqa: BLE001
+            self.failed.emit(str(exc) or type(exc).__name__)
+            return
+        self.finished.emit(result)
+
+
 class ImportExportView(QWidget):
     def __init__(self, tournaments_view: QWidget | None = None) -> None:
         super().__init__()
@@ -183,7 +208,12 @@ class ImportExportView(QWidget):
         self._connection = get_connection()
         self._tournament_repo = TournamentRepository(self._connection)
         self._audit_log_service = AuditLogService(self._connection)
+        self._rating_engine = RatingEngine(self._connection)
         self._tournaments_view = tournaments_view
+        self._folder_import_thread: QThread | None = None
+        self._folder_import_worker: FolderImportWorker | None = None
+        self._folder_import_progress: QProgressDialog | None = None
+        self._folder_import_path = ""
         self.setAcceptDrops(True)
 
         root_layout = QVBoxLayout(self)
@@ -279,7 +309,8 @@ class ImportExportView(QWidget):
         if not file_path:
             return
 
-        blocks = parse_tables_from_xlsx_with_report(file_path)
+        session = ImportSession(file_path)
+        blocks = session.blocks
         if not blocks:
             self._audit_log_service.log_event(
                 IMPORT_FILE,
@@ -303,8 +334,7 @@ class ImportExportView(QWidget):
         for block_index in selected:
             block = blocks[block_index]
             if block.needs_mapping or block.confidence < 1.0:
-                headers, preview_rows = read_table_block_preview(file_path, block)
-                mapping_dialog = ColumnMappingDialog(headers, preview_rows, self)
+                mapping_dialog = ColumnMappingDialog.for_block(session, block, self)
                 if mapping_dialog.exec() != QDialog.DialogCode.Accepted:
                     return
 
@@ -329,15 +359,7 @@ class ImportExportView(QWidget):
                     }
                 )
 
-                mapped_rows = parse_table_block_with_mapping(file_path, block, selected_mapping)
-                block = replace(
-                    block,
-                    rows=mapped_rows,
-                    needs_mapping=False,
-                    confidence=1.0,
-                    missing_required_columns=[],
-                    errors=[],
-                )
+                block = mapping_dialog.mapped_block()
             selected_blocks.append(block)
 
         preview_rows = [row for block in selected_blocks for row in block.rows]
@@ -409,6 +431,8 @@ class ImportExportView(QWidget):
             connection=self._connection,
             tournament_id=apply_report.tournament_id,
             n_value=3,
+            engine=self._rating_engine,
+            include_tables=False,
         )
         league_preview = build_league_transfer_preview(
             connection=self._connection,
@@ -641,17 +665,60 @@ class ImportExportView(QWidget):
         dialog.exec()
 
     def _on_import_folder_clicked(self) -> None:
-        folder = QFileDialog.getExistingDirectory(self, "Выберите папку с XLSX")
-        if not folder:
+        folder = QFileDialog.getExistingDirectory(self, "Выберите папку с протоколами")
+        if not folder or self._folder_import_thread is not None:
             return
-        result = import_batch_from_folder(folder)
+        self._folder_import_path = folder
+        self.import_folder_button.setEnabled(False)
+
+        progress_dialog = QProgressDialog("Разбор протоколов...", "", 0, 0, self)
+        progress_dialog.setWindowTitle("Импорт папки")
+        progress_dialog.setCancelButton(None)
+        progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
+        progress_dialog.setMinimumDuration(0)
+        progress_dialog.setAutoClose(False)
+        progress_dialog.setAutoReset(False)
+        progress_dialog.show()
+        self._folder_import_progress = progress_dialog
+
+        # Parsing runs on a worker thread; results come back through queued
+        # signals, so the audit log and message boxes stay on the UI thread.
+        thread = QThread(self)
+        worker = FolderImportWorker(folder)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.progress.connect(self._on_folder_import_progress)
+        worker.finished.connect(self._on_folder_import_finished)
+        worker.failed.connect(self._on_folder_import_failed)
+        worker.finished.connect(thread.quit)
+        worker.failed.connect(thread.quit)
+        thread.finished.connect(self._on_folder_import_thread_finished)
+        self._folder_import_thread = thread
+        self._folder_import_worker = worker
+        thread.start()
+
+    def _on_folder_import_progress(self, done: int, total: int) -> None:
+        progress_dialog = self._folder_import_progress
+        if progress_dialog is None:
+            return
+        progress_dialog.setMaximum(total)
+        progress_dialog.setLabelText(f"Разобрано файлов: {done} из {total}")
+        # A modal dialog pumps events in setValue, which may deliver the result.
+        progress_dialog.setValue(done)
+
+    def _on_folder_import_finished(self, result: dict[str, object]) -> None:
+        self._close_folder_import_progress()
         level = "warning" if result["error"] else "info"
         self._audit_log_service.log_event(
             IMPORT_FOLDER,
             "Импорт папки завершён",
             f"Успешно: {result['success']}; ошибок: {result['error']}",
             level=level,
-            context={"folder": folder, "success": result["success"], "error": result["error"]},
+            context={
+                "folder": self._folder_import_path,
+                "success": result["success"],
+                "error": result["error"],
+            },
         )
         QMessageBox.information(
             self,
@@ -659,6 +726,32 @@ class ImportExportView(QWidget):
             f"Успешно: {result['success']}\nОшибок: {result['error']}",
         )
 
+    def _on_folder_import_failed(self, message: str) -> None:
+        self._close_folder_import_progress()
+        self._audit_log_service.log_event(
+            ERROR,
+            "Ошибка импорта папки",
+            message,
+            level="error",
+            context={"folder": self._folder_import_path},
+        )
+        QMessageBox.warning(self, "Импорт папки", message)
+
+    def _on_folder_import_thread_finished(self) -> None:
+        if self._folder_import_worker is not None:
+            self._folder_import_worker.deleteLater()
+        if self._folder_import_thread is not None:
+            self._folder_import_thread.deleteLater()
+        self._folder_import_worker = None
+        self._folder_import_thread = None
+        self.import_folder_button.setEnabled(True)
+
+    def _close_folder_import_progress(self) -> None:
+        if self._folder_import_progress is not None:
+            self._folder_import_progress.close()
+            self._folder_import_progress.deleteLater()
+            self._folder_import_progress = None
+
     def _on_import_profiles_clicked(self) -> None:
         dialog = ImportProfilesDialog(self)
         dialog.exec()
@@ -28,7 +28,11 @@ from app.services.coach_tasks import (
 )
 from app.services.league_transfer import LeagueTransferEvent, list_player_league_transfers
 from app.services.notes import EntityNoteDefaults, NoteRecord, create_note, list_entity_notes
-from app.services.rating_snapshot import PlayerRatingStateEntry, list_latest_player_rating_states
+from app.services.rating_snapshot import (
+    PlayerRatingStateEntry,
+    list_latest_player_rating_states,
+    list_player_rating_series,
+)
 from app.services.training_journal import TrainingEntryRecord, create_training_entry, list_player_training_entries
 from app.services.training_plans import TrainingPlanRecord, list_player_training_plans
 from app.ui.attachments_widget import AttachmentsWidget
@@ -460,10 +464,17 @@ class PlayerCardDialog(QDialog):
         if not self._rating_states:
             self.rating_trend_label.setText("Динамика: нет данных")
             return
-        # Compare first (current/best) position vs last (oldest) position
+        # Compare the current position with the oldest snapshot of the same scope.
         # Lower position number is better
-        current = self._rating_states[0]
-        oldest = self._rating_states[-1]
+        state = self._rating_states[0]
+        series = list_player_rating_series(
+            self._connection,
+            player_id=self._player_id,
+            scope_type=state.scope_type,
+            scope_key=state.scope_key,
+        )
+        current = series[-1] if series else state
+        oldest = series[0] if series else state
         if current.position < oldest.position:
             trend = "рост"
         elif current.position > oldest.position:
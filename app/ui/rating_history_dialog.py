@@ -96,12 +96,7 @@ class RatingHistoryDialog(QDialog):
             return
 
         session = self._sessions[current_row]
-        self._rows = list_rating_snapshot_rows(
-            self._connection,
-            snapshot_created_at=session.created_at,
-            scope_type=session.scope_type,
-            scope_key=session.scope_key,
-        )
+        self._rows = list_rating_snapshot_rows(self._connection, session_id=session.id)
         self.rows_table.setRowCount(0)
         for entry in self._rows:
             row_index = self.rows_table.rowCount()
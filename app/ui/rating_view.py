@@ -1,9 +1,14 @@
 from __future__ import annotations
 
-from PySide6.QtCore import Qt
+from dataclasses import replace
+from typing import Any
+
+from PySide6.QtCore import QDate, Qt
 from PySide6.QtGui import QStandardItem, QStandardItemModel
 from PySide6.QtWidgets import (
+    QCheckBox,
     QComboBox,
+    QDateEdit,
     QFileDialog,
     QGridLayout,
     QGroupBox,
@@ -23,9 +28,12 @@ from PySide6.QtWidgets import (
 
 from app.db.database import get_connection
 from app.db.repositories import ResultRepository, TournamentRepository
-from app.domain.rating import RatingSnapshotRow, build_rating_snapshot
+from app.domain.identity import fio_matches_search
+from app.domain.rating import RatingSnapshotRow, build_rating_snapshot_from_totals
 from app.services.audit_log import AuditLogService, ERROR, EXPORT_FILE
 from app.services.export_service import ExportService
+from app.services.rating_current import list_current_rating
+from app.services.rating_engine import RatingEngine
 from app.services.notes import EntityNoteDefaults
 from app.ui.entity_notes_dialog import EntityNotesDialog
 from app.ui.labels import adult_scope_label, category_label
@@ -48,6 +56,7 @@ class RatingView(QWidget):
         self._connection = get_connection()
         self._tournament_repo = TournamentRepository(self._connection)
         self._result_repo = ResultRepository(self._connection)
+        self._rating_engine = RatingEngine(self._connection)
         self._export_service = ExportService()
         self._audit_log_service = AuditLogService(self._connection)
 
@@ -88,6 +97,12 @@ class RatingView(QWidget):
         self._search_input = QLineEdit(filters_box)
         self._search_input.setPlaceholderText("Поиск по ФИО")
 
+        self._as_of_check = QCheckBox("На дату:", filters_box)
+        self._as_of_edit = QDateEdit(QDate.currentDate(), filters_box)
+        self._as_of_edit.setCalendarPopup(True)
+        self._as_of_edit.setDisplayFormat("dd.MM.yyyy")
+        self._as_of_edit.setEnabled(False)
+
         grid.addWidget(QLabel("Раздел:"), 0, 0)
         grid.addWidget(self._scope_type_combo, 0, 1)
         grid.addWidget(self._scope_value_label, 0, 2)
@@ -96,6 +111,8 @@ class RatingView(QWidget):
         grid.addWidget(self._n_spin, 0, 5)
         grid.addWidget(QLabel("ФИО:"), 0, 6)
         grid.addWidget(self._search_input, 0, 7)
+        grid.addWidget(self._as_of_check, 0, 8)
+        grid.addWidget(self._as_of_edit, 0, 9)
 
         self._scope_type_combo.currentIndexChanged.connect(self._refresh_scope_key_options)
         self._scope_type_combo.currentIndexChanged.connect(self._refresh_table)
@@ -108,6 +125,11 @@ class RatingView(QWidget):
         self._n_spin.valueChanged.connect(self._persist_state)
         self._search_input.textChanged.connect(self._refresh_table)
         self._search_input.textChanged.connect(self._persist_state)
+        self._as_of_check.toggled.connect(self._as_of_edit.setEnabled)
+        self._as_of_check.toggled.connect(self._refresh_table)
+        self._as_of_check.toggled.connect(self._persist_state)
+        self._as_of_edit.dateChanged.connect(self._refresh_table)
+        self._as_of_edit.dateChanged.connect(self._persist_state)
 
         self._refresh_scope_key_options()
 
@@ -167,6 +189,19 @@ class RatingView(QWidget):
             self._n_spin.setValue(max(self._n_spin.minimum(), min(self._n_spin.maximum(), n_value)))
             self._n_spin.blockSignals(False)
 
+        as_of_date = QDate.fromString(str(state.get("as_of_date") or ""), "yyyy-MM-dd")
+        if as_of_date.isValid():
+            self._as_of_edit.blockSignals(True)
+            self._as_of_edit.setDate(as_of_date)
+            self._as_of_edit.blockSignals(False)
+
+        as_of_enabled = state.get("as_of_enabled")
+        if isinstance(as_of_enabled, bool):
+            self._as_of_check.blockSignals(True)
+            self._as_of_check.setChecked(as_of_enabled)
+            self._as_of_check.blockSignals(False)
+            self._as_of_edit.setEnabled(as_of_enabled)
+
         self._refresh_history_button_state()
 
     def _persist_state(self, *_args) -> None:
@@ -177,6 +212,8 @@ class RatingView(QWidget):
                 "scope_key": self._category_combo.currentData(),
                 "search": self._search_input.text(),
                 "n_value": int(self._n_spin.value()),
+                "as_of_enabled": self._as_of_check.isChecked(),
+                "as_of_date": self._as_of_edit.date().toString("yyyy-MM-dd"),
             },
         )
 
@@ -186,21 +223,50 @@ class RatingView(QWidget):
         search_term = self._search_input.text().strip()
         n_value = int(self._n_spin.value())
 
-        raw_results = self._result_repo.list_results_for_rating(
-            category_code=str(scope_key) if scope_type == CATEGORY_SCOPE and scope_key else None,
-            league_code=str(scope_key) if scope_type == LEAGUE_SCOPE and scope_key else None,
-            is_adult_mode=True if scope_type == ADULT_SCOPE else False if scope_type == CATEGORY_SCOPE else None,
-            adult_gender_scope=(
+        filters: dict[str, Any] = {
+            "category_code": str(scope_key) if scope_type == CATEGORY_SCOPE and scope_key else None,
+            "league_code": str(scope_key) if scope_type == LEAGUE_SCOPE and scope_key else None,
+            "is_adult_mode": True if scope_type == ADULT_SCOPE else False if scope_type == CATEGORY_SCOPE else None,
+            "adult_gender_scope": (
                 str(scope_key)
                 if scope_type == ADULT_SCOPE and scope_key in {ADULT_MEN_SCOPE_KEY, ADULT_WOMEN_SCOPE_KEY}
                 else None
             ),
-            search_term=search_term or None,
-        )
+        }
 
-        rating_rows = build_rating_snapshot(raw_results, n_value)
+        as_of = self._selected_as_of()
+        if as_of is not None:
+            rating_rows = self._rating_engine.timeline(**filters).rows(n_value, as_of=as_of)
+            if search_term:
+                rating_rows = [
+                    replace(row, place=index)
+                    for index, row in enumerate(
+                        (row for row in rating_rows if fio_matches_search(row.fio, search_term)),
+                        start=1,
+                    )
+                ]
+        elif search_term:
+            # Search re-ranks the matching players only, so it stays a one-off query.
+            rating_rows = build_rating_snapshot_from_totals(
+                self._result_repo.list_rating_totals(n_value, search_term=search_term, **filters)
+            )
+        else:
+            current_rows = (
+                list_current_rating(self._connection, scope_type=scope_type, scope_key=str(scope_key), n=n_value)
+                if scope_key
+                else None
+            )
+            if current_rows is not None:
+                rating_rows = current_rows
+            else:
+                rating_rows = self._rating_engine.table(n_value, **filters).rows()
         self._set_table(rating_rows)
 
+    def _selected_as_of(self) -> str | None:
+        if not self._as_of_check.isChecked():
+            return None
+        return self._as_of_edit.date().toString("yyyy-MM-dd")
+
     def _set_table(self, rows: list[RatingSnapshotRow]) -> None:
         header_order = [
             ("place", "Место"),
@@ -234,7 +300,7 @@ class RatingView(QWidget):
     def _export_selected_format(self) -> None:
         selected_format = self._format_combo.currentText().lower()
         defaults = {"pdf": "rating.pdf", "xlsx": "rating.xlsx", "png": "rating.png"}
-        filters = {
+        filters: dict[str, Any] = {
             "pdf": "Файлы PDF (*.pdf)",
             "xlsx": "Файлы Excel (*.xlsx)",
             "png": "Изображения (*.png *.jpg)",
@@ -315,12 +381,15 @@ class RatingView(QWidget):
             scope_label = "Взрослый зачет"
         scope_value = self._category_combo.currentText()
         n_value = self._n_spin.value()
-        return [
+        header = [
             "Рейтинг",
             f"Дата: {date_label}",
             f"{scope_label}: {scope_value}",
             f"N: {n_value}",
         ]
+        if self._as_of_check.isChecked():
+            header.append(f"Рейтинг на дату: {self._as_of_edit.date().toString('dd.MM.yyyy')}")
+        return header
 
     def _refresh_history_button_state(self) -> None:
         scope_key = self._category_combo.currentData()
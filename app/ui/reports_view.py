@@ -143,7 +143,7 @@ class ReportsView(QWidget):
         )
 
     def _recalculate_all(self) -> None:
-        report = recalculate_all_tournaments(connection=self._connection)
+        report = recalculate_all_tournaments(connection=self._connection, set_based=True)
         self._audit_log_service.log_event(
             RECALC_ALL,
             "Пересчёт всех турниров",
@@ -352,7 +352,7 @@ class SettingsView(QWidget):
             ThemeManager.apply_theme(app, theme, accent_color=accent, font_size=font_size)  # type: ignore[arg-type]
 
     def _recalculate_all(self) -> None:
-        report = recalculate_all_tournaments(connection=self._connection)
+        report = recalculate_all_tournaments(connection=self._connection, set_based=True)
         self._audit_log_service.log_event(
             RECALC_ALL,
             "Пересчет всех турниров (настройки)",
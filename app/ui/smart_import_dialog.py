@@ -25,8 +25,9 @@ from app.services.import_modes import (
     import_players_only,
     import_update_players,
 )
-from app.services.import_pipeline import parse_tables_from_file
+from app.services.import_session import ImportSession
 from app.services.import_xlsx import TableBlock
+from app.ui.column_mapping_dialog import ColumnMappingDialog
 
 
 class SmartImportDialog(QDialog):
@@ -37,6 +38,7 @@ class SmartImportDialog(QDialog):
         self.setWindowTitle("Умный импорт")
         self.resize(700, 550)
 
+        self._session: ImportSession | None = None
         self._blocks: list[TableBlock] = []
         self._file_path: str = ""
 
@@ -53,8 +55,9 @@ class SmartImportDialog(QDialog):
         layout.addLayout(file_row)
 
         # Preview list
-        layout.addWidget(QLabel("Найденные таблицы:", self))
+        layout.addWidget(QLabel("Найденные таблицы (двойной щелчок — сопоставить колонки):", self))
         self._preview_list = QListWidget(self)
+        self._preview_list.itemDoubleClicked.connect(self._on_block_double_clicked)
         layout.addWidget(self._preview_list)
 
         # Mode selector
@@ -134,20 +137,37 @@ class SmartImportDialog(QDialog):
         self._file_path = file_path
         self._file_label.setText(file_path)
 
+        self._session = ImportSession(file_path)
         try:
-            self._blocks = parse_tables_from_file(file_path)
+            self._blocks = self._session.blocks
         except Exception as exc:
             QMessageBox.warning(self, "Ошибка", f"Не удалось разобрать файл:\n{exc}")
             self._blocks = []
 
+        self._refresh_preview_list()
+
+    def _refresh_preview_list(self) -> None:
         self._preview_list.clear()
         for block in self._blocks:
             text = f"{block.sheet_name}: {len(block.rows)} строк"
+            if block.needs_mapping:
+                text += " — требуется сопоставление колонок"
             self._preview_list.addItem(text)
 
         if not self._blocks:
             self._preview_list.addItem("Таблицы не найдены")
 
+    def _on_block_double_clicked(self, item) -> None:  # type: ignore[no-untyped-def]
+        index = self._preview_list.row(item)
+        # Only XLSX sessions keep raw cells to preview and re-map.
+        if self._session is None or self._session.format != "xlsx" or not 0 <= index < len(self._blocks):
+            return
+        dialog = ColumnMappingDialog.for_block(self._session, self._blocks[index], self)
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            return
+        self._blocks[index] = dialog.mapped_block()
+        self._refresh_preview_list()
+
     def _on_execute(self) -> None:
         if not self._blocks:
             QMessageBox.warning(
@@ -840,6 +840,8 @@ class TournamentsView(QWidget):
                 "Коррекция применена.\n"
                 f"Статус: {tournament_status_label(correction_result['to_status'])}\n"
                 f"Пересчитано результатов: {correction_result['results_recalculated']}\n"
+                f"Затронуто рейтингов: {len(correction_result['affected_scopes'])}; "
+                f"изменили место: {len(correction_result['moved_players'])}\n"
                 "Турнир снова требует проверки перед публикацией."
             ),
         )
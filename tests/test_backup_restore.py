@@ -184,3 +184,37 @@ def test_import_then_process_pending_action_restores_db(monkeypatch: pytest.Monk
     assert len(players) == 1
     assert players[0]["last_name"] == "Export"
     restored_conn.close()
+
+
+def test_profile_reset_backup_keeps_transactions_left_in_wal(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """A crashed session's commits that only reached the WAL must survive into the reset backup."""
+    import shutil
+
+    from app.runtime_paths import get_runtime_paths
+    from app.services.restore_points import _write_pending_action, process_pending_profile_action
+
+    crashed_root = tmp_path / "crashed"
+    crashed_root.mkdir()
+    crashed_db = crashed_root / "app.db"
+    live = get_connection(crashed_db)
+    live.execute("PRAGMA wal_autocheckpoint = 0")
+    PlayerRepository(live).create({"last_name": "Только", "first_name": "ВЖурнале"})
+    assert Path(f"{crashed_db}-wal").stat().st_size > 0
+
+    monkeypatch.setenv("DARTS_PROFILE_ROOT", str(tmp_path / "profile"))
+    paths = get_runtime_paths()
+    # Copy the files while the connection is still open, as a killed process leaves them.
+    for suffix in ("", "-wal", "-shm"):
+        shutil.copy2(f"{crashed_db}{suffix}", f"{paths.db_path}{suffix}")
+    live.close()
+    _write_pending_action({"action": "reset_profile"})
+
+    result = process_pending_profile_action()
+
+    assert result is not None and result["status"] == "applied"
+    backup = sqlite3.connect(str(Path(result["backup_dir"]) / paths.db_path.name))
+    try:
+        names = [row[0] for row in backup.execute("SELECT last_name FROM players")]
+    finally:
+        backup.close()
+    assert names == ["Только"]
@@ -67,3 +67,41 @@ def test_batch_import_file_path_instead_of_folder(tmp_path) -> None:
             "tables": 0,
         }
     ]
+
+
+def test_batch_import_parallel_matches_sequential_order(tmp_path) -> None:
+    headers = ["ФИО", "Год рождения", "Место", "Очки", "С20", "БР"]
+    for index in range(4):
+        make_single_table_xlsx(tmp_path, headers, [[f"Игрок {index}", 2012, 1, 100, 45, 78]])
+    Workbook().save(tmp_path / "empty.xlsx")
+    (tmp_path / "broken.xlsx").write_bytes(b"not a workbook")
+    (tmp_path / "players.csv").write_text(
+        "ФИО;Год рождения;Место;Очки;С20;БР\nСидоров Олег;2011;2;90;38;70\n", encoding="utf-8"
+    )
+
+    sequential = import_batch_from_folder(str(tmp_path), extensions=(".xlsx", ".csv"))
+    parallel = import_batch_from_folder(str(tmp_path), workers=3, extensions=(".xlsx", ".csv"))
+
+    assert parallel == sequential
+    assert [item["path"] for item in parallel["items"]] == sorted(item["path"] for item in parallel["items"])
+    assert parallel["success"] == 5
+    assert parallel["error"] == 2
+    broken = next(item for item in parallel["items"] if item["path"].endswith("broken.xlsx"))
+    assert broken["status"] == "error"
+    assert broken["tables"] == 0
+
+
+def test_batch_import_reports_progress_per_file(tmp_path) -> None:
+    headers = ["ФИО", "Год рождения", "Место", "Очки", "С20", "БР"]
+    for index in range(3):
+        make_single_table_xlsx(tmp_path, headers, [[f"Игрок {index}", 2012, 1, 100, 45, 78]])
+    (tmp_path / "broken.xlsx").write_bytes(b"not a workbook")
+
+    sequential: list[tuple[int, int]] = []
+    parallel: list[tuple[int, int]] = []
+    import_batch_from_folder(str(tmp_path), progress=lambda done, total: sequential.append((done, total)))
+    import_batch_from_folder(
+        str(tmp_path), workers=2, progress=lambda done, total: parallel.append((done, total))
+    )
+
+    assert sequential == parallel == [(1, 4), (2, 4), (3, 4), (4, 4)]
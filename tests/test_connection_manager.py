@@ -0,0 +1,74 @@
+import json
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+import pytest
+
+from app.db.database import ConnectionManager, normalize_pragma_profile
+
+
+pytestmark = pytest.mark.integration
+
+
+class ConnectionManagerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.temp_dir.name) / "app.db"
+        self.manager = ConnectionManager()
+
+    def tearDown(self) -> None:
+        self.manager.close_all()
+        self.temp_dir.cleanup()
+
+    def test_writer_is_shared_and_tuned(self) -> None:
+        writer = self.manager.writer(self.db_path)
+
+        self.assertIs(self.manager.writer(self.db_path), writer)
+        self.assertEqual(writer.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+        self.assertEqual(writer.execute("PRAGMA synchronous").fetchone()[0], 1)
+        self.assertEqual(writer.execute("PRAGMA temp_store").fetchone()[0], 2)
+        self.assertEqual(writer.execute("PRAGMA foreign_keys").fetchone()[0], 1)
+
+    def test_reader_sees_committed_data_and_rejects_writes(self) -> None:
+        writer = self.manager.writer(self.db_path)
+        writer.execute("INSERT INTO players (last_name, first_name) VALUES ('Ivanov', 'Ivan')")
+        writer.commit()
+
+        reader = self.manager.reader(self.db_path)
+
+        self.assertEqual(reader.execute("SELECT COUNT(*) FROM players").fetchone()[0], 1)
+        with self.assertRaises(sqlite3.OperationalError):
+            reader.execute("DELETE FROM players")
+
+    def test_closed_shared_connection_is_reopened(self) -> None:
+        writer = self.manager.writer(self.db_path)
+        writer.close()
+
+        reopened = self.manager.writer(self.db_path)
+
+        self.assertIsNot(reopened, writer)
+        self.assertEqual(reopened.execute("SELECT 1").fetchone()[0], 1)
+
+    def test_profile_is_read_from_profile_settings(self) -> None:
+        settings_path = self.db_path.parent / "settings.json"
+        settings_path.write_text(
+            json.dumps({"database": {"journal_mode": "delete", "cache_size": -2000}}),
+            encoding="utf-8",
+        )
+
+        writer = self.manager.writer(self.db_path)
+
+        self.assertEqual(writer.execute("PRAGMA journal_mode").fetchone()[0], "delete")
+        self.assertEqual(writer.execute("PRAGMA cache_size").fetchone()[0], -2000)
+
+    def test_invalid_overrides_fall_back_to_defaults(self) -> None:
+        profile = normalize_pragma_profile({"journal_mode": "bogus", "busy_timeout": "x"})
+
+        self.assertEqual(profile["journal_mode"], "WAL")
+        self.assertEqual(profile["busy_timeout"], 5000)
+
+
+if __name__ == "__main__":
+    unittest.main()
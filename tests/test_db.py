@@ -155,6 +155,57 @@ class DatabaseCrudTests(unittest.TestCase):
         self.tournaments.delete(tournament_id)
         self.assertIsNone(self.tournaments.get(tournament_id))
 
+    def test_bulk_player_and_result_writes(self) -> None:
+        player_ids = self.players.create_many(
+            [
+                {"last_name": "Ivanov", "first_name": "Ivan"},
+                {"last_name": "Petrov", "first_name": "Petr"},
+            ]
+        )
+        self.assertEqual(
+            [self.players.get(player_id)["last_name"] for player_id in player_ids],
+            ["Ivanov", "Petrov"],
+        )
+
+        upserted_player_ids = self.players.upsert_many(
+            [
+                {"last_name": "Sidorov", "first_name": "Sidor"},
+                {"id": player_ids[0], "last_name": "Ivanov", "first_name": "Ivan", "club": "Club"},
+            ]
+        )
+        self.assertEqual(upserted_player_ids[1], player_ids[0])
+        self.assertEqual(self.players.get(player_ids[0])["club"], "Club")
+        self.assertEqual(self.players.get(upserted_player_ids[0])["last_name"], "Sidorov")
+
+        tournament_id = self.tournaments.create({"name": "Cup", "date": "2024-01-01"})
+        result_ids = self.results.create_many(
+            [
+                {"tournament_id": tournament_id, "player_id": player_ids[1], "place": 2, "points_total": 80},
+                {"tournament_id": tournament_id, "player_id": player_ids[0], "place": 1, "points_total": 100},
+            ]
+        )
+        self.assertEqual(self.results.get(result_ids[0])["player_id"], player_ids[1])
+
+        self.results.update_many(
+            [
+                {
+                    **self.results.get(result_ids[1]),
+                    "points_total": 110,
+                }
+            ]
+        )
+        self.assertEqual(self.results.get(result_ids[1])["points_total"], 110)
+
+        upserted_result_ids = self.results.upsert_many(
+            [
+                {"tournament_id": tournament_id, "player_id": upserted_player_ids[0], "place": 3, "points_total": 60},
+                {"tournament_id": tournament_id, "player_id": player_ids[1], "place": 2, "points_total": 85},
+            ]
+        )
+        self.assertEqual(upserted_result_ids[1], result_ids[0])
+        self.assertEqual(self.results.get(result_ids[0])["points_total"], 85)
+        self.assertEqual(len(self.results.search(tournament_id=tournament_id)), 3)
+
 
 if __name__ == "__main__":
     unittest.main()
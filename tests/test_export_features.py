@@ -122,3 +122,33 @@ def test_export_dataset_pdf_uses_qt_renderer_on_windows(tmp_path: Path, monkeypa
 
     assert path.exists()
     assert path.stat().st_size > 0
+
+
+def test_batch_export_fallback_rating_excludes_adult_results(tmp_path: Path) -> None:
+    connection = get_connection(tmp_path / "app.db")
+    players = PlayerRepository(connection)
+    tournaments = TournamentRepository(connection)
+    results = ResultRepository(connection)
+    junior_id = players.create({"last_name": "Юниор", "first_name": "Иван"})
+    adult_id = players.create({"last_name": "Взрослый", "first_name": "Пётр"})
+    for name, player_id, is_adult_mode in (("Junior Cup", junior_id, 0), ("Adult Cup", adult_id, 1)):
+        tournament_id = tournaments.create(
+            {
+                "name": name,
+                "date": "2025-01-10",
+                "category_code": "U12-M",
+                "is_adult_mode": is_adult_mode,
+                "status": "published",
+                "source_files": "[]",
+            }
+        )
+        results.create({"tournament_id": tournament_id, "player_id": player_id, "place": 1, "points_total": 10})
+
+    # N outside the materialized range takes the list_rating_totals fallback.
+    result = BatchExportService(connection).export_all(tmp_path, export_format="xlsx", n_value=20)
+
+    [rating_path] = [path for path in result.files_created if path.parent.name == "ratings"]
+    sheet = load_workbook(rating_path).active
+    fios = [row[1] for row in sheet.iter_rows(min_row=6, values_only=True) if row[1]]
+    assert fios == ["Юниор Иван"]
+    connection.close()
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import pytest
+
+from app.services import import_xlsx
+from app.services.import_cache import ImportParseCache
+from tests.helpers.xlsx_factory import make_single_table_xlsx
+
+pytestmark = pytest.mark.integration
+
+HEADERS = ["ФИО", "Год рождения", "Место", "Очки", "С20", "БР"]
+
+
+def _use_cache(monkeypatch, cache: ImportParseCache) -> None:
+    monkeypatch.setattr(import_xlsx, "get_import_parse_cache", lambda: cache)
+
+
+def _forbid_workbook_loading(monkeypatch) -> None:
+    def fail(path):
+        raise AssertionError(f"workbook reloaded: {path}")
+
+    monkeypatch.setattr(import_xlsx, "_open_workbook_streaming", fail)
+
+
+def test_unchanged_file_is_served_from_cache(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("DARTS_PROFILE_ROOT", str(tmp_path / "profile"))
+    cache = ImportParseCache()
+    _use_cache(monkeypatch, cache)
+    path = make_single_table_xlsx(tmp_path, HEADERS, [["Иванов Иван", 2012, 1, 100, 45, 78]])
+
+    blocks = import_xlsx.parse_tables_from_xlsx_with_report(str(path))
+    preview = import_xlsx.read_table_block_preview(str(path), blocks[0])
+
+    with monkeypatch.context() as patch:
+        _forbid_workbook_loading(patch)
+        again = import_xlsx.parse_tables_from_xlsx_with_report(str(path))
+        assert import_xlsx.read_table_block_preview(str(path), blocks[0]) == preview
+
+    assert again == blocks
+    assert again[0].rows is not blocks[0].rows
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+def test_changed_file_or_profiles_invalidate_cache(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("DARTS_PROFILE_ROOT", str(tmp_path / "profile"))
+    cache = ImportParseCache()
+    _use_cache(monkeypatch, cache)
+    path = make_single_table_xlsx(tmp_path, HEADERS, [["Иванов Иван", 2012, 1, 100, 45, 78]])
+    import_xlsx.parse_tables_from_xlsx_with_report(str(path))
+
+    import_xlsx.save_import_profile(
+        {"name": "Клуб", "required_columns": ["fio"], "header_aliases": {"fio": ["участник"]}}
+    )
+    import_xlsx.parse_tables_from_xlsx_with_report(str(path))
+    assert cache.misses == 2
+
+    make_single_table_xlsx(tmp_path, HEADERS, [["Петров Петр", 2011, 2, 90, 38, 70]]).replace(path)
+    blocks = import_xlsx.parse_tables_from_xlsx_with_report(str(path))
+    assert cache.misses == 3
+    assert blocks[0].rows[0]["fio"] == "Петров Петр"
+
+
+def test_persisted_cache_survives_new_instance(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("DARTS_PROFILE_ROOT", str(tmp_path / "profile"))
+    persist_dir = tmp_path / "cache"
+    path = make_single_table_xlsx(tmp_path, HEADERS, [["Иванов Иван", 2012, 1, 100, 45, 78]])
+    _use_cache(monkeypatch, ImportParseCache(persist_dir=persist_dir))
+    blocks = import_xlsx.parse_tables_from_xlsx_with_report(str(path))
+
+    restarted = ImportParseCache(max_entries=1, persist_dir=persist_dir)
+    _use_cache(monkeypatch, restarted)
+    _forbid_workbook_loading(monkeypatch)
+
+    assert import_xlsx.parse_tables_from_xlsx_with_report(str(path)) == blocks
+    assert restarted.hits == 1
+    assert len(list(persist_dir.glob("*.pickle"))) == 1
@@ -2,10 +2,15 @@ from __future__ import annotations
 
 import pytest
 
+from app.services import import_xlsx
 from app.services.import_xlsx import (
     ImportProfile,
+    ImportProfileMatcher,
     apply_profile_to_headers,
+    delete_import_profile,
+    get_import_profile_matcher,
     parse_first_table_from_xlsx_with_report,
+    save_import_profile,
 )
 from tests.helpers.xlsx_factory import make_single_table_xlsx
 
@@ -46,3 +51,45 @@ def test_apply_profile_to_headers_improves_confidence_for_custom_aliases() -> No
     assert mapping["Позиция"] == "place"
     assert mapping["Набранные баллы"] == "score_set"
     assert confidence == 1.0
+
+
+def test_profile_matcher_scores_all_profiles_like_apply_profile_to_headers() -> None:
+    headers = ["Участник", "Позиция", "Набранные баллы", "Год"]
+    profiles = [
+        ImportProfile(name="partial", required_columns=["fio", "coach"], header_aliases={"fio": ["участник"]}),
+        ImportProfile(
+            name="full",
+            required_columns=["fio", "place"],
+            header_aliases={"fio": ["Участник"], "place": ["Позиция", "Место"]},
+        ),
+        ImportProfile(name="empty", required_columns=[], header_aliases={"fio": ["Участник"]}),
+    ]
+    matcher = ImportProfileMatcher(profiles)
+
+    assert matcher.score(headers) == [apply_profile_to_headers(profile, headers) for profile in profiles]
+    best = matcher.best_match(headers, above=0.5)
+    assert best is not None
+    assert best[0].name == "full"
+    assert best[2] == 1.0
+    assert matcher.best_match(headers, above=1.0) is None
+
+
+def test_profile_matcher_is_loaded_once_and_reset_on_save_and_delete(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("DARTS_PROFILE_ROOT", str(tmp_path / "profile"))
+    parsed: list[str] = []
+    parse_profiles = import_xlsx._parse_import_profiles
+
+    def counting_parse(text):
+        parsed.append(text)
+        return parse_profiles(text)
+
+    monkeypatch.setattr(import_xlsx, "_parse_import_profiles", counting_parse)
+    save_import_profile({"name": "club", "required_columns": ["fio"], "header_aliases": {"fio": ["Участник"]}})
+
+    matcher = get_import_profile_matcher()
+    assert get_import_profile_matcher() is matcher
+    assert [profile.name for profile in matcher.profiles] == ["club"]
+    assert len(parsed) == 1
+
+    delete_import_profile("club")
+    assert get_import_profile_matcher().profiles == ()
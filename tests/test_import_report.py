@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import json
+import sqlite3
 from pathlib import Path
 
 import pytest
 
 from app.db.database import get_connection
-from app.db.repositories import PlayerRepository
+from app.db.repositories import PlayerRepository, ResultRepository
 from app.services.audit_log import IMPORT_REPORT
 from app.services.import_xlsx import ImportApplyReport, import_tournament_rows
 from app.services.tournament_lifecycle import transition_tournament_status
@@ -162,6 +163,60 @@ def test_import_apply_report_counts_created_reused_and_manual_matches(tmp_path:
     assert reused_player_id > 0
 
 
+@pytest.mark.integration
+def test_player_match_is_resolved_outside_the_import_transaction(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("DARTS_PROFILE_ROOT", str(tmp_path / "profile"))
+    from app.runtime_paths import get_runtime_paths
+
+    connection = get_connection(tmp_path / "import-report-resolver.db")
+    players = PlayerRepository(connection)
+    first_id = _create_player(players, last_name="twin", first_name="player", birth_date="2012-03-01")
+    _create_player(players, last_name="twin", first_name="player", birth_date="2012-07-01")
+    rules_path = get_runtime_paths().player_match_rules_path
+    row = {
+        "fio": "Twin Player",
+        "birth": "2012",
+        "place": 1,
+        "score_set": 10,
+        "score_sector20": 1,
+        "score_big_round": 1,
+    }
+    seen_transactions: list[bool] = []
+
+    def resolver(fio: str, birth_date_or_year: str | None, candidates: list[dict[str, object]]) -> dict[str, object]:
+        seen_transactions.append(connection.in_transaction)
+        return {"action": "select", "player_id": first_id, "remember": True}
+
+    def fail_results(self, entries):
+        raise sqlite3.IntegrityError("results rejected")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(ResultRepository, "create_many", fail_results)
+        with pytest.raises(sqlite3.IntegrityError):
+            import_tournament_rows(
+                connection=connection,
+                rows=[row],
+                tournament_name="Failing Cup",
+                tournament_date="2026-04-01",
+                category_code="U14",
+                player_match_resolver=resolver,
+            )
+    assert not rules_path.exists()
+    assert connection.execute("SELECT COUNT(*) FROM tournaments").fetchone()[0] == 0
+
+    import_tournament_rows(
+        connection=connection,
+        rows=[row],
+        tournament_name="Resolver Cup",
+        tournament_date="2026-04-01",
+        category_code="U14",
+        player_match_resolver=resolver,
+    )
+
+    assert seen_transactions == [False, False]
+    assert json.loads(rules_path.read_text(encoding="utf-8")) == {"twin player|2012": first_id}
+
+
 @pytest.mark.integration
 def test_persisted_import_report_links_to_lifecycle_operation_group(tmp_path: Path) -> None:
     connection = get_connection(tmp_path / "import-report-persist.db")
@@ -12,6 +12,7 @@ from app.db.repositories import (
 )
 from app.services.import_review import build_import_rating_preview
 from app.services.import_xlsx import import_tournament_rows
+from app.services.rating_engine import RatingEngine
 from app.services.tournament_lifecycle import transition_tournament_status
 
 
@@ -214,6 +215,65 @@ def test_build_import_rating_preview_uses_published_baseline_plus_current_draft_
     ]
 
 
+def test_build_import_rating_preview_with_engine_restores_cached_table(tmp_path: Path) -> None:
+    connection = get_connection(tmp_path / "import-rating-preview-engine.db")
+    players = PlayerRepository(connection)
+    tournaments = TournamentRepository(connection)
+    results = ResultRepository(connection)
+
+    alice_id = _create_player(players, last_name="Adams", first_name="Alice")
+    bob_id = _create_player(players, last_name="Brown", first_name="Bob")
+    charlie_id = _create_player(players, last_name="Clark", first_name="Charlie")
+
+    _create_result_fixture(
+        tournaments=tournaments,
+        results=results,
+        name="Published Baseline",
+        category_code="U14",
+        status="published",
+        tournament_date="2026-01-05",
+        rows=[(alice_id, 100), (bob_id, 90)],
+    )
+    corrected_id = _create_result_fixture(
+        tournaments=tournaments,
+        results=results,
+        name="Published Correction",
+        category_code="U14",
+        status="published",
+        tournament_date="2026-02-01",
+        rows=[(charlie_id, 120), (bob_id, 60)],
+    )
+
+    engine = RatingEngine(connection)
+    table = engine.table(6, category_code="U14", is_adult_mode=None)
+    cached_rows = table.rows()
+    expected = build_import_rating_preview(connection=connection, tournament_id=corrected_id, n_value=6)
+
+    for _ in range(2):
+        preview = build_import_rating_preview(
+            connection=connection,
+            tournament_id=corrected_id,
+            n_value=6,
+            engine=engine,
+        )
+        assert preview.before_rows == expected.before_rows
+        assert preview.after_rows == expected.after_rows
+        assert preview.rows == expected.rows
+        assert table.rows() == cached_rows
+
+    assert [(row.fio, row.place) for row in expected.before_rows] == [("Adams Alice", 1), ("Brown Bob", 2)]
+    lean = build_import_rating_preview(
+        connection=connection,
+        tournament_id=corrected_id,
+        n_value=6,
+        engine=engine,
+        include_tables=False,
+    )
+    assert lean.before_rows == lean.after_rows == []
+    assert lean.rows == expected.rows
+    connection.close()
+
+
 def test_build_import_rating_preview_returns_reason_when_category_missing(tmp_path: Path) -> None:
     connection = get_connection(tmp_path / "import-rating-preview-missing-category.db")
     tournaments = TournamentRepository(connection)
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from app.services import import_session, import_xlsx
+from app.services.import_cache import ImportParseCache
+from app.services.import_session import ImportSession
+from tests.helpers.xlsx_factory import make_multi_table_xlsx
+
+pytestmark = pytest.mark.integration
+
+
+def _make_workbook(tmp_path):
+    return make_multi_table_xlsx(
+        tmp_path,
+        [
+            {
+                "title": "Группа 1",
+                "headers": ["ФИО", "Дата рождения", "Место", "Набор очков", "Сектор 20", "Большой раунд"],
+                "rows": [["Иванов Иван", "2012-01-02", 1, 120, 45, 78]],
+            },
+            {
+                "title": "Группа 2",
+                "headers": ["ФИО", "Рожд.", "Итоговое место", "Набор очков", "Сектор 20", "Большой раунд"],
+                "rows": [["Петров Петр", "2011-02-03", 2, 90, 38, 70], ["Сидоров Олег", "2011-05-06", 3, 80, 30, 60]],
+            },
+        ],
+    )
+
+
+def test_session_reads_workbook_once_for_discovery_preview_and_remap(monkeypatch, tmp_path) -> None:
+    cache = ImportParseCache()
+    monkeypatch.setattr(import_xlsx, "get_import_parse_cache", lambda: cache)
+    path = _make_workbook(tmp_path)
+    opened: list[str] = []
+    open_workbook = import_session._open_workbook_streaming
+
+    def counting_open(source):
+        opened.append(source)
+        return open_workbook(source)
+
+    monkeypatch.setattr(import_session, "_open_workbook_streaming", counting_open)
+
+    session = ImportSession(str(path))
+    first, second = session.blocks
+    assert second.needs_mapping is True
+
+    headers, rows = session.preview(second)
+    assert headers[:3] == ["ФИО", "Рожд.", "Итоговое место"]
+    assert [row[0] for row in rows] == ["Петров Петр", "Сидоров Олег"]
+
+    remapped = session.remap(second, {"fio": "ФИО", "birth_date": "Рожд.", "place": "Итоговое место"})
+    assert [(row["fio"], row["birth"], row["place"]) for row in remapped.rows] == [
+        ("Петров Петр", "2011-02-03", 2),
+        ("Сидоров Олег", "2011-05-06", 3),
+    ]
+    assert remapped.needs_mapping is False
+    assert remapped.errors == []
+    assert first.rows[0]["fio"] == "Иванов Иван"
+    assert opened == [str(path)]
+    # The cell dump stays with the session instead of the shared parse cache.
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
+def test_mapping_dialog_builds_block_from_session(tmp_path) -> None:
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    try:
+        from PySide6.QtWidgets import QApplication
+
+        from app.ui.column_mapping_dialog import ColumnMappingDialog
+    except Exception as exc:  # noqa: BLE001
+        pytest.skip(f"Qt mapping dialog smoke unavailable: {exc}")
+
+    app = QApplication.instance() or QApplication([])
+    _ = app
+    session = ImportSession(str(_make_workbook(tmp_path)))
+    block = session.blocks[1]
+
+    dialog = ColumnMappingDialog.for_block(session, block)
+    combo = dialog._combos["birth_date"]
+    combo.setCurrentIndex(combo.findData("Рожд."))
+    combo = dialog._combos["place"]
+    combo.setCurrentIndex(combo.findData("Итоговое место"))
+
+    mapped = dialog.mapped_block()
+    assert dialog.ok_button.isEnabled() is True
+    assert [row["birth"] for row in mapped.rows] == ["2011-02-03", "2011-05-06"]
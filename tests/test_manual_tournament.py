@@ -66,6 +66,41 @@ def test_create_manual_adult_tournament_creates_draft_results_and_audit(tmp_path
     assert audit_event["operation_group_id"] == "op-manual-adult"
 
 
+def test_create_manual_adult_tournament_inserts_new_players_in_one_batch(monkeypatch, tmp_path) -> None:
+    from app.services.manual_tournament import create_manual_adult_tournament
+
+    connection = get_connection(tmp_path / "manual-adult-batch.db")
+    batches: list[int] = []
+    create_many = PlayerRepository.create_many
+
+    def counting_create_many(self, entries):
+        batches.append(len(entries))
+        return create_many(self, entries)
+
+    def fail_create(self, data):
+        raise AssertionError("players must be inserted in one batch")
+
+    monkeypatch.setattr(PlayerRepository, "create_many", counting_create_many)
+    monkeypatch.setattr(PlayerRepository, "create", fail_create)
+
+    report = create_manual_adult_tournament(
+        connection=connection,
+        tournament_name="Batch Cup",
+        tournament_date="2026-04-20",
+        league_code=None,
+        rows=[
+            {"fio": "Adultov Alex", "birth": "1989-01-01", "place": 1, "points_total": 120},
+            {"fio": "Senior Sara", "birth": "1990", "place": 2, "points_total": 105},
+            {"fio": "Newbie Nick", "birth": None, "place": 3, "points_total": 90},
+        ],
+    )
+
+    assert batches == [3]
+    results = ResultRepository(connection).list_with_players(report.tournament_id)
+    assert len({row["player_id"] for row in results}) == 3
+    assert [row["points_total"] for row in results] == [120, 105, 90]
+
+
 def test_create_manual_adult_tournament_reuses_existing_player_by_identity(tmp_path) -> None:
     from app.services.manual_tournament import create_manual_adult_tournament
 
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from app.services.import_xlsx import parse_tables_from_xlsx_with_report
+from app.services.import_xlsx import (
+    iter_tables_from_xlsx,
+    parse_tables_from_xlsx_with_report,
+    read_table_block_preview,
+)
 from tests.helpers.xlsx_factory import make_multi_table_xlsx
 
 
@@ -30,3 +34,33 @@ def test_parse_multi_table_blocks(tmp_path) -> None:
     assert parsed[1].errors == []
     assert len(parsed[0].rows) == 1
     assert len(parsed[1].rows) == 1
+
+
+def test_iter_tables_streams_blocks_and_previews(tmp_path) -> None:
+    headers = ["ФИО", "Дата рождения", "Место", "Набор очков", "Сектор 20", "Большой раунд"]
+    blocks = [
+        {
+            "title": "Категория U12",
+            "headers": headers,
+            "rows": [["Иванов Иван", "2012-01-02", 1, 100, 45, 78], ["Сидоров Олег", "2012-03-04", 2, 80, 30, 60]],
+        },
+        {
+            "title": "Категория U14",
+            "headers": headers,
+            "rows": [["Петров Петр", "2011-02-03", 1, 90, 38, 70]],
+        },
+    ]
+    path = make_multi_table_xlsx(tmp_path, blocks, gap_rows=1)
+
+    stream = iter_tables_from_xlsx(str(path))
+    first = next(stream)
+    assert (first.sheet_name, first.start_row, first.end_row) == ("Sheet1", 2, 4)
+    assert [row["fio"] for row in first.rows] == ["Иванов Иван", "Сидоров Олег"]
+
+    second = next(stream)
+    assert (second.start_row, second.end_row) == (7, 8)
+    assert next(stream, None) is None
+
+    preview_headers, preview_rows = read_table_block_preview(str(path), second)
+    assert preview_headers[:3] == ["ФИО", "Дата рождения", "Место"]
+    assert preview_rows == [["Петров Петр", "2011-02-03", 1, 90, 38, 70]]
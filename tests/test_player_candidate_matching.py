@@ -2,7 +2,11 @@ from __future__ import annotations
 
 from app.db.database import get_connection
 from app.db.repositories import PlayerRepository
-from app.services.import_xlsx import _parse_birth_value, find_player_candidates
+from app.services.import_xlsx import (
+    PlayerIdentityIndex,
+    _parse_birth_value,
+    find_player_candidates,
+)
 
 
 import pytest
@@ -122,3 +126,23 @@ def test_find_player_candidates_matches_mixed_birth_formats_in_db(tmp_path) -> N
     assert len(by_year) == 2
     assert len(by_full_date) == 2
     assert {candidate["birth_date"] for candidate in by_full_date} == {"2011", "2011-04-30"}
+
+
+def test_player_identity_index_buckets_by_fio_and_birth() -> None:
+    index = PlayerIdentityIndex(
+        [
+            {"id": 1, "last_name": "Смирнов", "first_name": "Олег", "birth_date": "2011-04-30"},
+            {"id": 2, "last_name": "Смирнов", "first_name": "Олег", "birth_date": "2012"},
+            {"id": 3, "last_name": "Петров", "first_name": "Олег", "birth_date": None},
+        ]
+    )
+
+    assert [player["id"] for player in index.candidates("СМИРНОВ олег")] == [1, 2]
+    assert [player["id"] for player in index.candidates("Смирнов Олег", "2011")] == [1]
+    assert [player["id"] for player in index.candidates("Смирнов Олег", "2012-01-01")] == [2]
+    assert index.candidates("Петров Олег", "2011") == []
+
+    index.add({"id": 4, "last_name": "Петров", "first_name": "Олег", "birth_date": "2011-02-02"})
+
+    assert [player["id"] for player in index.candidates("Петров Олег", "2011")] == [4]
+    assert sorted(index.groups()) == ["петров олег", "смирнов олег"]
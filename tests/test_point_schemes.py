@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from app.db.database import get_connection
+from app.db.repositories import PlayerRepository, ResultRepository, TournamentRepository
+from app.services.point_schemes import get_point_scheme, resolve_point_scheme, save_point_scheme
+from app.services.recalculate_tournament import recalculate_season_points, recalculate_tournament_results
+
+
+pytestmark = pytest.mark.integration
+
+
+def _create_tournament(
+    connection,
+    *,
+    name: str,
+    season: str,
+    category_code: str,
+    places: list[int],
+) -> int:
+    players = PlayerRepository(connection)
+    tournament_id = TournamentRepository(connection).create(
+        {
+            "name": name,
+            "date": "2026-03-01",
+            "category_code": category_code,
+            "season": season,
+            "source_files": "[]",
+        }
+    )
+    results = ResultRepository(connection)
+    for place in places:
+        player_id = players.create({"last_name": f"{name}{place}", "first_name": "Test"})
+        results.create(
+            {
+                "tournament_id": tournament_id,
+                "player_id": player_id,
+                "place": place,
+                "points_classification": 0,
+                "points_place": 0,
+                "points_total": 0,
+                "calc_version": "tests",
+            }
+        )
+    return tournament_id
+
+
+def _points(connection, tournament_id: int) -> list[tuple[int, int, str]]:
+    return [
+        (row["place"], row["points_total"], row["calc_version"])
+        for row in connection.execute(
+            "SELECT place, points_total, calc_version FROM results WHERE tournament_id = ? ORDER BY place",
+            (tournament_id,),
+        ).fetchall()
+    ]
+
+
+def test_saved_schemes_are_versioned_and_resolved_by_scope(tmp_path: Path) -> None:
+    connection = get_connection(tmp_path / "point-schemes.db")
+
+    assert resolve_point_scheme(connection, season="2026", category_code="U14").calc_version == (
+        "v3_no_classification"
+    )
+    save_point_scheme(connection, name="season-2026", ranges=[(1, 1, 20), (2, 8, 10)], season="2026")
+    second = save_point_scheme(connection, name="season-2026", ranges=[(1, 1, 25), (2, 8, 10)], season="2026")
+    save_point_scheme(connection, name="u14", ranges=[(1, 4, 7)], season="2026", category_code="U14")
+
+    assert second.version == 2
+    assert get_point_scheme(connection, "season-2026", 1).points(1) == 20
+    assert resolve_point_scheme(connection, season="2026", category_code="U12").calc_version == (
+        "scheme:season-2026:v2"
+    )
+    assert resolve_point_scheme(connection, season="2026", category_code="U14").name == "u14"
+    assert resolve_point_scheme(connection, season="2025", category_code="U14").name == "default"
+    with pytest.raises(ValueError):
+        save_point_scheme(connection, name="default", ranges=[(1, 1, 1)])
+    connection.close()
+
+
+def test_season_recalculation_applies_scheme_in_one_pass(tmp_path: Path) -> None:
+    connection = get_connection(tmp_path / "point-schemes-season.db")
+    first_id = _create_tournament(connection, name="A", season="2026", category_code="U14", places=[1, 2, 9])
+    second_id = _create_tournament(connection, name="B", season="2026", category_code="U12", places=[1, 3])
+    other_id = _create_tournament(connection, name="C", season="2025", category_code="U14", places=[1])
+
+    report = recalculate_tournament_results(connection=connection, tournament_id=other_id)
+    assert report.results_updated == 1
+    assert _points(connection, other_id) == [(1, 14, "v3_no_classification")]
+
+    scheme = save_point_scheme(connection, name="season-2026", ranges=[(1, 1, 30), (2, 4, 15)], season="2026")
+    report = recalculate_season_points(connection=connection, season="2026")
+
+    assert (report.tournaments_processed, report.results_updated, report.errors) == (2, 5, [])
+    assert _points(connection, first_id) == [
+        (1, 30, scheme.calc_version),
+        (2, 15, scheme.calc_version),
+        (9, 0, scheme.calc_version),
+    ]
+    assert _points(connection, second_id) == [(1, 30, scheme.calc_version), (3, 15, scheme.calc_version)]
+    assert _points(connection, other_id) == [(1, 14, "v3_no_classification")]
+
+    assert recalculate_season_points(connection=connection, season="2026").results_updated == 0
+    connection.close()
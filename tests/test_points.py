@@ -2,7 +2,7 @@ import unittest
 
 import pytest
 
-from app.domain.points import points_for_place
+from app.domain.points import DEFAULT_POINT_SCHEME, compile_point_scheme, points_for_place
 
 
 pytestmark = pytest.mark.unit
@@ -30,6 +30,24 @@ class PointsForPlaceTests(unittest.TestCase):
             with self.subTest(place=place):
                 self.assertEqual(points_for_place(place), expected)
 
+    def test_points_many_matches_single_lookups(self) -> None:
+        places = [None, *range(1, 70)]
+        self.assertEqual(
+            DEFAULT_POINT_SCHEME.points_many(places),
+            [points_for_place(place) for place in places],
+        )
+        self.assertEqual(DEFAULT_POINT_SCHEME.calc_version, "v3_no_classification")
+        with self.assertRaises(ValueError):
+            DEFAULT_POINT_SCHEME.points_many([1, 0])
+
+    def test_compile_point_scheme_validates_ranges(self) -> None:
+        scheme = compile_point_scheme("cup", 2, [(3, 4, 5), (1, 2, 9)])
+        self.assertEqual(scheme.points_many([1, 2, 3, 4, 5]), [9, 9, 5, 5, 0])
+        self.assertEqual(scheme.calc_version, "scheme:cup:v2")
+        for ranges in ([], [(1, 3, 5), (3, 4, 1)], [(0, 1, 5)], [(2, 1, 5)], [(1, 1, -1)]):
+            with self.subTest(ranges=ranges), self.assertRaises(ValueError):
+                compile_point_scheme("bad", 1, ranges)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -6,9 +6,11 @@ from app.domain.rating import (
     RatingBasisItem,
     RatingImpactRow,
     RatingSnapshotRow,
+    RatingTimeline,
     build_rating_basis,
     build_rating_impact,
     build_rating_snapshot,
+    build_rating_snapshot_as_of,
     normalize_adult_gender_scope,
     rolling_rating,
 )
@@ -222,6 +224,35 @@ class RollingRatingTests(unittest.TestCase):
         self.assertIsNone(normalize_adult_gender_scope(None))
         self.assertIsNone(normalize_adult_gender_scope("unknown"))
 
+    def test_rating_timeline_matches_snapshot_of_results_up_to_date(self) -> None:
+        results = [
+            {
+                "player_id": player_id,
+                "tournament_id": tournament_id,
+                "tournament_date": tournament_date,
+                "points_total": points,
+                "last_name": f"Player{player_id}",
+                "first_name": "Test",
+            }
+            for player_id, tournament_id, tournament_date, points in [
+                (1, 1, "2026-01-10", 50),
+                (2, 1, "2026-01-10", 40),
+                (1, 2, "2026-02-10", 5),
+                (2, 2, "2026-02-10", 30),
+                (3, 3, "2026-03-10", 90),
+                (2, 3, "2026-03-10", 10),
+            ]
+        ]
+        timeline = RatingTimeline(results)
+        for as_of in ["2026-01-01", "2026-01-31", "2026-02-28", "2026-03-31"]:
+            expected = build_rating_snapshot([entry for entry in results if entry["tournament_date"] <= as_of], 2)
+            self.assertEqual(timeline.rows(2, as_of=as_of), expected)
+        self.assertEqual(timeline.rows(2), build_rating_snapshot(results, 2))
+        self.assertEqual(
+            [(row.player_id, row.points) for row in build_rating_snapshot_as_of(results, 2, "2026-02-28")],
+            [(2, 70), (1, 55)],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
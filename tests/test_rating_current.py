@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from app.db.database import get_connection
+from app.db.repositories import PlayerRepository, ResultRepository, TournamentRepository
+from app.domain.rating import build_rating_snapshot
+from app.services.rating_current import list_current_rating, rebuild_current_ratings
+from app.services.tournament_lifecycle import transition_tournament_status
+
+
+pytestmark = pytest.mark.integration
+
+
+def _create_tournament(connection, *, tournament_date: str, points: dict[int, int]) -> int:
+    tournament_id = TournamentRepository(connection).create(
+        {
+            "name": f"Cup {tournament_date}",
+            "date": tournament_date,
+            "category_code": "U18",
+            "source_files": "[]",
+            "status": "confirmed",
+        }
+    )
+    ResultRepository(connection).create_many(
+        [
+            {"tournament_id": tournament_id, "player_id": player_id, "points_total": value}
+            for player_id, value in points.items()
+        ]
+    )
+    return tournament_id
+
+
+def _publish(connection, tournament_id: int) -> None:
+    result = transition_tournament_status(
+        connection=connection,
+        tournament_id=tournament_id,
+        to_status="published",
+    )
+    assert result["ok"], result
+
+
+def test_publish_and_archive_refresh_materialized_rating(tmp_path: Path) -> None:
+    connection = get_connection(tmp_path / "rating-current.db")
+    players = PlayerRepository(connection)
+    alpha = players.create({"last_name": "Alpha", "first_name": "A"})
+    beta = players.create({"last_name": "Beta", "first_name": "B"})
+
+    first_id = _create_tournament(connection, tournament_date="2026-01-01", points={alpha: 50, beta: 40})
+    assert list_current_rating(connection, scope_type="category", scope_key="U18", n=3) is None
+    _publish(connection, first_id)
+    second_id = _create_tournament(connection, tournament_date="2026-02-01", points={beta: 30})
+    _publish(connection, second_id)
+
+    expected = build_rating_snapshot(
+        ResultRepository(connection).list_results_for_rating(category_code="U18"), 3
+    )
+    assert list_current_rating(connection, scope_type="category", scope_key="U18", n=3) == expected
+    assert [row.player_id for row in expected] == [beta, alpha]
+
+    archived = transition_tournament_status(
+        connection=connection,
+        tournament_id=second_id,
+        to_status="archived",
+        context={"reason": "test", "restore": True, "audit": True},
+    )
+    assert archived["ok"], archived
+    current = list_current_rating(connection, scope_type="category", scope_key="U18", n=3)
+    assert current is not None
+    assert [(row.player_id, row.points) for row in current] == [(alpha, 50), (beta, 40)]
+    connection.close()
+
+
+def test_writes_outside_lifecycle_invalidate_until_rebuild(tmp_path: Path) -> None:
+    connection = get_connection(tmp_path / "rating-current-invalidate.db")
+    alpha = PlayerRepository(connection).create({"last_name": "Alpha", "first_name": "A"})
+    tournament_id = _create_tournament(connection, tournament_date="2026-01-01", points={alpha: 50})
+    _publish(connection, tournament_id)
+    assert list_current_rating(connection, scope_type="category", scope_key="U18", n=5) is not None
+
+    connection.execute("UPDATE results SET points_total = 70 WHERE tournament_id = ?", (tournament_id,))
+    connection.commit()
+    assert list_current_rating(connection, scope_type="category", scope_key="U18", n=5) is None
+
+    assert rebuild_current_ratings(connection) == 1
+    current = list_current_rating(connection, scope_type="category", scope_key="U18", n=5)
+    assert current is not None
+    assert [(row.player_id, row.points) for row in current] == [(alpha, 70)]
+    connection.close()
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from app.db.database import get_connection
+from app.db.repositories import PlayerRepository, ResultRepository, TournamentRepository
+from app.domain.rating import build_rating_impact, build_rating_snapshot
+from app.domain.rating_engine import IncrementalRatingTable
+from app.services.rating_engine import RatingEngine
+
+
+pytestmark = pytest.mark.integration
+
+
+def _entry(player_id: int, tournament_id: int, tournament_date: str, points: int) -> dict[str, object]:
+    return {
+        "player_id": player_id,
+        "tournament_id": tournament_id,
+        "tournament_date": tournament_date,
+        "points_total": points,
+        "last_name": f"Player{player_id}",
+        "first_name": "Test",
+        "middle_name": None,
+    }
+
+
+def test_apply_tournament_matches_full_rebuild_and_reports_rank_deltas() -> None:
+    results = [
+        _entry(1, 1, "2026-01-01", 50),
+        _entry(2, 1, "2026-01-01", 40),
+        _entry(3, 1, "2026-01-01", 30),
+        _entry(1, 2, "2026-02-01", 10),
+        _entry(4, 2, "2026-02-01", 35),
+    ]
+    table = IncrementalRatingTable.from_results(results, 2)
+    before = build_rating_snapshot(results, 2)
+    assert table.rows() == before
+
+    new_rows = [
+        {"player_id": 3, "points_total": 60, "last_name": "Player3", "first_name": "Test"},
+        {"player_id": 5, "points_total": 5, "last_name": "Player5", "first_name": "Test"},
+    ]
+    impact = table.apply_tournament(3, "2026-03-01", new_rows)
+
+    candidate = results + [
+        {**row, "tournament_id": 3, "tournament_date": "2026-03-01"} for row in new_rows
+    ]
+    after = build_rating_snapshot(candidate, 2)
+    assert table.rows() == after
+    assert impact == build_rating_impact(before, after)
+    assert [item.tournament_id for item in table.basis(3)] == [3, 1]
+
+    withdrawn = table.apply_tournament(3, "2026-03-01", [])
+    assert table.rows() == before
+    assert withdrawn == build_rating_impact(after, before)
+
+
+def test_engine_syncs_changes_committed_on_another_connection(tmp_path: Path) -> None:
+    db_path = tmp_path / "rating-engine.db"
+    writer = get_connection(db_path)
+    reader = get_connection(db_path)
+    players = PlayerRepository(writer)
+    tournaments = TournamentRepository(writer)
+    results = ResultRepository(writer)
+    alpha = players.create({"last_name": "Alpha", "first_name": "A"})
+    beta = players.create({"last_name": "Beta", "first_name": "B"})
+
+    def add_tournament(tournament_date: str, points: dict[int, int]) -> int:
+        tournament_id = tournaments.create(
+            {
+                "name": f"Cup {tournament_date}",
+                "date": tournament_date,
+                "category_code": "U18",
+                "source_files": "[]",
+                "status": "published",
+            }
+        )
+        results.create_many(
+            [
+                {"tournament_id": tournament_id, "player_id": player_id, "points_total": value}
+                for player_id, value in points.items()
+            ]
+        )
+        return tournament_id
+
+    add_tournament("2026-01-01", {alpha: 50, beta: 40})
+    engine = RatingEngine(reader)
+    table = engine.table(3, category_code="U18")
+    assert [row.player_id for row in table.rows()] == [alpha, beta]
+
+    second_id = add_tournament("2026-02-01", {beta: 30})
+    impacts = engine.sync()
+
+    assert engine.table(3, category_code="U18") is table
+    assert [(row.player_id, row.points) for row in table.rows()] == [(beta, 70), (alpha, 50)]
+    [scope_impact] = impacts.values()
+    assert {(row.player_id, row.old_place, row.new_place) for row in scope_impact} == {
+        (beta, 2, 1),
+        (alpha, 1, 2),
+    }
+
+    timeline = engine.timeline(category_code="U18")
+    assert [(row.player_id, row.points) for row in timeline.rows(3, as_of="2026-01-31")] == [
+        (alpha, 50),
+        (beta, 40),
+    ]
+
+    tournaments.set_status(second_id, "archived")
+    engine.sync()
+    assert [(row.player_id, row.points) for row in table.rows()] == [(alpha, 50), (beta, 40)]
+    assert engine.timeline(category_code="U18") is not timeline
+
+    writer.close()
+    reader.close()
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import pytest
+
+from app.domain.points import points_for_place
+from app.domain.rating import build_rating_impact, build_rating_snapshot
+from app.domain.rating_simulator import RatingScenario, RatingSimulator
+
+
+pytestmark = pytest.mark.unit
+
+
+def _entry(player_id: int, tournament_id: int, tournament_date: str, place: int) -> dict[str, object]:
+    return {
+        "player_id": player_id,
+        "tournament_id": tournament_id,
+        "tournament_date": tournament_date,
+        "place": place,
+        "points_total": 100 - 10 * place,
+        "last_name": f"Player{player_id}",
+        "first_name": "Test",
+        "middle_name": None,
+    }
+
+
+RESULTS = [
+    _entry(1, 1, "2026-01-01", 1),
+    _entry(2, 1, "2026-01-01", 2),
+    _entry(3, 1, "2026-01-01", 3),
+    _entry(2, 2, "2026-02-01", 1),
+    _entry(3, 2, "2026-02-01", 2),
+    _entry(1, 3, "2026-03-01", 4),
+    _entry(4, 3, "2026-03-01", 1),
+]
+
+
+def test_sweep_n_matches_full_rebuilds() -> None:
+    simulator = RatingSimulator(RESULTS, baseline_n=2)
+    baseline = build_rating_snapshot(RESULTS, 2)
+    assert simulator.baseline == baseline
+
+    outcomes = simulator.sweep_n([1, 2, 3])
+    for n, outcome in outcomes.items():
+        expected = build_rating_snapshot(RESULTS, n)
+        assert outcome.rows == expected
+        assert outcome.impact == build_rating_impact(baseline, expected)
+    assert outcomes[2].impact == []
+
+
+def test_what_if_scenarios_match_rebuilt_candidate_results() -> None:
+    simulator = RatingSimulator(RESULTS, baseline_n=2)
+    added = (_entry(5, 4, "2026-04-01", 1), _entry(3, 4, "2026-04-01", 2))
+    scenarios = [
+        RatingScenario(n=2, excluded_tournament_ids=frozenset({2}), label="без турнира 2"),
+        RatingScenario(n=2, added_results=added, label="с турниром 4"),
+        RatingScenario(n=3, points_for_place=points_for_place, label="таблица очков"),
+    ]
+    candidates = [
+        [entry for entry in RESULTS if entry["tournament_id"] != 2],
+        RESULTS + list(added),
+        [{**entry, "points_total": points_for_place(int(entry["place"]))} for entry in RESULTS],
+    ]
+
+    outcomes = simulator.evaluate_many(scenarios)
+
+    baseline = build_rating_snapshot(RESULTS, 2)
+    for outcome, scenario, candidate in zip(outcomes, scenarios, candidates):
+        expected = build_rating_snapshot(candidate, scenario.n)
+        assert outcome.scenario is scenario
+        assert outcome.rows == expected
+        assert outcome.impact == build_rating_impact(baseline, expected)
+    assert 5 in {row.player_id for row in outcomes[1].rows}
@@ -7,7 +7,14 @@ import pytest
 
 from app.db.database import get_connection
 from app.db.repositories import PlayerRepository, ResultRepository, TournamentRepository
+from app.domain.identity import fio_matches_search
+from app.domain.rating import (
+    build_rating_basis,
+    build_rating_snapshot,
+    build_rating_snapshot_from_totals,
+)
 from app.services.audit_log import RATING_SNAPSHOT_CREATED
+from app.services.rating_snapshot import build_scope_snapshots
 from app.services.import_xlsx import import_tournament_rows
 from app.services.tournament_correction import correct_tournament
 from app.services.tournament_lifecycle import transition_tournament_status
@@ -254,6 +261,133 @@ def test_category_rating_ignores_adult_tournaments(tmp_path: Path) -> None:
     assert {int(row["tournament_id"]) for row in rows} == {child_tournament_id}
 
 
+def test_sql_rating_totals_match_python_rolling_rating(tmp_path: Path) -> None:
+    connection = get_connection(tmp_path / "rating-sql-pushdown.db")
+    players = PlayerRepository(connection)
+    tournaments = TournamentRepository(connection)
+    results = ResultRepository(connection)
+    player_ids = [
+        _create_player(players, last_name=last_name, first_name="Test")
+        for last_name in ("Alpha", "Beta", "Gamma")
+    ]
+    # Two tournaments share a date so the tournament id breaks the tie.
+    for index, (tournament_date, points) in enumerate(
+        [
+            ("2026-01-10", (10, 20, 30)),
+            ("2026-02-10", (40, 5, 15)),
+            ("2026-02-10", (7, 50, 1)),
+            ("2026-03-10", (25, 25, 0)),
+        ]
+    ):
+        tournament_id = tournaments.create(
+            {
+                "name": f"Cup {index}",
+                "date": tournament_date,
+                "category_code": "U18",
+                "source_files": "[]",
+                "status": "published",
+            }
+        )
+        results.create_many(
+            [
+                {
+                    "tournament_id": tournament_id,
+                    "player_id": player_id,
+                    "place": place,
+                    "points_total": player_points,
+                    "calc_version": "tests",
+                }
+                for place, (player_id, player_points) in enumerate(zip(player_ids, points), start=1)
+            ]
+        )
+
+    raw_results = results.list_results_for_rating(category_code="U18")
+    for n_value in (1, 2, 3, 12):
+        assert build_rating_snapshot_from_totals(
+            results.list_rating_totals(n_value, category_code="U18")
+        ) == build_rating_snapshot(raw_results, n_value)
+
+
+def test_rating_search_matches_sql_and_python_rules(tmp_path: Path) -> None:
+    connection = get_connection(tmp_path / "rating-search.db")
+    players = PlayerRepository(connection)
+    tournaments = TournamentRepository(connection)
+    results = ResultRepository(connection)
+    names = [("Петров", "Иван"), ("ПЕТРОВА", "Мария"), ("Ёлкина", "Анна"), ("Smith_", "John")]
+    player_ids = [
+        _create_player(players, last_name=last_name, first_name=first_name) for last_name, first_name in names
+    ]
+    tournament_id = tournaments.create(
+        {"name": "Cup", "date": "2026-01-10", "category_code": "U18", "source_files": "[]", "status": "published"}
+    )
+    results.create_many(
+        [
+            {
+                "tournament_id": tournament_id,
+                "player_id": player_id,
+                "place": place,
+                "points_total": 10,
+                "calc_version": "tests",
+            }
+            for place, player_id in enumerate(player_ids, start=1)
+        ]
+    )
+    snapshot = build_rating_snapshot(results.list_results_for_rating(category_code="U18"), 3)
+
+    for term in ("петров", "елкина анна", "ВАН", "smith_", "h%"):
+        totals = results.list_rating_totals(3, category_code="U18", search_term=term)
+        found = {int(row["player_id"]) for row in totals}
+        assert found == {row.player_id for row in snapshot if fio_matches_search(row.fio, term)}
+    assert len(results.list_rating_totals(3, category_code="U18", search_term="петров")) == 2
+
+
+def test_scope_snapshots_are_built_from_one_scan(tmp_path: Path) -> None:
+    connection = get_connection(tmp_path / "rating-scope-single-scan.db")
+    _create_tournament_with_results(
+        connection=connection,
+        category_code=None,
+        is_adult_mode=True,
+        status="published",
+        tournament_date="2026-04-01",
+        rows=[("Adult", "Man", 90, "M"), ("Adult", "Woman", 80, "F"), ("Adult", "Unknown", 70)],
+    )
+    _create_tournament_with_results(
+        connection=connection,
+        category_code="U18",
+        status="published",
+        tournament_date="2026-04-02",
+        rows=[("Child", "Leader", 60, "M")],
+    )
+    connection.execute("UPDATE tournaments SET league_code = 'PREMIER'")
+    connection.commit()
+    scope_requests = [
+        ("category", "U18", {"category_code": "U18"}),
+        ("league", "PREMIER", {"league_code": "PREMIER"}),
+        ("adult", "overall", {"is_adult_mode": True}),
+        ("adult", "men", {"is_adult_mode": True, "adult_gender_scope": "men"}),
+        ("adult", "women", {"is_adult_mode": True, "adult_gender_scope": "women"}),
+    ]
+    result_repo = ResultRepository(connection)
+    statements: list[str] = []
+    connection.set_trace_callback(statements.append)
+
+    scope_snapshots = build_scope_snapshots(
+        result_repo.list_results_for_rating_scopes([filters for _, _, filters in scope_requests]),
+        scope_requests,
+        3,
+    )
+
+    connection.set_trace_callback(None)
+    assert len([statement for statement in statements if "FROM results" in statement]) == 1
+    for (_scope_type, _scope_key, filters), (snapshot_rows, basis) in zip(scope_requests, scope_snapshots):
+        expected_results = result_repo.list_results_for_rating(**filters)
+        assert snapshot_rows == build_rating_snapshot(expected_results, 3)
+        assert basis == build_rating_basis(expected_results, 3)
+    assert [row.fio for row in scope_snapshots[0][0]] == ["Child Leader"]
+    assert [row.fio for row in scope_snapshots[3][0]] == ["Adult Man"]
+    assert len(scope_snapshots[1][0]) == 4
+
+
 def test_publish_creates_adult_snapshot_for_adult_mode_tournament(tmp_path: Path) -> None:
     connection = get_connection(tmp_path / "rating-snapshot-adult.db")
     tournament_id = _create_tournament_with_results(
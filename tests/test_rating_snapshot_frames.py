@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from app.db.database import get_connection
+from app.db.repositories import PlayerRepository, RatingSnapshotRepository, TournamentRepository
+from app.db.schema import RATING_SNAPSHOTS_TABLE_SQL, _SNAPSHOT_COLUMNS, migrate_schema
+from app.db.snapshot_frames import SNAPSHOT_KEYFRAME_INTERVAL, pack_ranking, unpack_ranking
+
+
+pytestmark = pytest.mark.integration
+
+
+def _setup(connection, players_count: int = 20) -> tuple[list[int], list[int]]:
+    players = PlayerRepository(connection)
+    tournaments = TournamentRepository(connection)
+    player_ids = [
+        players.create({"last_name": f"Player{index:02d}", "first_name": "Test"})
+        for index in range(players_count)
+    ]
+    tournament_ids = [
+        tournaments.create({"name": f"Cup {index}", "date": f"2026-01-{index + 1:02d}", "source_files": "[]"})
+        for index in range(SNAPSHOT_KEYFRAME_INTERVAL + 3)
+    ]
+    return player_ids, tournament_ids
+
+
+def _session_entries(player_ids: list[int], session: int) -> list[dict[str, object]]:
+    """Every session raises one more player's points and reorders the table."""
+    points = {player_id: 100 - index for index, player_id in enumerate(player_ids)}
+    for step in range(session):
+        changed = player_ids[(2 * step) % len(player_ids)]
+        points[changed] += 7 + step
+    ordered = sorted(player_ids, key=lambda player_id: (-points[player_id], player_id))
+    return [
+        {
+            "player_id": player_id,
+            "position": position,
+            "points": points[player_id],
+            "tournaments_count": 3,
+            "rolling_basis": [(player_id, "2026-01-01", points[player_id])],
+        }
+        for position, player_id in enumerate(ordered, start=1)
+    ]
+
+
+def _header(tournament_id: int, session: int) -> dict[str, object]:
+    return {
+        "scope_type": "category",
+        "scope_key": "U18",
+        "source_tournament_id": tournament_id,
+        "reason": "publish",
+        "operation_group_id": None,
+        "created_at": f"2026-02-01T00:00:{session:02d}",
+    }
+
+
+def _read(repo: RatingSnapshotRepository, session: int) -> list[tuple[object, ...]]:
+    session_id = repo.find_session_id(
+        scope_type="category",
+        scope_key="U18",
+        created_at=str(_header(0, session)["created_at"]),
+    )
+    if session_id is None:
+        return []
+    return [
+        (row["player_id"], row["position"], row["points"], row["rolling_basis"], row["created_at"])
+        for row in repo.list_rows(session_id, include_basis=True)
+    ]
+
+
+def _expected(player_ids: list[int], session: int) -> list[tuple[object, ...]]:
+    created_at = _header(0, session)["created_at"]
+    return [
+        (entry["player_id"], entry["position"], entry["points"], entry["rolling_basis"], created_at)
+        for entry in _session_entries(player_ids, session)
+    ]
+
+
+def test_delta_sessions_reconstruct_full_tables(tmp_path: Path) -> None:
+    connection = get_connection(tmp_path / "frames.db")
+    player_ids, tournament_ids = _setup(connection)
+    repo = RatingSnapshotRepository(connection)
+    sessions = len(tournament_ids)
+    for session, tournament_id in enumerate(tournament_ids):
+        assert repo.create_session(_header(tournament_id, session), _session_entries(player_ids, session))
+
+    for session in range(sessions):
+        assert _read(repo, session) == _expected(player_ids, session)
+    kinds = [
+        row[0]
+        for row in connection.execute(
+            "SELECT frame_kind FROM rating_snapshot_sessions ORDER BY created_at"
+        ).fetchall()
+    ]
+    assert kinds[0] == kinds[SNAPSHOT_KEYFRAME_INTERVAL] == "keyframe"
+    assert kinds.count("keyframe") == 2
+    stored = connection.execute("SELECT COUNT(*) FROM rating_snapshots").fetchone()[0]
+    assert stored < sessions * len(player_ids) / 2
+    assert [row["entries_count"] for row in repo.list_sessions(scope_type="category", scope_key="U18")] == [
+        20
+    ] * sessions
+
+    latest = repo.list_latest_rows_for_player(player_ids[0])
+    assert [(row["position"], row["points"], row["created_at"]) for row in latest] == [
+        next(
+            (entry[1], entry[2], entry[4])
+            for entry in _expected(player_ids, sessions - 1)
+            if entry[0] == player_ids[0]
+        )
+    ]
+    connection.close()
+
+
+def test_deleting_keyframe_tournament_keeps_dependent_sessions_readable(tmp_path: Path) -> None:
+    connection = get_connection(tmp_path / "frames-delete.db")
+    player_ids, tournament_ids = _setup(connection)
+    repo = RatingSnapshotRepository(connection)
+    session_ids = [
+        repo.create_session(_header(tournament_id, session), _session_entries(player_ids, session))
+        for session, tournament_id in enumerate(tournament_ids[:4])
+    ]
+
+    TournamentRepository(connection).delete(tournament_ids[0])
+
+    assert _read(repo, 0) == []
+    for session in range(1, 4):
+        assert _read(repo, session) == _expected(player_ids, session)
+    # Dependents are re-encoded under their original ids.
+    stored = connection.execute(
+        "SELECT id, frame_kind, keyframe_session_id FROM rating_snapshot_sessions ORDER BY id"
+    ).fetchall()
+    assert [tuple(row) for row in stored] == [
+        (session_ids[1], "keyframe", None),
+        (session_ids[2], "delta", session_ids[1]),
+        (session_ids[3], "delta", session_ids[1]),
+    ]
+    connection.close()
+
+
+def test_migrations_compact_full_copy_history_into_sessions(tmp_path: Path) -> None:
+    connection = get_connection(tmp_path / "frames-migrate.db")
+    player_ids, tournament_ids = _setup(connection)
+    legacy_rows = []
+    for session, tournament_id in enumerate(tournament_ids):
+        header = _header(tournament_id, session)
+        for entry in _session_entries(player_ids, session):
+            basis_json = json.dumps(
+                [
+                    {"tournament_id": tournament_id, "tournament_date": tournament_date, "points_total": points}
+                    for tournament_id, tournament_date, points in entry["rolling_basis"]
+                ]
+            )
+            legacy_rows.append({**header, **entry, "rolling_basis_json": basis_json})
+    connection.execute("DROP TABLE player_rating_latest")
+    connection.execute("DROP TABLE rating_snapshot_basis")
+    connection.execute("DROP TABLE rating_snapshots")
+    connection.execute("DROP TABLE rating_snapshot_sessions")
+    connection.execute(RATING_SNAPSHOTS_TABLE_SQL)
+    connection.executemany(
+        f"INSERT INTO rating_snapshots ({', '.join(_SNAPSHOT_COLUMNS[1:])}) "
+        f"VALUES ({', '.join('?' for _ in _SNAPSHOT_COLUMNS[1:])})",
+        [tuple(row[column] for column in _SNAPSHOT_COLUMNS[1:]) for row in legacy_rows],
+    )
+    connection.execute("PRAGMA user_version = 4")
+    connection.commit()
+
+    assert migrate_schema(connection)[:3] == [5, 6, 7]
+    tables = {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    assert "rating_snapshot_frames" not in tables
+    assert "rating_snapshots_legacy" not in tables
+    repo = RatingSnapshotRepository(connection)
+    for session in range(len(tournament_ids)):
+        assert _read(repo, session) == _expected(player_ids, session)
+    stored = connection.execute("SELECT COUNT(*) FROM rating_snapshots").fetchone()[0]
+    assert stored < len(legacy_rows) / 2
+    [latest] = repo.list_latest_rows_for_player(player_ids[0])
+    assert latest["created_at"] == _header(0, len(tournament_ids) - 1)["created_at"]
+    connection.close()
+
+
+def test_ranking_round_trip() -> None:
+    assert unpack_ranking(pack_ranking([3, 1, 70000])) == [3, 1, 70000]
+    assert unpack_ranking(None) == []
+
+
+def test_session_rows_are_read_by_index_range(tmp_path: Path) -> None:
+    connection = get_connection(tmp_path / "frames-plan.db")
+    plan = " ".join(
+        str(row[3])
+        for row in connection.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM rating_snapshots WHERE session_id IN (?, ?)",
+            (1, 2),
+        ).fetchall()
+    )
+    assert "idx_rating_snapshots_session_position" in plan
+    connection.close()
+
+
+def test_sessions_counting_a_tournament_are_found_by_basis_index(tmp_path: Path) -> None:
+    connection = get_connection(tmp_path / "frames-basis.db")
+    player_ids, tournament_ids = _setup(connection)
+    repo = RatingSnapshotRepository(connection)
+    session_ids = [
+        repo.create_session(_header(tournament_id, session), _session_entries(player_ids, session))
+        for session, tournament_id in enumerate(tournament_ids[:3])
+    ]
+    # Every row's basis names the player id as its tournament id.
+    assert repo.list_session_ids_counting_tournament(player_ids[5]) == session_ids
+    assert repo.list_session_ids_counting_tournament(10_000) == []
+    plan = " ".join(
+        str(row[3])
+        for row in connection.execute(
+            "EXPLAIN QUERY PLAN SELECT snapshot_row_id FROM rating_snapshot_basis WHERE tournament_id = ?",
+            (1,),
+        ).fetchall()
+    )
+    assert "idx_rating_snapshot_basis_tournament" in plan
+    connection.close()
+
+
+def test_player_latest_table_and_series_follow_snapshot_writes(tmp_path: Path) -> None:
+    connection = get_connection(tmp_path / "frames-latest.db")
+    player_ids, tournament_ids = _setup(connection)
+    repo = RatingSnapshotRepository(connection)
+    for session, tournament_id in enumerate(tournament_ids[:4]):
+        repo.create_session(_header(tournament_id, session), _session_entries(player_ids, session))
+
+    def expected_position(session: int, player_id: int) -> tuple[int, object]:
+        return next((entry[1], entry[2]) for entry in _expected(player_ids, session) if entry[0] == player_id)
+
+    target = player_ids[2]
+    [latest] = repo.list_latest_rows_for_player(target)
+    assert (latest["position"], latest["points"]) == expected_position(3, target)
+    assert latest["created_at"] == _header(0, 3)["created_at"]
+
+    series = repo.list_player_series(player_id=target, scope_type="category", scope_key="U18")
+    assert [(point["position"], point["points"]) for point in series] == [
+        expected_position(session, target) for session in range(4)
+    ]
+
+    TournamentRepository(connection).delete(tournament_ids[3])
+    [latest] = repo.list_latest_rows_for_player(target)
+    assert (latest["position"], latest["points"]) == expected_position(2, target)
+    assert len(repo.list_player_series(player_id=target, scope_type="category", scope_key="U18")) == 3
+    connection.close()
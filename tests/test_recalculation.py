@@ -5,7 +5,7 @@ from pathlib import Path
 
 from app.db.database import get_connection
 from app.db.repositories import PlayerRepository, ResultRepository, TournamentRepository
-from app.services.recalculate_tournament import recalculate_tournament_results
+from app.services.recalculate_tournament import recalculate_all_tournaments, recalculate_tournament_results
 
 
 pytestmark = pytest.mark.integration
@@ -179,6 +179,70 @@ class RecalculationTests(unittest.TestCase):
         self.assertEqual(updated["calc_version"], "manual_adult_v1")
         self.assertEqual(report.results_updated, 1)
 
+    def test_set_based_recalculation_matches_per_result_and_skips_unchanged_rows(self) -> None:
+        tournament_ids = []
+        for index, is_adult_mode in enumerate((0, 0, 1)):
+            tournament_ids.append(
+                self.tournaments.create(
+                    {
+                        "name": f"Cup {index}",
+                        "date": f"2026-05-0{index + 1}",
+                        "category_code": None if is_adult_mode else "U15",
+                        "league_code": None,
+                        "is_adult_mode": is_adult_mode,
+                        "source_files": "[]",
+                    }
+                )
+            )
+        for index in range(12):
+            player_id = self.players.create({"last_name": f"Player{index:02d}", "first_name": "Set"})
+            for tournament_id in tournament_ids:
+                self.results.create(
+                    {
+                        "tournament_id": tournament_id,
+                        "player_id": player_id,
+                        "place": None if index == 11 else index * 7 + 1,
+                        "rank_set": "X" if index == 3 else None,
+                        "points_classification": 5 if index == 4 else 0,
+                        "points_place": 0,
+                        "points_total": 10 + index,
+                        "calc_version": "v1",
+                    }
+                )
+        # Already up to date: skipped by the set-based pass.
+        recalculate_tournament_results(connection=self.connection, tournament_id=tournament_ids[1])
+
+        def stored(connection) -> list[tuple[object, ...]]:
+            return [
+                tuple(row)
+                for row in connection.execute(
+                    """
+                    SELECT tournament_id, player_id, points_classification, points_place,
+                           points_total, calc_version, rank_set
+                    FROM results
+                    ORDER BY id
+                    """
+                ).fetchall()
+            ]
+
+        per_result = get_connection(Path(self.temp_dir.name) / "per-result.db")
+        self.connection.backup(per_result)
+        for tournament_id in tournament_ids:
+            recalculate_tournament_results(connection=per_result, tournament_id=tournament_id)
+        expected = stored(per_result)
+        per_result.close()
+
+        report = recalculate_all_tournaments(connection=self.connection, set_based=True)
+
+        self.assertEqual(stored(self.connection), expected)
+        self.assertEqual(
+            report.results_by_tournament,
+            {tournament_ids[0]: 12, tournament_ids[1]: 0, tournament_ids[2]: 12},
+        )
+        self.assertEqual((report.tournaments_processed, report.results_updated), (3, 24))
+        again = recalculate_all_tournaments(connection=self.connection, set_based=True)
+        self.assertEqual(again.results_updated, 0)
+
 
 if __name__ == "__main__":
     unittest.main()
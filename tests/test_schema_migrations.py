@@ -0,0 +1,137 @@
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from app.db import schema
+from app.db.database import get_connection
+from app.db.schema import (
+    LATEST_SCHEMA_USER_VERSION,
+    get_schema_user_version,
+    initialize_schema,
+    migrate_schema,
+)
+
+
+pytestmark = pytest.mark.integration
+
+
+class SchemaMigrationTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.temp_dir.name) / "test.db"
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_new_database_is_stamped_with_latest_version(self) -> None:
+        connection = get_connection(self.db_path)
+        try:
+            self.assertEqual(get_schema_user_version(connection), LATEST_SCHEMA_USER_VERSION)
+            self.assertEqual(migrate_schema(connection), [])
+        finally:
+            connection.close()
+
+    def test_up_to_date_database_is_not_rewritten_on_open(self) -> None:
+        connection = get_connection(self.db_path)
+        connection.execute("INSERT INTO tournaments (name, date) VALUES ('Cup', '2024-01-01')")
+        connection.commit()
+        connection.close()
+
+        connection = get_connection(self.db_path)
+        try:
+            self.assertEqual(connection.total_changes, 0)
+        finally:
+            connection.close()
+
+    def test_legacy_database_is_migrated_in_place(self) -> None:
+        connection = sqlite3.connect(str(self.db_path))
+        connection.execute(
+            "CREATE TABLE tournaments (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL, "
+            "date TEXT, category_code TEXT, league_code TEXT, source_files TEXT, "
+            "created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP, "
+            "updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP)"
+        )
+        connection.execute("INSERT INTO tournaments (name, date) VALUES ('Old cup', '2020-05-01')")
+        connection.commit()
+
+        initialize_schema(connection)
+
+        self.assertEqual(get_schema_user_version(connection), LATEST_SCHEMA_USER_VERSION)
+        row = connection.execute(
+            "SELECT status, type, warning_state FROM tournaments WHERE name = 'Old cup'"
+        ).fetchone()
+        self.assertEqual(tuple(row), ("draft", "standard", "none"))
+        connection.close()
+
+    def test_player_identity_keys_are_backfilled_on_migration(self) -> None:
+        connection = sqlite3.connect(str(self.db_path))
+        connection.execute(
+            "CREATE TABLE players (id INTEGER PRIMARY KEY AUTOINCREMENT, last_name TEXT NOT NULL, "
+            "first_name TEXT NOT NULL, middle_name TEXT, birth_date TEXT, gender TEXT, coach TEXT, "
+            "club TEXT, notes TEXT, created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP, "
+            "updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP)"
+        )
+        connection.execute(
+            "INSERT INTO players (last_name, first_name, birth_date) VALUES ('Пётров', 'Иван', '2010-05-01')"
+        )
+        connection.commit()
+
+        initialize_schema(connection)
+
+        row = connection.execute("SELECT fio_key, birth_year FROM players").fetchone()
+        self.assertEqual(tuple(row), ("петров иван", "2010"))
+        plan = " ".join(
+            str(item[-1])
+            for item in connection.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM players WHERE fio_key = ? AND birth_year = ?",
+                ("петров иван", "2010"),
+            )
+        )
+        self.assertIn("idx_players_identity", plan)
+        connection.close()
+
+    def test_plain_connection_can_write_players_after_migration(self) -> None:
+        get_connection(self.db_path).close()
+
+        connection = sqlite3.connect(str(self.db_path))
+        try:
+            connection.execute(
+                "INSERT INTO players (last_name, first_name, middle_name) VALUES ('СИДОРОВ', 'Пётр', 'Ильич')"
+            )
+            connection.execute("UPDATE players SET birth_date = '2011' WHERE last_name = 'СИДОРОВ'")
+            connection.commit()
+            triggers = connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'trg_players_identity%'"
+            ).fetchall()
+        finally:
+            connection.close()
+        self.assertEqual(triggers, [])
+
+    def test_failed_migration_step_rolls_back_its_ddl(self) -> None:
+        connection = sqlite3.connect(str(self.db_path))
+
+        def failing_step(conn: sqlite3.Connection) -> None:
+            conn.execute("CREATE TABLE half_migrated (id INTEGER PRIMARY KEY)")
+            conn.execute("ALTER TABLE half_migrated ADD COLUMN name TEXT")
+            raise RuntimeError("step failed")
+
+        try:
+            with mock.patch.object(schema, "MIGRATIONS", [(1, failing_step)]):
+                with self.assertRaises(RuntimeError):
+                    migrate_schema(connection)
+            tables = connection.execute(
+                "SELECT name FROM sqlite_master WHERE name = 'half_migrated'"
+            ).fetchall()
+            self.assertEqual(tables, [])
+            self.assertEqual(get_schema_user_version(connection), 0)
+            self.assertFalse(connection.in_transaction)
+        finally:
+            connection.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -250,6 +250,7 @@ def test_detect_format_preserves_existing() -> None:
 
 import sqlite3
 
+from app.db.repositories import PlayerRepository
 from app.db.schema import initialize_schema
 from app.services.import_modes import (
     import_multi_tournament,
@@ -306,12 +307,9 @@ def test_import_players_only_detects_existing() -> None:
     """import_players_only detects an existing player and only creates new ones."""
     conn = _make_db()
     # Pre-create a player
-    conn.execute(
-        "INSERT INTO players (last_name, first_name, middle_name, birth_date) "
-        "VALUES (?, ?, ?, ?)",
-        ("иванов", "иван", None, "2010"),
+    PlayerRepository(conn).create(
+        {"last_name": "иванов", "first_name": "иван", "middle_name": None, "birth_date": "2010"}
     )
-    conn.commit()
 
     block = _make_block([
         {"fio": "Иванов Иван", "birth": "2010", "coach": "Тренер А"},
@@ -329,12 +327,9 @@ def test_import_update_players_fills_empty_coach() -> None:
     """import_update_players fills empty coach field for an existing player."""
     conn = _make_db()
     # Pre-create a player with no coach
-    conn.execute(
-        "INSERT INTO players (last_name, first_name, middle_name, birth_date, coach) "
-        "VALUES (?, ?, ?, ?, ?)",
-        ("иванов", "иван", None, "2010", None),
+    PlayerRepository(conn).create(
+        {"last_name": "иванов", "first_name": "иван", "middle_name": None, "birth_date": "2010", "coach": None}
     )
-    conn.commit()
 
     block = _make_block([
         {"fio": "Иванов Иван", "birth": "2010", "coach": "Тренеров Т.Т."},
@@ -353,12 +348,15 @@ def test_import_update_players_does_not_overwrite_existing_coach() -> None:
     """import_update_players does not overwrite an existing coach value."""
     conn = _make_db()
     # Pre-create a player with existing coach
-    conn.execute(
-        "INSERT INTO players (last_name, first_name, middle_name, birth_date, coach) "
-        "VALUES (?, ?, ?, ?, ?)",
-        ("иванов", "иван", None, "2010", "Существующий тренер"),
+    PlayerRepository(conn).create(
+        {
+            "last_name": "иванов",
+            "first_name": "иван",
+            "middle_name": None,
+            "birth_date": "2010",
+            "coach": "Существующий тренер",
+        }
     )
-    conn.commit()
 
     block = _make_block([
         {"fio": "Иванов Иван", "birth": "2010", "coach": "Новый тренер"},
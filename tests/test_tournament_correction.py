@@ -138,3 +138,123 @@ def test_correction_logs_old_new_and_recalculates_results(tmp_path: Path) -> Non
     assert old_payload["name"] == "Spring Cup"
     assert new_payload["name"] == "Spring Cup Updated"
     assert correction_operation_event.context.get("history_marker") == "correction"
+
+
+def test_correction_refreshes_only_dependent_scopes_and_reports_movers(tmp_path: Path) -> None:
+    from app.services.rating_current import list_current_rating
+
+    connection = get_connection(tmp_path / "correction_scopes.db")
+    players = PlayerRepository(connection)
+    tournaments = TournamentRepository(connection)
+    results = ResultRepository(connection)
+    anna = players.create({"last_name": "Anna", "first_name": "A"})
+    boris = players.create({"last_name": "Boris", "first_name": "B"})
+
+    def create_published(name: str, date: str, rows: list[tuple[int, int]]) -> int:
+        tournament_id = tournaments.create({"name": name, "date": date, "category_code": "U12"})
+        for place, (player_id, points) in enumerate(rows, start=1):
+            results.create(
+                {
+                    "tournament_id": tournament_id,
+                    "player_id": player_id,
+                    "place": place,
+                    "points_place": points,
+                    "points_total": points,
+                }
+            )
+        _publish_tournament(connection, tournament_id)
+        return tournament_id
+
+    create_published("Winter", "2026-01-10", [(anna, 14), (boris, 12)])
+    spring_id = create_published("Spring", "2026-03-10", [(boris, 14), (anna, 2)])
+    [spring_session] = connection.execute(
+        "SELECT id FROM rating_snapshot_sessions WHERE source_tournament_id = ?",
+        (spring_id,),
+    ).fetchone()
+    before = list_current_rating(connection, scope_type="category", scope_key="U12", n=3)
+    assert [(row.fio, row.points) for row in before or []] == [("Boris B", 26), ("Anna A", 16)]
+
+    result = correct_tournament(
+        connection=connection,
+        tournament_id=spring_id,
+        reason="Неверная категория",
+        updates={"category_code": "U14"},
+        actor="tests",
+    )
+
+    assert result["affected_scopes"] == [("category", "U12")]
+    assert spring_session in result["affected_snapshot_sessions"]
+    assert [
+        (mover["fio"], mover["old_place"], mover["new_place"]) for mover in result["moved_players"]
+    ] == [("Anna A", 2, 1), ("Boris B", 1, 2)]
+    after = list_current_rating(connection, scope_type="category", scope_key="U12", n=3)
+    assert [(row.fio, row.points) for row in after or []] == [("Anna A", 14), ("Boris B", 12)]
+    connection.close()
+
+
+def test_correction_regenerates_snapshot_sessions_that_counted_the_tournament(tmp_path: Path) -> None:
+    from app.services.rating_snapshot import list_player_rating_series, list_rating_snapshot_rows
+
+    connection = get_connection(tmp_path / "correction_sessions.db")
+    players = PlayerRepository(connection)
+    tournaments = TournamentRepository(connection)
+    results = ResultRepository(connection)
+    anna = players.create({"last_name": "Anna", "first_name": "A"})
+    boris = players.create({"last_name": "Boris", "first_name": "B"})
+
+    def create_published(name: str, date: str, rows: list[tuple[int, int]]) -> int:
+        tournament_id = tournaments.create({"name": name, "date": date, "category_code": "U12"})
+        for place, (player_id, points) in enumerate(rows, start=1):
+            results.create(
+                {
+                    "tournament_id": tournament_id,
+                    "player_id": player_id,
+                    "place": place,
+                    "points_place": points,
+                    "points_total": points,
+                }
+            )
+        _publish_tournament(connection, tournament_id)
+        return tournament_id
+
+    winter_id = create_published("Winter", "2026-01-10", [(anna, 14), (boris, 12)])
+    spring_id = create_published("Spring", "2026-03-10", [(boris, 14), (anna, 2)])
+    summer_id = create_published("Summer", "2026-06-10", [(anna, 5)])
+
+    def session_id(tournament_id: int) -> int | None:
+        row = connection.execute(
+            "SELECT id FROM rating_snapshot_sessions WHERE source_tournament_id = ?",
+            (tournament_id,),
+        ).fetchone()
+        return int(row["id"]) if row else None
+
+    winter_session, spring_session, summer_session = (
+        session_id(winter_id),
+        session_id(spring_id),
+        session_id(summer_id),
+    )
+    assert [
+        (row.fio, row.points) for row in list_rating_snapshot_rows(connection, session_id=summer_session)
+    ] == [("Boris B", 26), ("Anna A", 21)]
+
+    result = correct_tournament(
+        connection=connection,
+        tournament_id=spring_id,
+        reason="Неверная категория",
+        updates={"category_code": "U14"},
+        actor="tests",
+    )
+
+    assert sorted(result["regenerated_snapshot_sessions"]) == [spring_session, summer_session]
+    assert session_id(spring_id) is None
+    summer_rows = list_rating_snapshot_rows(connection, session_id=summer_session)
+    assert [(row.fio, row.points) for row in summer_rows] == [("Anna A", 19), ("Boris B", 12)]
+    assert {item.tournament_id for row in summer_rows for item in row.rolling_basis} == {winter_id, summer_id}
+    assert [
+        (row.fio, row.points) for row in list_rating_snapshot_rows(connection, session_id=winter_session)
+    ] == [("Anna A", 14), ("Boris B", 12)]
+    assert [
+        (point.session_id, point.position, point.points)
+        for point in list_player_rating_series(connection, player_id=boris, scope_type="category", scope_key="U12")
+    ] == [(winter_session, 2, 12), (summer_session, 2, 12)]
+    connection.close()
@@ -80,7 +80,14 @@ def test_views_restore_saved_workspace_state(monkeypatch, tmp_path) -> None:
     update_view_state("players", {"search": "Saved player"})
     update_view_state(
         "rating",
-        {"scope_type": "adult", "scope_key": "women", "search": "Saved rating", "n_value": 9},
+        {
+            "scope_type": "adult",
+            "scope_key": "women",
+            "search": "Saved rating",
+            "n_value": 9,
+            "as_of_enabled": True,
+            "as_of_date": "2026-03-15",
+        },
     )
     update_view_state(
         "context",
@@ -128,6 +135,8 @@ def test_views_restore_saved_workspace_state(monkeypatch, tmp_path) -> None:
     assert rating_view._category_combo.currentData() == "women"
     assert rating_view._search_input.text() == "Saved rating"
     assert rating_view._n_spin.value() == 9
+    assert rating_view._selected_as_of() == "2026-03-15"
+    assert rating_view._as_of_edit.isEnabled() is True
 
     players_view = window.findChild(players_view_module.PlayersView)
     assert players_view is not None
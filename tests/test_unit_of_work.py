@@ -0,0 +1,70 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import pytest
+
+from app.db.database import get_connection
+from app.db.repositories import PlayerRepository
+from app.db.unit_of_work import in_unit_of_work, repo_session
+
+
+pytestmark = pytest.mark.integration
+
+
+def _player(last_name: str) -> dict[str, object]:
+    return {"last_name": last_name, "first_name": "Ivan"}
+
+
+class UnitOfWorkTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.temp_dir.name) / "test.db"
+        self.connection = get_connection(self.db_path)
+        self.players = PlayerRepository(self.connection)
+
+    def tearDown(self) -> None:
+        self.connection.close()
+        self.temp_dir.cleanup()
+
+    def _count_from_other_connection(self) -> int:
+        other = get_connection(self.db_path)
+        try:
+            return int(other.execute("SELECT COUNT(*) FROM players").fetchone()[0])
+        finally:
+            other.close()
+
+    def test_repository_commits_are_deferred_to_session_exit(self) -> None:
+        with repo_session(self.connection):
+            self.players.create(_player("Ivanov"))
+            self.players.create(_player("Petrov"))
+            self.assertTrue(in_unit_of_work(self.connection))
+            self.assertEqual(self._count_from_other_connection(), 0)
+
+        self.assertFalse(in_unit_of_work(self.connection))
+        self.assertEqual(self._count_from_other_connection(), 2)
+
+    def test_error_rolls_back_whole_session(self) -> None:
+        with self.assertRaises(RuntimeError):
+            with repo_session(self.connection):
+                self.players.create(_player("Ivanov"))
+                raise RuntimeError("boom")
+
+        self.assertEqual(self.players.list(), [])
+        self.assertFalse(self.connection.in_transaction)
+
+    def test_nested_session_is_a_savepoint(self) -> None:
+        with repo_session(self.connection):
+            self.players.create(_player("Ivanov"))
+            with self.assertRaises(RuntimeError):
+                with repo_session(self.connection):
+                    self.players.create(_player("Petrov"))
+                    raise RuntimeError("inner failure")
+            self.players.create(_player("Sidorov"))
+
+        names = [player["last_name"] for player in self.players.list()]
+        self.assertEqual(names, ["Ivanov", "Sidorov"])
+
+
+if __name__ == "__main__":
+    unittest.main()